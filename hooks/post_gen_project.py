@@ -29,6 +29,8 @@ def main():
         api_dir = project_dir / 'src' / project_slug / 'api'
         if api_dir.exists():
             shutil.rmtree(api_dir)
+        for test_file in (project_dir / 'tests').glob('test_api*.py'):
+            remove_file(str(test_file))
         
         # Remove API imports from __init__.py
         init_file = project_dir / 'src' / project_slug / '__init__.py'
@@ -0,0 +1,158 @@
+"""Benchmark API endpoint latency and JSON serialization cost.
+
+Three endpoints return the same rows from SQLite:
+
+* ``/baseline``: stock FastAPI; the result is validated against the
+  ``response_model`` and rendered by the stdlib-based ``JSONResponse``.
+* ``/validated``: the app from ``create_app()``; validated as above but
+  rendered by ``FastJSONResponse`` (orjson).
+* ``/trusted``: ``trusted_response()``; no validation, rendered by orjson.
+
+Requests go through FastAPI's in-process ``TestClient`` (requires
+``httpx``), so the numbers exclude network time. Response caching and
+compression are disabled.
+
+Usage:
+    python benchmarks/bench_api.py [--rows N] [--requests N]
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from fastapi import Depends, FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy import Column, DateTime, Float, Integer, MetaData, String, Table, select
+from sqlalchemy.orm import Session
+
+from {{ cookiecutter.project_slug }}.api import create_app, trusted_response
+from {{ cookiecutter.project_slug }}.api.serialization import construct_models, dumps
+from {{ cookiecutter.project_slug }}.config import get_settings
+from {{ cookiecutter.project_slug }}.db import bulk_insert, dispose_engine, get_engine, get_read_db
+
+metadata = MetaData()
+items = Table(
+    "items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String),
+    Column("value", Float),
+    Column("created", DateTime),
+)
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    value: float
+    created: datetime
+
+
+def validate(rows: List[Dict[str, Any]]) -> Any:
+    """Validate rows the way FastAPI does for a ``List[Item]`` response model."""
+    try:
+        from pydantic import TypeAdapter
+    except ImportError:  # pydantic v1
+        from pydantic import parse_obj_as
+
+        return parse_obj_as(List[Item], rows)
+    return TypeAdapter(List[Item]).validate_python(rows)
+
+
+def fetch(db: Session, limit: int) -> List[Dict[str, Any]]:
+    return [dict(row._mapping) for row in db.execute(select(items).limit(limit))]
+
+
+def build_apps(limit: int) -> Dict[str, TestClient]:
+    baseline = FastAPI()
+
+    @baseline.get("/baseline", response_model=List[Item])
+    def baseline_items(db: Session = Depends(get_read_db)):
+        return fetch(db, limit)
+
+    app = create_app()
+
+    @app.get("/validated", response_model=List[Item])
+    def validated_items(db: Session = Depends(get_read_db)):
+        return fetch(db, limit)
+
+    @app.get("/trusted", response_model=List[Item])
+    def trusted_items(db: Session = Depends(get_read_db)):
+        return trusted_response(db.execute(select(items).limit(limit)))
+
+    return {
+        "/baseline": TestClient(baseline),
+        "/validated": TestClient(app),
+        "/trusted": TestClient(app),
+    }
+
+
+def latencies(client: TestClient, path: str, requests: int) -> List[float]:
+    for _ in range(20):  # warm up
+        client.get(path)
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get(path)
+        timings.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return timings
+
+
+def per_call(func: Callable[[], Any], number: int = 50) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500, help="rows per response")
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = get_settings()
+        settings.DATABASE_URI = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        settings.API_CACHE_ENABLED = False
+        settings.API_COMPRESSION_ENABLED = False
+        dispose_engine()
+        metadata.create_all(get_engine())
+        start = datetime(2024, 1, 1)
+        with get_engine().begin() as connection:
+            bulk_insert(connection, items, (
+                {"id": i, "name": f"item-{i}", "value": i * 0.25, "created": start + timedelta(minutes=i)}
+                for i in range(args.rows)
+            ))
+
+        print(f"Endpoint latency ({args.rows} rows/response, {args.requests} requests)")
+        for path, client in build_apps(args.rows).items():
+            timings = sorted(latencies(client, path, args.requests))
+            p50 = statistics.median(timings) * 1e3
+            p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1e3
+            print(f"  {path:<12} p50 {p50:7.2f} ms   p99 {p99:7.2f} ms")
+
+        with get_engine().connect() as connection:
+            rows = [dict(row._mapping) for row in connection.execute(select(items))]
+        models = validate(rows)
+        print(f"Serialization cost per response ({args.rows} rows)")
+        cases = {
+            "validate (pydantic)": lambda: validate(rows),
+            "construct_models() (no validation)": lambda: construct_models(Item, rows),
+            "jsonable_encoder + json.dumps": lambda: json.dumps(jsonable_encoder(models)).encode(),
+            "dumps() of models": lambda: dumps(models),
+            "dumps() of trusted dicts": lambda: dumps(rows),
+        }
+        for name, func in cases.items():
+            print(f"  {name:<36} {per_call(func) * 1e3:8.3f} ms")
+        dispose_engine()
+
+
+if __name__ == "__main__":
+    main()
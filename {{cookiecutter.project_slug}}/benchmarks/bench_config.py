@@ -0,0 +1,41 @@
+"""Benchmark configuration lookup latency.
+
+Compares walking nested dicts by hand on top of flat ``Config.get()`` (the
+previous access pattern) with dotted-key lookups on ``Config`` and on a
+``FrozenConfig`` snapshot.
+
+Usage:
+    python benchmarks/bench_config.py [--number N]
+"""
+
+import argparse
+import timeit
+
+from {{ cookiecutter.project_slug }}.core import Config
+
+DATA = {
+    "model": {"name": "baseline", "params": {"learning_rate": 1.0e-3, "hidden_size": 128}},
+    "data": {"batch_size": 32, "test_size": 0.2},
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    config = Config(DATA)
+    frozen = config.freeze()
+    cases = {
+        "manual nested walk": lambda: config.get("model")["params"]["learning_rate"],
+        "Config.get(dotted)": lambda: config.get("model.params.learning_rate"),
+        "FrozenConfig.get(dotted)": lambda: frozen.get("model.params.learning_rate"),
+        "FrozenConfig[dotted]": lambda: frozen["model.params.learning_rate"],
+    }
+    for name, func in cases.items():
+        seconds = min(timeit.repeat(func, number=args.number, repeat=5))
+        print(f"{name:<28} {seconds / args.number * 1e9:8.1f} ns/lookup")
+
+
+if __name__ == "__main__":
+    main()
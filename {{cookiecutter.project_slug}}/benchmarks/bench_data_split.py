@@ -0,0 +1,71 @@
+"""Benchmark the hash split against shuffling and slicing row ids.
+
+Splits ``--rows`` row ids (100M by default) into train and test index
+arrays with both methods and reports wall time and peak traced memory. The
+streaming scalar path is timed on a sample and extrapolated, since it is
+meant for rows that are never all in memory at once.
+
+Usage:
+    python benchmarks/bench_data_split.py [--rows N] [--test-size F]
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import numpy as np
+
+from {{ cookiecutter.project_slug }}.data import HashSplit
+
+
+def measure(func: Callable[[], object]) -> Tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / 2 ** 20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000_000)
+    parser.add_argument("--test-size", type=float, default=0.2)
+    args = parser.parse_args()
+
+    ids = np.arange(args.rows, dtype=np.int64)
+    splitter = HashSplit(args.test_size, seed=42)
+
+    def shuffle_and_slice() -> object:
+        order = np.random.default_rng(42).permutation(args.rows)
+        cut = int(args.rows * args.test_size)
+        return order[cut:], order[:cut]
+
+    def hash_split() -> object:
+        test = splitter.mask(ids)
+        return np.flatnonzero(~test), np.flatnonzero(test)
+
+    def hash_mask_only() -> object:
+        return splitter.mask(ids)
+
+    cases = {
+        "shuffle + slice": shuffle_and_slice,
+        "hash mask + index arrays": hash_split,
+        "hash mask only": hash_mask_only,
+    }
+    print(f"{args.rows:,} row ids, test_size={args.test_size}")
+    for name, func in cases.items():
+        seconds, peak = measure(func)
+        print(f"{name:<28} {seconds:8.2f} s  peak {peak:9.1f} MiB")
+
+    sample = min(args.rows, 1_000_000)
+    start = time.perf_counter()
+    sum(1 for key in range(sample) if splitter.is_test(key))
+    seconds = (time.perf_counter() - start) * args.rows / sample
+    print(f"{'streaming is_test()':<28} {seconds:8.2f} s  peak      O(1)     (extrapolated from {sample:,} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark reading processed data from a column store against pickle and CSV.
+
+Each case opens the dataset and reads a single column, the common access
+pattern of a training or evaluation worker. The store only touches that
+column's pages; pickle and CSV parse the whole dataset first.
+
+Usage:
+    python benchmarks/bench_data_store.py [--rows N] [--columns N]
+"""
+
+import argparse
+import csv
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from {{ cookiecutter.project_slug }}.data import ColumnStore, write_store
+
+
+def timed(func: Callable[[], float]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--columns", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    columns = {f"c{i}": rng.random(args.rows) for i in range(args.columns)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_store(root / "store", columns)
+        with open(root / "data.pkl", "wb") as handle:
+            pickle.dump(columns, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        csv_rows = min(args.rows, 200_000)
+        with open(root / "data.csv", "w", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(columns)
+            writer.writerows(zip(*(values[:csv_rows] for values in columns.values())))
+
+        def from_store() -> float:
+            return float(ColumnStore(root / "store")["c0"].sum())
+
+        def from_pickle() -> float:
+            with open(root / "data.pkl", "rb") as handle:
+                return float(pickle.load(handle)["c0"].sum())
+
+        def from_csv() -> float:
+            with open(root / "data.csv", newline="") as handle:
+                return sum(float(row["c0"]) for row in csv.DictReader(handle))
+
+        for name, func in [("column store", from_store), ("pickle", from_pickle)]:
+            seconds = min(timed(func) for _ in range(5))
+            print(f"{name:<14} {seconds * 1e3:10.2f} ms")
+        seconds = timed(from_csv) * args.rows / csv_rows
+        print(f"{'csv':<14} {seconds * 1e3:10.2f} ms (extrapolated from {csv_rows} rows)")
+
+
+if __name__ == "__main__":
+    main()
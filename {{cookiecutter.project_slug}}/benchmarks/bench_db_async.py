@@ -0,0 +1,110 @@
+"""Benchmark requests/sec of sync and async sessions against SQLite.
+
+Each simulated request opens a session from the dependency (``get_db`` or
+``get_async_db``), runs one indexed lookup and closes it. Sync requests are
+served by a thread pool, async requests by tasks on one event loop, both with
+the same concurrency and connection pool size.
+
+Usage:
+    python benchmarks/bench_db_async.py [--requests N] [--concurrency N] [--rows N]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sqlalchemy import text
+
+from {{ cookiecutter.project_slug }}.config import get_settings
+from {{ cookiecutter.project_slug }}.db import (
+    dispose_async_engine,
+    dispose_engine,
+    get_async_db,
+    get_db,
+    get_engine,
+)
+
+QUERY = text("SELECT name FROM items WHERE id = :id")
+
+
+def create_table(rows: int) -> None:
+    with get_engine().begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        connection.execute(
+            text("INSERT INTO items (id, name) VALUES (:id, :name)"),
+            [{"id": i, "name": f"item-{i}"} for i in range(rows)],
+        )
+
+
+def sync_request(item_id: int) -> None:
+    generator = get_db()
+    db = next(generator)
+    try:
+        db.execute(QUERY, {"id": item_id}).scalar_one()
+    finally:
+        generator.close()
+
+
+async def async_request(item_id: int) -> None:
+    generator = get_async_db()
+    db = await generator.__anext__()
+    try:
+        (await db.execute(QUERY, {"id": item_id})).scalar_one()
+    finally:
+        await generator.aclose()
+
+
+def run_sync(requests: int, concurrency: int, rows: int) -> float:
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        list(pool.map(sync_request, (i % rows for i in range(requests))))
+        return time.perf_counter() - start
+
+
+async def run_async(requests: int, concurrency: int, rows: int) -> float:
+    limit = asyncio.Semaphore(concurrency)
+
+    async def bounded(item_id: int) -> None:
+        async with limit:
+            await async_request(item_id)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(bounded(i % rows) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    await dispose_async_engine()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = get_settings()
+        settings.DATABASE_URI = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        settings.ASYNC_DATABASE_URI = None
+        settings.DB_POOL_SIZE = args.concurrency
+        settings.DB_MAX_OVERFLOW = 0
+        dispose_engine()
+        create_table(args.rows)
+
+        cases = {
+            "sync  get_db() + threads": lambda: run_sync(args.requests, args.concurrency, args.rows),
+            "async get_async_db() + tasks": lambda: asyncio.run(
+                run_async(args.requests, args.concurrency, args.rows)
+            ),
+        }
+        for name, func in cases.items():
+            seconds = min(func() for _ in range(3))
+            print(f"{name:<30} {args.requests / seconds:10.0f} req/s")
+        dispose_engine()
+
+
+if __name__ == "__main__":
+    main()
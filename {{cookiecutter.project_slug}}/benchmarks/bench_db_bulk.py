@@ -0,0 +1,88 @@
+"""Benchmark bulk insert throughput against per-object ``session.add()``.
+
+Usage:
+    python benchmarks/bench_db_bulk.py [--rows N] [--batch-size N]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import Column, Float, Integer, String, create_engine, delete
+from sqlalchemy.orm import Session, declarative_base
+
+from {{ cookiecutter.project_slug }}.db import bulk_insert, bulk_upsert
+
+Base = declarative_base()
+
+
+class Measurement(Base):
+    __tablename__ = "measurements"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    value = Column(Float)
+
+
+def make_rows(count: int):
+    return ({"id": i, "name": f"m-{i}", "value": i * 0.5} for i in range(count))
+
+
+def orm_add(engine, rows: int, batch_size: int) -> None:
+    with Session(engine) as session:
+        for row in make_rows(rows):
+            session.add(Measurement(**row))
+        session.commit()
+
+
+def orm_add_all(engine, rows: int, batch_size: int) -> None:
+    with Session(engine) as session:
+        session.add_all([Measurement(**row) for row in make_rows(rows)])
+        session.commit()
+
+
+def bulk(engine, rows: int, batch_size: int) -> None:
+    with Session(engine) as session:
+        bulk_insert(session, Measurement, make_rows(rows), batch_size=batch_size)
+        session.commit()
+
+
+def upsert(engine, rows: int, batch_size: int) -> None:
+    with Session(engine) as session:
+        bulk_upsert(session, Measurement, make_rows(rows), batch_size=batch_size)
+        session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    cases = {
+        "session.add() per object": orm_add,
+        "session.add_all()": orm_add_all,
+        "bulk_insert()": bulk,
+        "bulk_upsert()": upsert,
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        baseline = None
+        for name, func in cases.items():
+            timings = []
+            for _ in range(3):
+                with engine.begin() as connection:
+                    connection.execute(delete(Measurement.__table__))
+                start = time.perf_counter()
+                func(engine, args.rows, args.batch_size)
+                timings.append(time.perf_counter() - start)
+            seconds = min(timings)
+            baseline = baseline or seconds
+            print(f"{name:<28} {args.rows / seconds:12.0f} rows/s  {baseline / seconds:6.1f}x")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark the per-call cost of logging to a file.
+
+Compares a synchronous ``FileHandler`` on the root logger (what
+``logging.basicConfig`` gives you) with the queue pipeline installed by
+``configure_logging()``, where formatting and I/O run on a background thread.
+
+Usage:
+    python benchmarks/bench_logging.py [--calls N]
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from {{ cookiecutter.project_slug }}.core import Config, configure_logging, stop_logging
+
+FORMAT = "[%(asctime)s][%(name)s][%(levelname)s] %(message)s"
+
+
+def time_calls(calls: int) -> float:
+    logger = logging.getLogger("bench")
+    start = time.perf_counter()
+    for index in range(calls):
+        logger.info("processed batch %d of %d", index, calls)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    root = logging.getLogger()
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = logging.FileHandler(Path(tmp) / "sync.log")
+        handler.setFormatter(logging.Formatter(FORMAT))
+        root.addHandler(handler)
+        root.setLevel(logging.INFO)
+        sync = time_calls(args.calls)
+        root.removeHandler(handler)
+        handler.close()
+
+        config = Config({"logging": {"level": "INFO", "format": FORMAT, "file": str(Path(tmp) / "queue.log")}})
+        configure_logging(config, console=False)
+        queued = time_calls(args.calls)
+        start = time.perf_counter()
+        stop_logging()
+        drain = time.perf_counter() - start
+
+    print(f"{'synchronous FileHandler':<26} {sync / args.calls * 1e6:8.2f} us/call")
+    print(f"{'configure_logging() queue':<26} {queued / args.calls * 1e6:8.2f} us/call")
+    print(f"{'(background drain)':<26} {drain:8.2f} s total")
+
+
+if __name__ == "__main__":
+    main()
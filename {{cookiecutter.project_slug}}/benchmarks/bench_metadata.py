@@ -0,0 +1,94 @@
+"""Benchmark metadata loading and joins against re-scanning the CSVs.
+
+Writes synthetic ``people.csv``, ``projects.csv`` and ``deliverables.csv``
+to a temporary directory and times a cold parse, a load from the on-disk
+cache, an in-process cache hit, and the "deliverables of a project with
+their owners" join, both through the registry indexes and by scanning the
+CSVs with ``csv.DictReader`` the way ad-hoc scripts do.
+
+Usage:
+    python benchmarks/bench_metadata.py [--people N] [--projects N] [--deliverables N]
+"""
+
+import argparse
+import csv
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from {{ cookiecutter.project_slug }}.metadata import load_metadata
+from {{ cookiecutter.project_slug }}.metadata import registry as registry_module
+
+
+def timed(func: Callable[[], object], repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def write_csvs(directory: Path, people: int, projects: int, deliverables: int) -> None:
+    rng = random.Random(0)
+    with open(directory / "people.csv", "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["id", "name", "email", "affiliation", "orcid", "role", "github", "notes"])
+        for i in range(1, people + 1):
+            writer.writerow([i, f"Person {i}", f"p{i}@example.org", "Lab", "", "Member", "", ""])
+    with open(directory / "projects.csv", "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["id", "title", "description", "start_date", "end_date", "status", "lead_id", "github_url", "notes"])
+        for i in range(1, projects + 1):
+            writer.writerow([i, f"Project {i}", "", "2024-01-01", "", "Active", rng.randint(1, people), "", ""])
+    with open(directory / "deliverables.csv", "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["id", "project_id", "title", "description", "due_date", "status", "priority", "owner_id", "notes"])
+        for i in range(1, deliverables + 1):
+            writer.writerow([i, rng.randint(1, projects), f"Deliverable {i}", "", "2024-06-01", "Planned", "Medium", rng.randint(1, people), ""])
+
+
+def scan_join(directory: Path, project_id: int) -> List[Tuple[dict, dict]]:
+    with open(directory / "people.csv", newline="") as handle:
+        people = {row["id"]: row for row in csv.DictReader(handle)}
+    with open(directory / "deliverables.csv", newline="") as handle:
+        return [(row, people.get(row["owner_id"])) for row in csv.DictReader(handle) if row["project_id"] == str(project_id)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--people", type=int, default=2_000)
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--deliverables", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        write_csvs(directory, args.people, args.projects, args.deliverables)
+
+        def cold() -> object:
+            registry_module._loaded.clear()
+            return load_metadata(directory, use_cache=False)
+
+        def from_disk() -> object:
+            registry_module._loaded.clear()
+            return load_metadata(directory)
+
+        cold_seconds = timed(cold)
+        load_metadata(directory)  # writes the on-disk cache
+        disk_seconds = timed(from_disk)
+        hit_seconds = timed(lambda: load_metadata(directory), repeat=100)
+        registry = load_metadata(directory)
+        join_seconds = timed(lambda: registry.deliverables_with_owners(1), repeat=10_000)
+        scan_seconds = timed(lambda: scan_join(directory, 1))
+
+    print(f"{args.people:,} people, {args.projects:,} projects, {args.deliverables:,} deliverables")
+    print(f"{'cold parse + validate':<28} {cold_seconds * 1e3:10.1f} ms")
+    print(f"{'load from disk cache':<28} {disk_seconds * 1e3:10.1f} ms")
+    print(f"{'in-process cache hit':<28} {hit_seconds * 1e3:10.3f} ms")
+    print(f"{'indexed join':<28} {join_seconds * 1e3:10.4f} ms")
+    print(f"{'csv scan join':<28} {scan_seconds * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
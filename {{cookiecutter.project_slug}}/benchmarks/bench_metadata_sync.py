@@ -0,0 +1,85 @@
+"""Benchmark the incremental metadata sync against truncating and reloading.
+
+Loads synthetic metadata into a SQLite database, edits ``--changed``
+deliverables, and times a full reload (delete every row, bulk insert
+everything) against ``sync_metadata``, which only writes the changed rows.
+
+Usage:
+    python benchmarks/bench_metadata_sync.py [--deliverables N] [--changed N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import Session
+
+from {{ cookiecutter.project_slug }}.db import bulk_insert
+from {{ cookiecutter.project_slug }}.metadata import RECORD_TYPES, load_metadata
+from {{ cookiecutter.project_slug }}.metadata.sync import SYNC_METADATA, TABLES, row_hash, sync_metadata
+
+sys.path.insert(0, str(Path(__file__).parent))
+from bench_metadata import write_csvs  # noqa: E402
+
+
+def full_reload(engine, registry) -> None:
+    with Session(engine) as db, db.begin():
+        for record_type in reversed(RECORD_TYPES):
+            db.execute(delete(TABLES[record_type.table]))
+        for record_type in RECORD_TYPES:
+            rows = (
+                dict({name: getattr(record, name) for name in record.fields}, row_hash=row_hash(record))
+                for record in registry.records(record_type.table)
+            )
+            bulk_insert(db, TABLES[record_type.table], rows)
+
+
+def incremental(engine, registry) -> dict:
+    with Session(engine) as db, db.begin():
+        return sync_metadata(db, registry)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--people", type=int, default=2_000)
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--deliverables", type=int, default=200_000)
+    parser.add_argument("--changed", type=int, default=1_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        write_csvs(directory, args.people, args.projects, args.deliverables)
+        # Two databases holding the same, previously synced metadata
+        engines = [create_engine(f"sqlite:///{directory / name}") for name in ("reload.db", "sync.db")]
+        original = load_metadata(directory, use_cache=False)
+        for engine in engines:
+            SYNC_METADATA.create_all(engine)
+            incremental(engine, original)
+
+        path = directory / "deliverables.csv"
+        lines = path.read_text().splitlines(keepends=True)
+        for number in range(1, min(args.changed, len(lines) - 1) + 1):
+            lines[number] = lines[number].replace("Planned", "Done", 1)
+        path.write_text("".join(lines))
+        registry = load_metadata(directory, use_cache=False)
+
+        start = time.perf_counter()
+        full_reload(engines[0], registry)
+        reload_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        changes = incremental(engines[1], registry)
+        sync_seconds = time.perf_counter() - start
+        for engine in engines:
+            engine.dispose()
+
+    print(f"{args.deliverables:,} deliverables, {changes['deliverables']['updated']:,} changed")
+    print(f"{'truncate + reload':<24} {reload_seconds * 1e3:10.1f} ms")
+    print(f"{'incremental sync':<24} {sync_seconds * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
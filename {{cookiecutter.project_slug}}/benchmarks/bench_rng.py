@@ -0,0 +1,53 @@
+"""Benchmark batched sampling against per-call ``np.random``.
+
+Usage:
+    python benchmarks/bench_rng.py [--draws N] [--block-size N]
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from {{ cookiecutter.project_slug }}.utils import SeedManager
+
+
+def per_call(draws: int) -> None:
+    np.random.seed(0)
+    for _ in range(draws):
+        np.random.random()
+
+
+def batched_scalars(draws: int, block_size: int) -> None:
+    sampler = SeedManager(0).sampler(block_size)
+    for _ in range(draws):
+        sampler.uniform()
+
+
+def batched_views(draws: int, block_size: int, chunk: int = 1024) -> None:
+    sampler = SeedManager(0).sampler(block_size)
+    for _ in range(draws // chunk):
+        sampler.uniform(chunk)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--draws", type=int, default=1_000_000)
+    parser.add_argument("--block-size", type=int, default=65536)
+    args = parser.parse_args()
+
+    cases = {
+        "np.random.random() per call": lambda: per_call(args.draws),
+        "BatchedSampler.uniform()": lambda: batched_scalars(args.draws, args.block_size),
+        "BatchedSampler.uniform(1024)": lambda: batched_views(args.draws, args.block_size),
+    }
+    baseline = None
+    for name, func in cases.items():
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        per_draw = seconds / args.draws * 1e9
+        baseline = baseline or seconds
+        print(f"{name:<32} {per_draw:8.1f} ns/draw  {baseline / seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
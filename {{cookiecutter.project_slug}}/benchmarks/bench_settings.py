@@ -0,0 +1,40 @@
+"""Benchmark the per-call cost of reading application settings.
+
+Compares constructing ``Settings()`` (validating the environment and ``.env``
+on every call) with the cached ``get_settings()`` accessor, a bare dictionary
+lookup and a module attribute read.
+
+Usage:
+    python benchmarks/bench_settings.py [--number N]
+"""
+
+import argparse
+import importlib
+import timeit
+
+from {{ cookiecutter.project_slug }}.config import Settings, get_settings
+
+# The package re-exports a ``config`` object that shadows the subpackage name
+config = importlib.import_module("{{ cookiecutter.project_slug }}.config")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    get_settings()
+    cache = {"settings": config.settings}
+    cases = {
+        "Settings()": (Settings, max(1, args.number // 1000)),
+        "get_settings()": (get_settings, args.number),
+        "dict lookup": (lambda: cache["settings"], args.number),
+        "config.settings attribute": (lambda: config.settings, args.number),
+    }
+    for name, (func, number) in cases.items():
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{name:<28} {seconds / number * 1e9:10.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,56 @@
 """{{ cookiecutter.project_name }} - {{ cookiecutter.project_short_description }}
 
 This is the main package for {{ cookiecutter.project_name }}.
+
+Public objects are resolved lazily (PEP 562), so ``import {{ cookiecutter.project_slug }}``
+stays cheap and submodules such as ``utils`` are only imported on first access.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
 __version__ = "{{ cookiecutter.version }}"
 
-# Import core functionality
-from .core import (
-    get_project_root,
-    get_version,
-    Config,
-    config,
-)
-
-# Import utilities
-from .utils import (
-    SeedManager,
-    seed_manager,
-    set_global_seed,
-    get_global_seed,
-    get_seed_manager,
-)
+# Map of public attribute name -> submodule that defines it
+_LAZY_ATTRS: Dict[str, str] = {
+    # Core functionality
+    'get_project_root': '.core',
+    'get_version': '.core',
+    'Config': '.core',
+    'FrozenConfig': '.core',
+    'config': '.core',
+    'ParallelExecutor': '.core',
+    'parallel_map': '.core',
+    'DiskCache': '.core',
+    'memoize': '.core',
+
+    # Randomness and reproducibility
+    'SeedManager': '.utils',
+    'seed_manager': '.utils',
+    'set_global_seed': '.utils',
+    'get_global_seed': '.utils',
+    'get_seed_manager': '.utils',
+}
+
+if TYPE_CHECKING:
+    from .core import (
+        Config,
+        DiskCache,
+        FrozenConfig,
+        ParallelExecutor,
+        config,
+        get_project_root,
+        get_version,
+        memoize,
+        parallel_map,
+    )
+    from .utils import (
+        SeedManager,
+        get_global_seed,
+        get_seed_manager,
+        seed_manager,
+        set_global_seed,
+    )
 
 # Import API if included
 {% if cookiecutter.include_api == 'y' %}
@@ -33,7 +63,12 @@ __all__ = [
     'get_project_root',
     'get_version',
     'Config',
+    'FrozenConfig',
     'config',
+    'ParallelExecutor',
+    'parallel_map',
+    'DiskCache',
+    'memoize',
     
     # Randomness and reproducibility
     'SeedManager',
@@ -42,3 +77,17 @@ __all__ = [
     'get_global_seed',
     'get_seed_manager',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public attributes from their submodule on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
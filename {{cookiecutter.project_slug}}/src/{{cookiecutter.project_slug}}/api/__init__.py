@@ -1,17 +1,53 @@
-"""Public API for {{ cookiecutter.project_name }}
+"""Web API for {{ cookiecutter.project_name }}
 
-This module provides the public interface for the {{ cookiecutter.project_name }} package.
-Import public functions and classes here to make them available directly from the package.
+``create_app()`` builds the FastAPI application and ``app`` is the default
+instance served by ``uvicorn {{ cookiecutter.project_slug }}.api:app``. They
+and the response classes are resolved lazily (PEP 562), so importing this
+package does not import FastAPI; the caching and compression middleware are
+plain ASGI and always available. Streaming query responses live in
+:mod:`.streaming`, JSON encoding in :mod:`.serialization`.
 """
 
-# Example usage:
-# from {{ cookiecutter.project_slug }}.api import public_function, PublicClass
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict
 
-# Import and expose public API members here
-# from .core import public_function, PublicClass
+from .cache import CacheBackend, CachedResponse, InMemoryCache, ResponseCache
+from .middleware import CompressionMiddleware, ResponseCacheMiddleware
 
+# Map of attribute name -> submodule that defines it; these need FastAPI
+_LAZY_ATTRS: Dict[str, str] = {
+    'create_app': '.factory',
+    'FastJSONResponse': '.responses',
+    'trusted_response': '.responses',
+}
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+    from .factory import create_app
+    from .responses import FastJSONResponse, trusted_response
+
+    app: FastAPI
+
+# The lazy names are left out so that ``from .api import *`` does not
+# import FastAPI.
 __all__ = [
-    # List public API members here
-    # 'public_function',
-    # 'PublicClass',
+    'CacheBackend',
+    'CachedResponse',
+    'CompressionMiddleware',
+    'InMemoryCache',
+    'ResponseCache',
+    'ResponseCacheMiddleware',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import FastAPI-dependent attributes, and build the default app, on first access."""
+    if name == "app":
+        value = __getattr__("create_app")()
+    elif name in _LAZY_ATTRS:
+        value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
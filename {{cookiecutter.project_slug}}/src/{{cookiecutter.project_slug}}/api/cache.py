@@ -0,0 +1,228 @@
+"""Response cache storage for the API.
+
+``ResponseCache`` stores rendered responses under a key built from the route
+and its normalised query string, tags each with a strong ETag and counts
+hits, misses and revalidations. Entries live in a pluggable ``CacheBackend``;
+``InMemoryCache`` is a per-process TTL/LRU store. A shared cache (Redis,
+memcached, ...) only needs to implement ``get``, ``set``, ``clear`` and
+``__len__``; entries are plain picklable objects.
+"""
+
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+class CachedResponse:
+    """A complete response body with its status, headers and ETag."""
+
+    __slots__ = ("status", "headers", "body", "etag")
+
+    def __init__(self, status: int, headers: Headers, body: bytes, etag: str):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.etag = etag
+
+    def __reduce__(self) -> Any:
+        return (CachedResponse, (self.status, self.headers, self.body, self.etag))
+
+
+class CacheBackend(ABC):
+    """Interface of response cache stores."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the live entry for ``key``, or None."""
+
+    @abstractmethod
+    def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of entries currently stored."""
+
+
+class InMemoryCache(CacheBackend):
+    """Thread-safe, per-process TTL cache with least-recently-used eviction.
+
+    Attributes:
+        max_entries: Maximum number of entries kept before evicting.
+        evictions: Number of entries evicted to make room.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept before evicting.
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, CachedResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def make_etag(body: bytes) -> str:
+    """Return a strong ETag for a response body."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an ``If-None-Match`` header value against an ETag.
+
+    Uses the weak comparison required for ``If-None-Match``.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == bare:
+            return True
+    return False
+
+
+class ResponseCache:
+    """Route-level response cache with hit metrics.
+
+    Attributes:
+        backend: Store holding the cached responses.
+        ttl: Seconds a response stays fresh.
+        max_body_bytes: Larger responses are passed through uncached.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: float = 30.0,
+        max_body_bytes: int = 1024 * 1024,
+    ):
+        """Initialize the cache.
+
+        Args:
+            backend: Store for the entries. Defaults to an ``InMemoryCache``.
+            ttl: Seconds a response stays fresh.
+            max_body_bytes: Largest response body that is cached.
+        """
+        self.backend = backend if backend is not None else InMemoryCache()
+        self.ttl = ttl
+        self.max_body_bytes = max_body_bytes
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.stores = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(path: str, query_string: bytes = b"") -> str:
+        """Build the cache key of a request.
+
+        Query parameters are sorted, so ``?a=1&b=2`` and ``?b=2&a=1`` share
+        an entry.
+        """
+        if not query_string:
+            return path
+        pairs = sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True))
+        return f"{path}?{urlencode(pairs)}"
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """Return the fresh entry for ``key``, counting a hit or a miss."""
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def store(
+        self,
+        key: str,
+        status: int,
+        headers: Headers,
+        body: bytes,
+        etag: Optional[str] = None,
+    ) -> CachedResponse:
+        """Cache a complete response and return the stored entry.
+
+        Args:
+            key: Cache key from :meth:`key`.
+            status: HTTP status code.
+            headers: Raw response headers, without ``etag``.
+            body: Complete response body.
+            etag: ETag set by the endpoint, if any. Defaults to a hash of
+                the body.
+        """
+        value = CachedResponse(status, headers, body, etag or make_etag(body))
+        self.backend.set(key, value, self.ttl)
+        self.stores += 1
+        return value
+
+    def invalidate(self) -> None:
+        """Drop every cached response, e.g. after a write."""
+        self.backend.clear()
+        self.invalidations += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """Report cache effectiveness.
+
+        Returns:
+            Dict with ``hits``, ``misses``, ``hit_ratio``, ``not_modified``
+            (304 responses), ``stores``, ``invalidations`` and ``entries``,
+            plus ``evictions`` for backends that count them.
+        """
+        lookups = self.hits + self.misses
+        metrics: Dict[str, Any] = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "not_modified": self.not_modified,
+            "stores": self.stores,
+            "invalidations": self.invalidations,
+            "entries": len(self.backend),
+        }
+        if hasattr(self.backend, "evictions"):
+            metrics["evictions"] = self.backend.evictions
+        return metrics
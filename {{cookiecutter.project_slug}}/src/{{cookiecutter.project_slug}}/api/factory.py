@@ -0,0 +1,99 @@
+"""FastAPI application factory."""
+
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, FastAPI, Request, Response
+from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..config import Settings, get_settings
+from ..db import get_db, get_pool_metrics
+from .cache import CacheBackend, InMemoryCache, ResponseCache
+from .middleware import CompressionMiddleware, ResponseCacheMiddleware
+from .responses import FastJSONResponse
+
+router = APIRouter()
+
+
+@router.get("/health")
+def health(response: Response, db: Session = Depends(get_db)) -> Dict[str, Any]:
+    """Report whether the API and its database are reachable."""
+    response.headers["Cache-Control"] = "no-store"
+    db.execute(text("SELECT 1"))
+    return {"status": "ok"}
+
+
+@router.get("/metrics")
+def metrics(request: Request, response: Response) -> Dict[str, Any]:
+    """Report response cache and connection pool metrics."""
+    response.headers["Cache-Control"] = "no-store"
+    cache: Optional[ResponseCache] = request.app.state.response_cache
+    return {
+        "cache": cache.metrics() if cache is not None else None,
+        "db_pool": get_pool_metrics(),
+    }
+
+
+def create_app(
+    settings: Optional[Settings] = None,
+    cache_backend: Optional[CacheBackend] = None,
+) -> FastAPI:
+    """Create the FastAPI application.
+
+    Routes are mounted under ``API_V1_STR``, and the interactive docs under
+    ``API_PREFIX``. Successful GET responses under ``API_V1_STR`` are cached
+    for ``API_CACHE_TTL`` seconds unless ``API_CACHE_ENABLED`` is false;
+    endpoints opt out with ``Cache-Control: no-store``, and requests with an
+    ``Authorization`` or ``Cookie`` header are never cached. Responses render with
+    ``FastJSONResponse`` (orjson) by default. Responses of at least
+    ``API_COMPRESSION_MIN_SIZE`` bytes are compressed with zstd or gzip.
+
+    Args:
+        settings: Application settings. Defaults to ``get_settings()``.
+        cache_backend: Store for cached responses. Defaults to an
+            ``InMemoryCache`` of ``API_CACHE_MAX_ENTRIES`` entries.
+
+    Returns:
+        The configured application. The response cache, if enabled, is
+        available as ``app.state.response_cache``.
+    """
+    settings = settings or get_settings()
+    app = FastAPI(
+        title=settings.PROJECT_NAME,
+        version=settings.VERSION,
+        debug=settings.DEBUG,
+        openapi_url=f"{settings.API_PREFIX}/openapi.json",
+        docs_url=f"{settings.API_PREFIX}/docs",
+        redoc_url=f"{settings.API_PREFIX}/redoc",
+        default_response_class=FastJSONResponse,
+    )
+
+    app.state.response_cache = None
+    if settings.API_CACHE_ENABLED:
+        cache = ResponseCache(
+            backend=cache_backend or InMemoryCache(settings.API_CACHE_MAX_ENTRIES),
+            ttl=settings.API_CACHE_TTL,
+            max_body_bytes=settings.API_CACHE_MAX_BODY_BYTES,
+        )
+        app.state.response_cache = cache
+        app.add_middleware(ResponseCacheMiddleware, cache=cache, paths=[settings.API_V1_STR])
+
+    # Outside the cache, so cached bodies stay uncompressed and are
+    # compressed per client
+    if settings.API_COMPRESSION_ENABLED:
+        app.add_middleware(CompressionMiddleware, minimum_size=settings.API_COMPRESSION_MIN_SIZE)
+
+    # Added last so it is outermost and also covers cached responses
+    if settings.BACKEND_CORS_ORIGINS:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=[str(origin).rstrip("/") for origin in settings.BACKEND_CORS_ORIGINS],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+            expose_headers=["ETag", "X-Cache"],
+        )
+
+    app.include_router(router, prefix=settings.API_V1_STR)
+    return app
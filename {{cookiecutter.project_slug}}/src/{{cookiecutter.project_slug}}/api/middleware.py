@@ -0,0 +1,343 @@
+"""ASGI middleware for response caching and compression.
+
+``ResponseCacheMiddleware`` serves GET responses from a
+:class:`~.cache.ResponseCache`. Successful ``GET`` responses are buffered (up to ``max_body_bytes``), stored
+under their route and query string and served from the cache until their
+TTL runs out, so hot read endpoints skip the handler and the database
+entirely. Every cacheable response carries an ``ETag``; a request whose
+``If-None-Match`` matches gets an empty ``304 Not Modified``. ``X-Cache``
+reports ``HIT`` or ``MISS``.
+
+Requests carrying credentials (``Authorization`` or ``Cookie``) bypass the
+cache entirely, both lookup and store, since their responses may be
+specific to the caller and the key does not include them.
+Responses are not cached when the endpoint sets ``Cache-Control: no-store``
+or ``private``, sets a cookie, varies on request headers other than
+``Accept-Encoding``, or returns a status other than 200. A
+request with ``Cache-Control: no-cache`` bypasses the lookup but refreshes
+the entry. Any successful write request (not GET or HEAD) under one of the
+cached path prefixes clears the cache, so writes are visible immediately
+within this process; writes elsewhere leave it alone.
+
+``CompressionMiddleware`` compresses responses with zstd or gzip, whichever
+the client prefers in ``Accept-Encoding``, once the body reaches a size
+threshold. Streaming responses are compressed chunk by chunk, so memory use
+does not grow with the response size.
+"""
+
+import importlib.util
+import zlib
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Optional, Sequence
+
+from .cache import CachedResponse, Headers, ResponseCache, etag_matches
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+_SAFE_METHODS = ("GET", "HEAD")
+_UNCACHEABLE_DIRECTIVES = ("no-store", "private")
+_CREDENTIAL_HEADERS = (b"authorization", b"cookie")
+
+
+def _header(headers: Headers, name: bytes) -> Optional[str]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _has_credentials(headers: Headers) -> bool:
+    return any(name.lower() in _CREDENTIAL_HEADERS for name, _ in headers)
+
+
+def _cacheable(start: Message) -> bool:
+    headers = start.get("headers", [])
+    if start["status"] != 200 or _header(headers, b"set-cookie") is not None:
+        return False
+    # The cache key ignores request headers, so content negotiated on them is not shared
+    vary = {name.strip() for name in (_header(headers, b"vary") or "").lower().split(",")}
+    if vary - {"", "accept-encoding"}:
+        return False
+    cache_control = (_header(headers, b"cache-control") or "").lower()
+    return not any(directive in cache_control for directive in _UNCACHEABLE_DIRECTIVES)
+
+
+class ResponseCacheMiddleware:
+    """Serve cached GET responses with ETag revalidation."""
+
+    def __init__(self, app: ASGIApp, cache: ResponseCache, paths: Sequence[str] = ("/",)):
+        """Wrap an ASGI app.
+
+        Args:
+            app: The application to wrap.
+            cache: Cache holding the responses and their metrics.
+            paths: Path prefixes whose GET responses are cached.
+        """
+        self.app = app
+        self.cache = cache
+        self.paths = tuple(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if not scope["path"].startswith(self.paths):
+            await self.app(scope, receive, send)
+            return
+        if scope["method"] not in _SAFE_METHODS:
+            await self._write_through(scope, receive, send)
+            return
+        request_headers = scope.get("headers", [])
+        if _has_credentials(request_headers):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = _header(request_headers, b"if-none-match")
+        key = self.cache.key(scope["path"], scope.get("query_string", b""))
+        if "no-cache" not in (_header(request_headers, b"cache-control") or "").lower():
+            entry = self.cache.lookup(key)
+            if entry is not None:
+                await self._send_entry(entry, scope, send, if_none_match, b"HIT")
+                return
+        if scope["method"] == "HEAD":
+            # HEAD responses have no body to cache
+            await self.app(scope, receive, send)
+            return
+        await self._fill(key, scope, receive, send, if_none_match)
+
+    async def _write_through(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run a write request and drop the cache if it succeeded."""
+        status: Dict[str, int] = {}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+        if status.get("code", 500) < 400:
+            self.cache.invalidate()
+
+    async def _fill(
+        self,
+        key: str,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        if_none_match: Optional[str],
+    ) -> None:
+        """Run the app, caching its response if it is small and cacheable."""
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        size = 0
+        passthrough = False
+
+        async def buffer(message: Message) -> None:
+            nonlocal start, size, passthrough
+            if passthrough:
+                await send(message)
+            elif message["type"] == "http.response.start":
+                start = message
+                if not _cacheable(start):
+                    passthrough = True
+                    await send(start)
+            elif message["type"] == "http.response.body":
+                assert start is not None, "response body sent before http.response.start"
+                chunks.append(message.get("body", b""))
+                size += len(chunks[-1])
+                more_body = message.get("more_body", False)
+                if size > self.cache.max_body_bytes:
+                    # Too large to cache: flush what we have and stream the rest
+                    passthrough = True
+                    await send(start)
+                    await send({"type": "http.response.body", "body": b"".join(chunks), "more_body": more_body})
+                elif not more_body:
+                    headers = start.get("headers", [])
+                    etag = _header(headers, b"etag")
+                    headers = [(name, value) for name, value in headers if name.lower() != b"etag"]
+                    entry = self.cache.store(key, start["status"], headers, b"".join(chunks), etag)
+                    await self._send_entry(entry, scope, send, if_none_match, b"MISS")
+            else:
+                await send(message)
+
+        await self.app(scope, receive, buffer)
+
+    async def _send_entry(
+        self,
+        entry: CachedResponse,
+        scope: Scope,
+        send: Send,
+        if_none_match: Optional[str],
+        source: bytes,
+    ) -> None:
+        validators = [(b"etag", entry.etag.encode("latin-1")), (b"x-cache", source)]
+        if if_none_match and etag_matches(if_none_match, entry.etag):
+            self.cache.not_modified += 1
+            headers = [
+                (name, value)
+                for name, value in entry.headers
+                if name.lower() in (b"cache-control", b"vary")
+            ]
+            await send({"type": "http.response.start", "status": 304, "headers": headers + validators})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await send({
+            "type": "http.response.start",
+            "status": entry.status,
+            "headers": list(entry.headers) + validators,
+        })
+        body = b"" if scope["method"] == "HEAD" else entry.body
+        await send({"type": "http.response.body", "body": body})
+
+
+@lru_cache(maxsize=None)
+def _zstd_available() -> bool:
+    return importlib.util.find_spec("zstandard") is not None
+
+
+def _negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick ``zstd`` or ``gzip`` from an ``Accept-Encoding`` header.
+
+    The highest quality value wins; ties prefer zstd. Returns None if the
+    client accepts neither.
+    """
+    if not accept_encoding:
+        return None
+    supported = ("zstd", "gzip") if _zstd_available() else ("gzip",)
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip()] = quality
+    wildcard = weights.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in supported:
+        quality = weights.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class _Compressor:
+    """Incremental compressor emitting complete blocks after every chunk."""
+
+    def __init__(self, encoding: str, level: Optional[int]):
+        if encoding == "zstd":
+            import zstandard
+
+            self._obj: Any = zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+            self._sync = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            self._finish = zstandard.COMPRESSOBJ_FLUSH_FINISH
+        else:
+            # wbits=31 selects the gzip container
+            self._obj = zlib.compressobj(6 if level is None else level, zlib.DEFLATED, 31)
+            self._sync = zlib.Z_SYNC_FLUSH
+            self._finish = zlib.Z_FINISH
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        compressed: bytes = self._obj.compress(data) + self._obj.flush(self._finish if final else self._sync)
+        return compressed
+
+
+class CompressionMiddleware:
+    """Compress responses with the encoding negotiated from ``Accept-Encoding``."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, level: Optional[int] = None):
+        """Wrap an ASGI app.
+
+        Args:
+            app: The application to wrap.
+            minimum_size: Bodies smaller than this many bytes are sent as is.
+            level: Compression level; defaults to 6 for gzip and 3 for zstd.
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = _negotiate_encoding(_header(scope.get("headers", []), b"accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        size = 0
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def compress(message: Message) -> None:
+            nonlocal start, size, compressor, passthrough
+            if passthrough:
+                await send(message)
+            elif message["type"] == "http.response.start":
+                start = message
+                headers = start.get("headers", [])
+                content_type = _header(headers, b"content-type") or ""
+                if _header(headers, b"content-encoding") or content_type.startswith("text/event-stream"):
+                    passthrough = True
+                    await send(start)
+            elif message["type"] != "http.response.body":
+                await send(message)
+            elif compressor is not None:
+                more_body = message.get("more_body", False)
+                body = compressor.compress(message.get("body", b""), final=not more_body)
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+            else:
+                assert start is not None, "response body sent before http.response.start"
+                chunks.append(message.get("body", b""))
+                size += len(chunks[-1])
+                more_body = message.get("more_body", False)
+                if size < self.minimum_size:
+                    if not more_body:
+                        # Complete and small: not worth compressing
+                        passthrough = True
+                        await send(start)
+                        await send({"type": "http.response.body", "body": b"".join(chunks)})
+                    return
+                compressor = _Compressor(encoding, self.level)
+                body = compressor.compress(b"".join(chunks), final=not more_body)
+                chunks.clear()
+                await send({**start, "headers": self._headers(start, encoding, None if more_body else len(body))})
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, compress)
+
+    @staticmethod
+    def _headers(start: Message, encoding: str, length: Optional[int]) -> Headers:
+        """Rewrite the response headers for the compressed body."""
+        headers: Headers = []
+        vary = None
+        for name, value in start.get("headers", []):
+            lowered = name.lower()
+            if lowered == b"content-length":
+                continue
+            if lowered == b"etag" and not value.startswith(b"W/"):
+                # The compressed bytes differ from those the strong ETag names
+                value = b"W/" + value
+            if lowered == b"vary":
+                vary = value
+                continue
+            headers.append((name, value))
+        if length is not None:
+            headers.append((b"content-length", str(length).encode("latin-1")))
+        headers.append((b"content-encoding", encoding.encode("latin-1")))
+        if not vary:
+            vary = b"Accept-Encoding"
+        elif b"accept-encoding" not in vary.lower():
+            vary += b", Accept-Encoding"
+        headers.append((b"vary", vary))
+        return headers
@@ -0,0 +1,54 @@
+"""Response classes for the API.
+
+``FastJSONResponse`` is the app's default response class: it renders with
+:func:`.serialization.dumps` (orjson when installed) instead of the standard
+library encoder.
+
+FastAPI validates and re-encodes whatever an endpoint returns against its
+``response_model``. Returning a ``Response`` instance skips both steps, so
+``trusted_response()`` is the fast path for data that is already known to
+match the schema, such as rows read from typed columns. The declared
+``response_model`` still documents the endpoint.
+
+Example:
+    >>> @router.get("/items", response_model=List[Item])
+    ... def items(db: Session = Depends(get_read_db)):
+    ...     return trusted_response(db.execute(select(items_table)))
+"""
+
+from typing import Any, Iterable, Mapping, Optional
+
+from starlette.responses import JSONResponse
+
+from .serialization import dumps, rows_to_dicts
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, or the standard library without it."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def trusted_response(
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> FastJSONResponse:
+    """Serialise trusted data directly, bypassing response-model validation.
+
+    Args:
+        content: Data to return. A SQLAlchemy ``Result`` or other iterable of
+            rows is converted to a list of dicts; pydantic models built with
+            :func:`.serialization.construct_models` are serialised as is.
+        status_code: HTTP status code.
+        headers: Extra response headers.
+
+    Returns:
+        A response FastAPI sends without validating or re-encoding it.
+    """
+    if hasattr(content, "keys") and hasattr(content, "all"):  # SQLAlchemy Result
+        content = rows_to_dicts(content)
+    elif isinstance(content, Iterable) and not isinstance(content, (list, tuple, dict, str, bytes)):
+        content = list(content)
+    return FastJSONResponse(content, status_code=status_code, headers=dict(headers or {}))
@@ -0,0 +1,137 @@
+"""JSON encoding for API responses.
+
+``dumps()`` uses ``orjson`` when it is installed and falls back to the
+standard library otherwise. Both produce the same compact UTF-8 JSON:
+
+* the extra types (dates and times, ``Decimal``, ``UUID``, enums,
+  dataclasses, NumPy scalars and arrays, pydantic models) are converted
+  by :func:`json_default`, with ``bytes`` sent as base64;
+* NaN and infinities are encoded as ``null``;
+* dict keys may be ``str``, ``int``, ``float``, ``bool``, ``None``, dates
+  and times, ``UUID`` or enums, and are encoded as strings.
+"""
+
+import base64
+import dataclasses
+import json
+import math
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional, Type
+from uuid import UUID
+
+orjson: Optional[ModuleType]
+try:
+    orjson = import_module("orjson")
+except ImportError:  # pragma: no cover - exercised by the fallback tests
+    orjson = None
+
+_ORJSON_OPTIONS = 0 if orjson is None else orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def json_default(value: Any) -> Any:
+    """Convert values the JSON encoders do not handle natively.
+
+    Raises:
+        TypeError: If ``value`` has no JSON representation.
+    """
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    if hasattr(value, "model_dump"):  # pydantic models
+        return value.model_dump()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, "tolist"):  # NumPy arrays and scalars
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Key types json encodes itself; the others are converted like orjson does
+_NATIVE_KEYS = (str, int, float, bool, type(None))
+_STRING_KEYS = (datetime, date, time, UUID, Enum)
+
+
+def _key(key: Any) -> Any:
+    if isinstance(key, float) and not math.isfinite(key):
+        return None
+    if isinstance(key, _NATIVE_KEYS):
+        return key
+    if isinstance(key, _STRING_KEYS):
+        return json_default(key)
+    raise TypeError(f"Dict key of type {type(key).__name__} is not JSON serializable")
+
+
+def _orjson_compatible(value: Any) -> Any:
+    """Replace non-finite floats with None and convert the keys orjson accepts."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {_key(key): _orjson_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_orjson_compatible(item) for item in value]
+    return value
+
+
+def _fallback_default(value: Any) -> Any:
+    return _orjson_compatible(json_default(value))
+
+
+_encoder_options: Dict[str, Any] = {"ensure_ascii": False, "allow_nan": False, "separators": (",", ":")}
+_encode = json.JSONEncoder(default=json_default, **_encoder_options).encode
+_encode_compatible = json.JSONEncoder(default=_fallback_default, **_encoder_options).encode
+
+
+def _stdlib_dumps(content: Any) -> str:
+    try:
+        return _encode(content)
+    except (TypeError, ValueError):
+        # NaN or a key type json rejects: normalise the document, then retry
+        return _encode_compatible(_orjson_compatible(content))
+
+
+def dumps(content: Any) -> bytes:
+    """Serialise ``content`` to compact UTF-8 JSON.
+
+    Args:
+        content: JSON-compatible data, possibly containing the extra types
+            handled by :func:`json_default`.
+
+    Returns:
+        The encoded document.
+    """
+    if orjson is not None:
+        encoded: bytes = orjson.dumps(content, default=json_default, option=_ORJSON_OPTIONS)
+        return encoded
+    return _stdlib_dumps(content).encode("utf-8")
+
+
+def rows_to_dicts(rows: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Turn SQLAlchemy result rows into plain dicts for a trusted response."""
+    return [dict(row._mapping) for row in rows]
+
+
+def construct_models(model: Type[Any], rows: Iterable[Any]) -> List[Any]:
+    """Build pydantic models from trusted rows without validating them.
+
+    Use only for data whose types are already guaranteed, e.g. rows read
+    from typed database columns.
+
+    Args:
+        model: pydantic model class.
+        rows: SQLAlchemy rows or mappings of field values.
+
+    Returns:
+        Model instances created with ``model_construct``.
+    """
+    return [model.model_construct(**dict(getattr(row, "_mapping", row))) for row in rows]
@@ -0,0 +1,193 @@
+"""Streaming responses for large query results.
+
+Rows are read through a server-side cursor (:mod:`..db.bulk`) and encoded
+chunk by chunk as they arrive, so the memory held per request is bounded by
+one batch regardless of the result size:
+
+* NDJSON (``application/x-ndjson``): one JSON object per row.
+* Arrow IPC stream (``application/vnd.apache.arrow.stream``): one record
+  batch per chunk of columnar NumPy arrays. Requires ``pyarrow``.
+
+The response builders open their own read-only session (so queries may go
+to a replica) and close it when the stream ends, independently of the
+request's ``get_db`` dependency. Combine them with ``CompressionMiddleware``
+to compress the stream on the fly.
+
+Example:
+    >>> @router.get("/measurements")
+    ... def measurements(request: Request):
+    ...     return streaming_response(request, select(Measurement.__table__))
+"""
+
+import io
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+
+from sqlalchemy.sql import Executable
+
+from ..db.bulk import stream_columns, stream_rows
+from ..db.session import SessionLocal
+from .serialization import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def iter_ndjson(rows: Iterable[Any], rows_per_chunk: int = 1000) -> Iterator[bytes]:
+    """Encode rows as NDJSON, yielding one chunk per ``rows_per_chunk`` rows.
+
+    Args:
+        rows: Result rows (``Row`` objects or mappings).
+        rows_per_chunk: Number of lines per yielded chunk.
+
+    Yields:
+        UTF-8 encoded, newline-terminated lines.
+    """
+    lines = []
+    for row in rows:
+        lines.append(dumps(dict(getattr(row, "_mapping", row))))
+        if len(lines) >= rows_per_chunk:
+            lines.append(b"")
+            yield b"\n".join(lines)
+            lines.clear()
+    if lines:
+        lines.append(b"")
+        yield b"\n".join(lines)
+
+
+def _drain(sink: io.BytesIO) -> bytes:
+    data = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return data
+
+
+def iter_arrow_ipc(chunks: Iterable[Mapping[str, Any]], schema: Any = None) -> Iterator[bytes]:
+    """Encode columnar chunks as an Arrow IPC stream.
+
+    Args:
+        chunks: Dicts of column name to 1-D array, e.g. from
+            :func:`..db.bulk.stream_columns`.
+        schema: Optional ``pyarrow.Schema``; needed to produce a valid
+            stream for an empty result, inferred from the first chunk
+            otherwise.
+
+    Yields:
+        The stream header and one encoded record batch per chunk, then the
+        end-of-stream marker.
+    """
+    import pyarrow as pa
+
+    sink = io.BytesIO()
+    writer = pa.ipc.new_stream(sink, schema) if schema is not None else None
+    for chunk in chunks:
+        batch = pa.RecordBatch.from_pydict(dict(chunk), schema=schema)
+        if writer is None:
+            schema = batch.schema
+            writer = pa.ipc.new_stream(sink, schema)
+        writer.write_batch(batch)
+        yield _drain(sink)
+    if writer is not None:
+        writer.close()
+        yield _drain(sink)
+
+
+def _read_only_rows(
+    statement: Executable,
+    params: Optional[Mapping[str, Any]],
+    batch_size: int,
+) -> Iterator[Any]:
+    db = SessionLocal(read_only=True)
+    try:
+        yield from stream_rows(db, statement, params, batch_size=batch_size)
+    finally:
+        db.close()
+
+
+def _read_only_columns(
+    statement: Executable,
+    params: Optional[Mapping[str, Any]],
+    batch_size: int,
+    dtypes: Optional[Mapping[str, Any]],
+) -> Iterator[Dict[str, Any]]:
+    db = SessionLocal(read_only=True)
+    try:
+        yield from stream_columns(db, statement, params, batch_size=batch_size, dtypes=dtypes)
+    finally:
+        db.close()
+
+
+def ndjson_response(
+    statement: Executable,
+    params: Optional[Mapping[str, Any]] = None,
+    batch_size: int = 1000,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Any:
+    """Stream a query result as NDJSON.
+
+    Args:
+        statement: Query to run.
+        params: Bound parameter values.
+        batch_size: Rows fetched from the cursor and encoded per chunk.
+        headers: Extra response headers.
+
+    Returns:
+        A ``StreamingResponse``.
+    """
+    from starlette.responses import StreamingResponse
+
+    rows = _read_only_rows(statement, params, batch_size)
+    return StreamingResponse(
+        iter_ndjson(rows, rows_per_chunk=batch_size),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers=dict(headers or {}),
+    )
+
+
+def arrow_response(
+    statement: Executable,
+    params: Optional[Mapping[str, Any]] = None,
+    batch_size: int = 65536,
+    dtypes: Optional[Mapping[str, Any]] = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Any:
+    """Stream a column query result as Arrow IPC record batches.
+
+    Args:
+        statement: Column query to run.
+        params: Bound parameter values.
+        batch_size: Rows per record batch.
+        dtypes: Optional NumPy dtype per column name.
+        headers: Extra response headers.
+
+    Returns:
+        A ``StreamingResponse``.
+    """
+    from starlette.responses import StreamingResponse
+
+    chunks = _read_only_columns(statement, params, batch_size, dtypes)
+    return StreamingResponse(
+        iter_arrow_ipc(chunks),
+        media_type=ARROW_STREAM_MEDIA_TYPE,
+        headers=dict(headers or {}),
+    )
+
+
+def streaming_response(
+    request: Any,
+    statement: Executable,
+    params: Optional[Mapping[str, Any]] = None,
+) -> Any:
+    """Stream a query result as Arrow IPC if the client accepts it, else NDJSON.
+
+    Args:
+        request: The incoming request; its ``Accept`` header picks the format.
+        statement: Query to run.
+        params: Bound parameter values.
+
+    Returns:
+        A ``StreamingResponse``.
+    """
+    headers = {"Vary": "Accept"}
+    if ARROW_STREAM_MEDIA_TYPE in request.headers.get("accept", ""):
+        return arrow_response(statement, params, headers=headers)
+    return ndjson_response(statement, params, headers=headers)
@@ -0,0 +1,29 @@
+"""Command-line interface for {{ cookiecutter.project_name }}.
+
+The ``{{ cookiecutter.project_slug }}`` console script is built for many
+short invocations, so startup only pays for ``argparse``: every subcommand
+imports what it needs (the config loader, SQLAlchemy, FastAPI, ML
+frameworks) inside its handler, after the command line has been parsed.
+
+Subcommands:
+
+* ``run [ENTRY_POINT]``: load the config, seed, and call ``module:function``
+  (by default the ``data`` pipeline from ``data.raw_dir`` to ``data.processed_dir``)
+* ``seed``: print the configured seed and derived child seeds
+* ``db load TABLE CSV``: bulk-load a CSV file into an existing table
+* ``metadata check``: validate the ``metadata/`` CSVs
+* ``metadata sync``: write only the changed metadata rows to the database
+* ``serve``: run the API with uvicorn (projects generated with the API)
+* ``bench [NAME ...]``: run scripts from ``benchmarks/``
+
+``--profile`` (before the subcommand) writes a cProfile dump of the command;
+``--profile-imports`` re-runs it under ``python -X importtime`` and writes
+the import-time report.
+"""
+
+from .main import build_parser, main
+
+__all__ = [
+    'build_parser',
+    'main',
+]
@@ -0,0 +1,6 @@
+"""Allow ``python -m {{ cookiecutter.project_slug }}.cli``."""
+
+from .main import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
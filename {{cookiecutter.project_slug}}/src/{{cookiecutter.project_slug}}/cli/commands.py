@@ -0,0 +1,259 @@
+"""Subcommand handlers for the command-line interface.
+
+Each handler takes the parsed ``argparse.Namespace`` and returns an exit
+code. Everything beyond the standard library is imported inside the handler
+that needs it, so importing this module (and parsing the command line) stays
+cheap.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, cast
+
+def _load_config(args: argparse.Namespace) -> Any:
+    from ..core.config_loader import load_config
+
+    return load_config(args.config_name, conf_dir=args.conf_dir)
+
+
+def _config_seed(config: Any) -> Optional[int]:
+    """The ``seed`` entry as an int; values taken from the environment are strings."""
+    seed = config.get("seed")
+    return None if seed is None else int(seed)
+
+
+def _seed_libraries(args: argparse.Namespace, config: Any) -> List[str]:
+    """Libraries to seed: ``--seed-libraries``, then ``seed_libraries`` in the config."""
+    from ..utils.seed_manager import DEFAULT_SEED_LIBRARIES
+
+    libraries = args.seed_libraries or config.get("seed_libraries") or DEFAULT_SEED_LIBRARIES
+    if isinstance(libraries, str):
+        libraries = libraries.split(",")
+    return [name.strip() for name in libraries]
+
+
+def _resolve_entry_point(spec: str) -> Callable[..., Any]:
+    """Import ``module:attribute`` (the attribute may be dotted)."""
+    from importlib import import_module
+
+    module_name, sep, attribute = spec.partition(":")
+    if not sep or not module_name or not attribute:
+        raise SystemExit(f"Entry point must look like module:function, got {spec!r}")
+    target: Any = import_module(module_name)
+    for part in attribute.split("."):
+        target = getattr(target, part)
+    return cast(Callable[..., Any], target)
+
+
+def run_pipeline(args: argparse.Namespace) -> int:
+    """Load the config, apply overrides, seed, and call the entry point."""
+    from ..core.config_loader import parse_scalar
+    from ..core.logging_config import configure_logging
+    from ..utils.seed_manager import SeedManager
+
+    config = _load_config(args)
+    for override in args.override:
+        key, sep, value = override.partition("=")
+        if not sep:
+            raise SystemExit(f"Override must look like KEY=VALUE, got {override!r}")
+        config.set(key.strip(), parse_scalar(value.strip()))
+    configure_logging(config)
+
+    manager = SeedManager(_config_seed(config))
+    manager.seed_everything(_seed_libraries(args, config))
+    func = _resolve_entry_point(args.entry_point)
+    with manager.scope():
+        result = func(config)
+    return result if isinstance(result, int) else 0
+
+
+def _importable(name: str) -> bool:
+    """Whether ``name`` can be imported, without importing it."""
+    from importlib.util import find_spec
+
+    try:
+        return find_spec(name) is not None
+    except ValueError:  # already imported without a spec
+        return name in sys.modules
+
+
+def seed_info(args: argparse.Namespace) -> int:
+    """Print the seed, derived child seeds and the available backends as JSON."""
+    from ..utils.seed_manager import SeedManager
+
+    seed = args.seed if args.seed is not None else _config_seed(_load_config(args))
+    manager = SeedManager(seed)
+    modules = {"python": "random", "numpy": "numpy", "pytorch": "torch", "tensorflow": "tensorflow"}
+    info: Dict[str, Any] = {
+        "seed": manager.seed,
+        "source": "argument" if args.seed is not None else "config",
+        "backends": {
+            name: _importable(modules.get(name, name)) for name in manager.libraries
+        },
+    }
+    if args.spawn:
+        info["children"] = [manager.spawn_seed(index) for index in range(args.spawn)]
+    json.dump(info, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+def _csv_converters(table: Any, columns: List[str]) -> List[Callable[[str], Any]]:
+    """Build a per-column parser from the reflected column types.
+
+    Empty fields become ``None``; values of columns whose Python type is not
+    known are passed through as strings.
+    """
+    from datetime import date, datetime
+
+    def parse_bool(text: str) -> bool:
+        return text.strip().lower() in ("1", "true", "t", "yes", "y")
+
+    parsers: Dict[type, Callable[[str], Any]] = {
+        bool: parse_bool,
+        int: int,
+        float: float,
+        date: date.fromisoformat,
+        datetime: datetime.fromisoformat,
+    }
+    converters: List[Callable[[str], Any]] = []
+    for name in columns:
+        if name not in table.c:
+            raise SystemExit(f"Column {name!r} does not exist in table {table.name!r}")
+        try:
+            python_type = table.c[name].type.python_type
+        except NotImplementedError:
+            python_type = str
+        parse = parsers.get(python_type)
+
+        def convert(text: str, parse: Optional[Callable[[str], Any]] = parse) -> Any:
+            if text == "":
+                return None
+            return parse(text) if parse is not None else text
+
+        converters.append(convert)
+    return converters
+
+
+def db_load(args: argparse.Namespace) -> int:
+    """Stream a CSV file into an existing table in batches."""
+    import csv
+
+    from sqlalchemy import MetaData, Table, create_engine
+
+    from ..db.bulk import bulk_insert, bulk_upsert
+
+    if args.url:
+        engine = create_engine(args.url)
+    else:
+        from ..db.session import get_engine
+
+        engine = get_engine()
+    table = Table(args.table, MetaData(), autoload_with=engine)
+
+    with open(args.csv, newline="", encoding="utf-8") as handle:
+        reader = csv.reader(handle)
+        columns = next(reader)
+        converters = _csv_converters(table, columns)
+        rows = (
+            {name: convert(value) for name, convert, value in zip(columns, converters, record)}
+            for record in reader
+        )
+        with engine.begin() as connection:
+            if args.upsert:
+                count = bulk_upsert(connection, table, rows, batch_size=args.batch_size)
+            else:
+                count = bulk_insert(connection, table, rows, batch_size=args.batch_size)
+    if args.url:
+        engine.dispose()
+    print(f"Loaded {count} rows into {args.table}", file=sys.stderr)
+    return 0
+
+
+def metadata_check(args: argparse.Namespace) -> int:
+    """Validate the metadata CSVs; exit with 1 if there are problems."""
+    from ..metadata import load_metadata
+
+    registry = load_metadata(args.dir, strict=False, use_cache=not args.no_cache)
+    for error in registry.errors:
+        print(error, file=sys.stderr)
+    print(
+        f"{len(registry.people)} people, {len(registry.projects)} projects, "
+        f"{len(registry.deliverables)} deliverables, {len(registry.errors)} problem(s)"
+    )
+    return 1 if registry.errors else 0
+
+
+def metadata_sync(args: argparse.Namespace) -> int:
+    """Apply the changes in the metadata CSVs to the database tables."""
+    from ..metadata import load_metadata
+    from ..metadata.sync import sync_metadata
+
+    registry = load_metadata(args.dir, strict=False)
+    if registry.errors:
+        for error in registry.errors:
+            print(error, file=sys.stderr)
+        print(f"Not syncing: {len(registry.errors)} problem(s) in the metadata", file=sys.stderr)
+        return 1
+
+    options = {"registry": registry, "batch_size": args.batch_size, "dry_run": args.dry_run}
+    if args.url:
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+
+        engine = create_engine(args.url)
+        with Session(engine) as db, db.begin():
+            changes = sync_metadata(db, **options)
+        engine.dispose()
+    else:
+        changes = sync_metadata(**options)
+    for table, counts in changes.items():
+        summary = ", ".join(f"{count} {action}" for action, count in counts.items())
+        print(f"{table}: {summary}{' (dry run)' if args.dry_run else ''}")
+    return 0
+
+
+def serve(args: argparse.Namespace) -> int:
+    """Run the API application with uvicorn."""
+    import uvicorn
+
+    package = __name__.rsplit(".", 2)[0]
+    uvicorn.run(
+        f"{package}.api.factory:create_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        reload=args.reload,
+    )
+    return 0
+
+
+def _benchmark_scripts() -> Dict[str, Path]:
+    from ..core import get_project_root
+
+    directory = get_project_root() / "benchmarks"
+    return {path.stem[len("bench_"):]: path for path in sorted(directory.glob("bench_*.py"))}
+
+
+def bench(args: argparse.Namespace) -> int:
+    """List or run benchmark scripts, each in its own interpreter."""
+    import shlex
+    import subprocess
+
+    scripts = _benchmark_scripts()
+    if args.list:
+        print("\n".join(scripts))
+        return 0
+    unknown = [name for name in args.names if name not in scripts]
+    if unknown:
+        raise SystemExit(f"Unknown benchmark(s): {', '.join(unknown)}; available: {', '.join(scripts)}")
+    extra = shlex.split(args.args)
+    for name in args.names or list(scripts):
+        print(f"== {name} ==", flush=True)
+        returncode = subprocess.run([sys.executable, str(scripts[name]), *extra]).returncode
+        if returncode:
+            return returncode
+    return 0
@@ -0,0 +1,204 @@
+"""Argument parsing, profiling and dispatch for the command-line interface."""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+from .commands import bench, db_load, metadata_check, metadata_sync, run_pipeline, seed_info, serve
+
+# Set in the child process started by ``--profile-imports``
+_IMPORTTIME_CHILD_ENV = "{{ cookiecutter.project_slug | upper }}_CLI_IMPORTTIME_CHILD"
+
+# The api subpackage is removed from projects generated without the API
+_HAS_API = (Path(__file__).resolve().parent.parent / "api").is_dir()
+
+# Processes data.raw_dir into data.processed_dir with data.Pipeline
+_DEFAULT_ENTRY_POINT = f"{__name__.rsplit('.', 2)[0]}.data:process"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all subcommands.
+
+    Returns:
+        The top-level parser; each subcommand stores its handler as ``func``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="{{ cookiecutter.project_slug }}",
+        description="{{ cookiecutter.project_short_description }}",
+    )
+    parser.add_argument("--version", action="store_true", help="print the version and exit")
+    profile = parser.add_mutually_exclusive_group()
+    profile.add_argument(
+        "--profile",
+        action="store_const",
+        const="cprofile",
+        help="write a cProfile dump of the command",
+    )
+    profile.add_argument(
+        "--profile-imports",
+        action="store_const",
+        const="importtime",
+        dest="profile",
+        help="re-run the command under python -X importtime and write the report",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        help="report path; defaults to <command>.prof or <command>.importtime.txt",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    run_parser = subparsers.add_parser("run", help="run a pipeline entry point with the loaded config")
+    run_parser.add_argument(
+        "entry_point",
+        nargs="?",
+        default=_DEFAULT_ENTRY_POINT,
+        help="callable as module:function; receives the Config (default: the raw -> processed data pipeline)",
+    )
+    run_parser.add_argument("--config-name", default="config", help="primary config in conf/ (without .yaml)")
+    run_parser.add_argument("--conf-dir", type=Path, help="config directory (default: <project>/conf)")
+    run_parser.add_argument(
+        "-o", "--override",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="set a dotted config key; values are parsed like YAML scalars",
+    )
+    run_parser.add_argument(
+        "--seed-libraries",
+        help="comma-separated libraries to seed (default: seed_libraries from the config, else python,numpy)",
+    )
+    run_parser.set_defaults(func=run_pipeline)
+
+    seed_parser = subparsers.add_parser("seed", help="show the seed and derived child seeds")
+    seed_parser.add_argument("--seed", type=int, help="seed to inspect (default: the config's seed)")
+    seed_parser.add_argument("--spawn", type=int, default=0, metavar="N", help="also derive N child seeds")
+    seed_parser.add_argument("--config-name", default="config")
+    seed_parser.add_argument("--conf-dir", type=Path)
+    seed_parser.set_defaults(func=seed_info)
+
+    db_parser = subparsers.add_parser("db", help="database utilities")
+    db_commands = db_parser.add_subparsers(dest="db_command", metavar="DB_COMMAND", required=True)
+    load_parser = db_commands.add_parser("load", help="bulk-load a CSV file into an existing table")
+    load_parser.add_argument("table", help="name of the target table")
+    load_parser.add_argument("csv", type=Path, help="CSV file with a header row of column names")
+    load_parser.add_argument("--url", help="database URL (default: DATABASE_URI from the settings)")
+    load_parser.add_argument("--batch-size", type=int, default=1000)
+    load_parser.add_argument(
+        "--upsert",
+        action="store_true",
+        help="update rows whose primary key already exists instead of failing",
+    )
+    load_parser.set_defaults(func=db_load)
+
+    metadata_parser = subparsers.add_parser("metadata", help="project metadata utilities")
+    metadata_commands = metadata_parser.add_subparsers(
+        dest="metadata_command", metavar="METADATA_COMMAND", required=True
+    )
+    check_parser = metadata_commands.add_parser("check", help="validate the metadata CSVs and print a summary")
+    check_parser.add_argument("--dir", type=Path, help="metadata directory (default: <project>/metadata)")
+    check_parser.add_argument("--no-cache", action="store_true", help="re-parse the CSVs even if unchanged")
+    check_parser.set_defaults(func=metadata_check)
+    sync_parser = metadata_commands.add_parser(
+        "sync", help="insert, update and delete only the database rows whose CSV row changed"
+    )
+    sync_parser.add_argument("--dir", type=Path, help="metadata directory (default: <project>/metadata)")
+    sync_parser.add_argument("--url", help="database URL (default: DATABASE_URI from the settings)")
+    sync_parser.add_argument("--batch-size", type=int, default=1000)
+    sync_parser.add_argument("--dry-run", action="store_true", help="print the changes without writing them")
+    sync_parser.set_defaults(func=metadata_sync)
+
+    if _HAS_API:
+        serve_parser = subparsers.add_parser("serve", help="run the API with uvicorn")
+        serve_parser.add_argument("--host", default="127.0.0.1")
+        serve_parser.add_argument("--port", type=int, default=8000)
+        serve_parser.add_argument("--workers", type=int, default=1)
+        serve_parser.add_argument("--reload", action="store_true", help="restart on code changes")
+        serve_parser.set_defaults(func=serve)
+
+    bench_parser = subparsers.add_parser("bench", help="run benchmark scripts from benchmarks/")
+    bench_parser.add_argument("names", nargs="*", help="benchmark names, e.g. settings for bench_settings.py")
+    bench_parser.add_argument("--list", action="store_true", help="list the available benchmarks")
+    bench_parser.add_argument(
+        "--args",
+        default="",
+        help="extra arguments passed to every benchmark script, as one quoted string",
+    )
+    bench_parser.set_defaults(func=bench)
+    return parser
+
+
+def _run_command(args: argparse.Namespace) -> int:
+    result = args.func(args)
+    return result if isinstance(result, int) else 0
+
+
+def _profile_with_cprofile(args: argparse.Namespace, output: Path) -> int:
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(_run_command, args)
+    finally:
+        profiler.dump_stats(str(output))
+        print(f"Wrote cProfile stats to {output}", file=sys.stderr)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(15)
+
+
+def _profile_imports(argv: Sequence[str], output: Path) -> int:
+    """Re-run the command under ``-X importtime`` and save the import report.
+
+    The child is a fresh interpreter, so the report covers the whole cold
+    start, including the imports deferred to the subcommand.
+    """
+    import subprocess
+
+    env = dict(os.environ, **{_IMPORTTIME_CHILD_ENV: "1"})
+    child = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", __package__, *argv],
+        env=env,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    report: List[str] = []
+    for line in child.stderr.splitlines():
+        if line.startswith("import time:"):
+            report.append(line)
+        else:
+            print(line, file=sys.stderr)
+    output.write_text("\n".join(report) + "\n", encoding="utf-8")
+    print(f"Wrote import-time report to {output}", file=sys.stderr)
+    return child.returncode
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the command line.
+
+    Args:
+        argv: Arguments without the program name; defaults to ``sys.argv[1:]``.
+
+    Returns:
+        The process exit code.
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    parser = build_parser()
+    args: Any = parser.parse_args(argv)
+    if args.version:
+        from ..core import get_version
+
+        print(get_version())
+        return 0
+    if args.command is None:
+        parser.print_help()
+        return 2
+
+    if args.profile == "importtime" and not os.environ.get(_IMPORTTIME_CHILD_ENV):
+        output = args.profile_output or Path(f"{args.command}.importtime.txt")
+        return _profile_imports(argv, output)
+    if args.profile == "cprofile":
+        output = args.profile_output or Path(f"{args.command}.prof")
+        return _profile_with_cprofile(args, output)
+    return _run_command(args)
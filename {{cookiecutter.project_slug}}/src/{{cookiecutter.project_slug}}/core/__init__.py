@@ -3,15 +3,14 @@
 This module provides core utilities and configuration for the package.
 """
 
+import copy
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
-# Configure basic logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# Logging is configured by the application, e.g. with configure_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -34,25 +33,137 @@ def get_version() -> str:
     return __version__
 
 
+_MISSING = object()
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(key: str) -> Tuple[str, ...]:
+    """Split a dotted key into its path components (cached)."""
+    return tuple(key.split("."))
+
+
+def _resolve(data: Mapping[str, Any], key: str) -> Any:
+    """Resolve ``key`` in ``data``, trying the flat key before the dotted path."""
+    value = data.get(key, _MISSING)
+    if value is not _MISSING or "." not in key:
+        return value
+    node: Any = data
+    for part in _compile_path(key):
+        if not isinstance(node, Mapping):
+            return _MISSING
+        node = node.get(part, _MISSING)
+        if node is _MISSING:
+            return _MISSING
+    return node
+
+
+def _flatten(data: Mapping[str, Any], prefix: str, out: Dict[str, Any]) -> None:
+    """Index every value of a nested mapping under its dotted path."""
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            _flatten(value, f"{path}.", out)
+            value = MappingProxyType(value)
+        out[path] = value
+
+
 class Config:
     """Simple configuration manager.
     
+    Keys may be dotted paths into nested dictionaries. Resolved paths are
+    cached until the next ``set()``, so repeated lookups cost one dict access;
+    mutate values through ``set()`` rather than through returned dicts.
+    
     Example:
-        >>> config = Config({"key": "value"})
+        >>> config = Config({"key": "value", "model": {"params": {"lr": 0.1}}})
         >>> config.get("key")
         'value'
+        >>> config.get("model.params.lr")
+        0.1
     """
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self._config = dict(config) if config else {}
+        self._cache: Dict[str, Any] = {}
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a configuration value by flat or dotted key."""
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = _resolve(self._config, key)
+            if value is _MISSING:
+                return default
+            self._cache[key] = value
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """Set a configuration value, creating nested dicts for dotted keys."""
+        self._cache.clear()
+        if "." not in key or key in self._config:
+            self._config[key] = value
+            return
+        *parents, leaf = _compile_path(key)
+        node = self._config
+        for part in parents:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = node[part] = {}
+            node = child
+        node[leaf] = value
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a deep copy of the configuration as plain dicts."""
+        return copy.deepcopy(self._config)
+    
+    def freeze(self) -> "FrozenConfig":
+        """Return an immutable, pre-resolved snapshot of this configuration."""
+        return FrozenConfig(self._config)
+
+
+class FrozenConfig:
+    """Immutable snapshot of a configuration with pre-resolved dotted keys.
+    
+    Every nested value is indexed under its dotted path when the snapshot is
+    built, so ``get()`` is a single dict lookup. Nested mappings are returned
+    as read-only views. Snapshots pickle as plain dicts, which makes them
+    cheap to send to worker processes.
+    """
+    
+    __slots__ = ("_data", "_values")
+    
+    _data: Dict[str, Any]
+    _values: Dict[str, Any]
+    
+    def __init__(self, config: Optional[Mapping[str, Any]] = None):
+        data = copy.deepcopy(dict(config)) if config else {}
+        values: Dict[str, Any] = {}
+        _flatten(data, "", values)
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_values", values)
     
     def get(self, key: str, default: Any = None) -> Any:
-        """Get a configuration value."""
-        return self._config.get(key, default)
+        """Get a configuration value by flat or dotted key."""
+        return self._values.get(key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
     
     def set(self, key: str, value: Any) -> None:
-        """Set a configuration value."""
-        self._config[key] = value
+        """Frozen configurations cannot be modified."""
+        raise TypeError("FrozenConfig is immutable; use Config.set() instead")
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise TypeError("FrozenConfig is immutable")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a deep copy of the configuration as plain dicts."""
+        return copy.deepcopy(self._data)
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (FrozenConfig, (self._data,))
 
 
 # Default configuration
@@ -61,3 +172,24 @@ config = Config({
     "version": "{{ cookiecutter.version }}",
     "python_version": "{{ cookiecutter.python_version }}",
 })
+
+
+from .config_loader import load_config  # noqa: E402
+from .logging_config import configure_logging, stop_logging  # noqa: E402
+from .parallel import ParallelExecutor, parallel_map  # noqa: E402
+from .cache import DiskCache, memoize  # noqa: E402
+
+__all__ = [
+    'Config',
+    'DiskCache',
+    'FrozenConfig',
+    'ParallelExecutor',
+    'config',
+    'configure_logging',
+    'get_project_root',
+    'get_version',
+    'load_config',
+    'memoize',
+    'parallel_map',
+    'stop_logging',
+]
@@ -0,0 +1,420 @@
+"""Content-addressed on-disk memoization under ``core.cache_dir``.
+
+``memoize`` stores the result of a function call in a file named after a
+hash of:
+
+* the function identity (module, qualified name and compiled bytecode, so
+  editing the function invalidates its entries),
+* the bound arguments, with defaults applied,
+* the values of the ``config_keys`` the result depends on,
+* with ``include_seed=True``, the active seed (``get_seed_manager().seed``).
+
+The seed is left out by default: the global seed manager draws a fresh
+random seed in every process unless one is set, so keying on it would
+make entries unreachable from the next process. Enable it for stochastic
+functions, together with ``set_global_seed`` or a seed scope.
+
+NumPy arrays are written as ``.npy`` files and loaded back memory-mapped,
+so a cached multi-gigabyte array costs nothing until it is read; every
+other result is pickled. Entries are written to a temporary file in the
+cache directory and moved into place with ``os.replace``, so concurrent
+writers in different processes never expose a partial file (the last
+writer of identical content wins). With ``max_bytes`` set, the least
+recently used entries are removed after each write; hits refresh an
+entry's mtime, which serves as its access time.
+
+Example:
+    >>> @memoize(config_keys=["data.test_size"])
+    ... def preprocess(path):
+    ...     return np.load(path) * 2
+    >>> preprocess("raw.npy")  # computed and stored
+    >>> preprocess("raw.npy")  # read-only memmap of the stored array
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Literal, Optional, Sequence, Tuple, TypeVar, Union
+
+from . import Config, FrozenConfig
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+MmapMode = Optional[Literal["r", "r+", "w+", "c"]]
+
+_MISSING = object()
+_SUFFIXES = (".npy", ".pkl")
+_HASH_VERSION = b"1"
+
+
+def _feed(update: Callable[[Union[bytes, memoryview]], None], value: Any) -> None:
+    """Feed a canonical, type-tagged encoding of ``value`` to a hash.
+
+    Containers are walked so that equal values hash equally regardless of
+    dict or set ordering; arrays are hashed from their buffer without a
+    copy when they are contiguous. Anything else is pickled.
+    """
+    if value is None or isinstance(value, (bool, int, float, complex)):
+        update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8", "surrogatepass")
+        update(b"str:%d:" % len(encoded) + encoded)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        data = bytes(value)
+        update(b"bytes:%d:" % len(data) + data)
+    elif isinstance(value, Path):
+        update(b"path:")
+        _feed(update, str(value))
+    elif isinstance(value, (list, tuple)):
+        update(b"%s:%d[" % (type(value).__name__.encode(), len(value)))
+        for item in value:
+            _feed(update, item)
+        update(b"]")
+    elif isinstance(value, dict):
+        update(b"dict:%d{" % len(value))
+        items = sorted(((_digest(key), item) for key, item in value.items()), key=lambda pair: pair[0])
+        for digest, item in items:
+            update(digest)
+            _feed(update, item)
+        update(b"}")
+    elif isinstance(value, (set, frozenset)):
+        update(b"set:%d{" % len(value))
+        for digest in sorted(_digest(item) for item in value):
+            update(digest)
+        update(b"}")
+    elif isinstance(value, (Config, FrozenConfig)):
+        update(b"config:")
+        _feed(update, value.to_dict())
+    elif type(value).__module__ == "numpy" and type(value).__name__ in ("ndarray", "memmap"):
+        if value.dtype.hasobject:
+            update(b"ndarray-object:")
+            _feed(update, value.tolist())
+            return
+        update(f"ndarray:{value.dtype.str}:{value.shape};".encode())
+        import numpy as np
+
+        update(np.ascontiguousarray(value).reshape(-1).view(np.uint8).data)
+    else:
+        update(b"pickle:" + pickle.dumps(value, protocol=4))
+
+
+def _digest(value: Any) -> bytes:
+    hasher = hashlib.blake2b(digest_size=20)
+    _feed(hasher.update, value)
+    return hasher.digest()
+
+
+def _function_identity(func: Callable[..., Any]) -> Tuple[Any, ...]:
+    """Name plus compiled code, so edits to the function change its key."""
+    code = getattr(func, "__code__", None)
+    body: Tuple[Any, ...] = ()
+    if code is not None:
+        constants = tuple(c for c in code.co_consts if not inspect.iscode(c))
+        nested = tuple(c.co_code for c in code.co_consts if inspect.iscode(c))
+        body = (code.co_code, repr(constants), nested, code.co_names)
+    return (func.__module__, func.__qualname__, body)
+
+
+def _is_array(value: Any) -> bool:
+    return (
+        type(value).__module__ == "numpy"
+        and type(value).__name__ in ("ndarray", "memmap")
+        and not value.dtype.hasobject
+    )
+
+
+class DiskCache:
+    """Directory of content-addressed entries with optional LRU size bound.
+
+    Attributes:
+        directory (Path): Directory holding the entries.
+        max_bytes (Optional[int]): Total size above which the least recently
+            used entries are removed, or None for no bound.
+        mmap_mode (Optional[str]): ``numpy.load`` mode for cached arrays;
+            ``"r"`` maps them read-only, None reads them into memory.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: Optional[int] = None,
+        mmap_mode: MmapMode = "r",
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.mmap_mode = mmap_mode
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Union[Config, FrozenConfig, None] = None,
+        **kwargs: Any,
+    ) -> "DiskCache":
+        """Build a cache from ``core.cache_dir`` and ``core.cache_max_bytes``.
+
+        Args:
+            config: Loaded configuration. Defaults to ``load_config()``.
+            **kwargs: Overrides for the other constructor arguments.
+
+        Returns:
+            A DiskCache rooted at the configured directory.
+
+        Raises:
+            ValueError: If ``core.cache_dir`` is not configured.
+        """
+        if config is None:
+            from .config_loader import load_config
+
+            config = load_config()
+        directory = config.get("core.cache_dir")
+        if not directory:
+            raise ValueError("core.cache_dir is not configured")
+        max_bytes = config.get("core.cache_max_bytes")
+        kwargs.setdefault("max_bytes", int(max_bytes) if max_bytes is not None else None)
+        return cls(directory, **kwargs)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash ``parts`` into a hexadecimal entry key."""
+        hasher = hashlib.blake2b(_HASH_VERSION, digest_size=20)
+        for part in parts:
+            _feed(hasher.update, part)
+        return hasher.hexdigest()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        # Two-character fan-out keeps directories small for large caches
+        return self.directory / key[:2] / f"{key}{suffix}"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value stored under ``key`` or ``default``.
+
+        A hit refreshes the entry's position in the LRU order.
+        """
+        for suffix in _SUFFIXES:
+            path = self._path(key, suffix)
+            try:
+                value = self._read(path)
+            except FileNotFoundError:
+                continue
+            except (OSError, EOFError, ValueError, pickle.UnpicklingError) as exc:
+                # A corrupt entry is treated as a miss and overwritten by the next put
+                logger.warning("Ignoring unreadable cache entry %s: %s", path, exc)
+                continue
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return value
+        return default
+
+    def _read(self, path: Path) -> Any:
+        if path.suffix == ".npy":
+            import numpy as np
+
+            return np.load(path, mmap_mode=self.mmap_mode, allow_pickle=False)
+        with open(path, "rb") as handle:
+            return pickle.load(handle)
+
+    def __contains__(self, key: str) -> bool:
+        return any(self._path(key, suffix).exists() for suffix in _SUFFIXES)
+
+    def put(self, key: str, value: Any) -> Path:
+        """Atomically store ``value`` under ``key`` and enforce the size bound.
+
+        Returns:
+            Path of the written entry.
+        """
+        suffix = ".npy" if _is_array(value) else ".pkl"
+        path = self._path(key, suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                if suffix == ".npy":
+                    import numpy as np
+
+                    np.save(handle, value, allow_pickle=False)
+                else:
+                    pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        if self.max_bytes is not None:
+            self.evict()
+        return path
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries: List[Tuple[float, int, Path]] = []
+        if not self.directory.is_dir():
+            return entries
+        for path in self.directory.glob("*/*"):
+            if path.suffix not in _SUFFIXES or path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self) -> int:
+        """Total size of all entries in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Remove least recently used entries until the cache fits.
+
+        Args:
+            max_bytes: Size to shrink to. Defaults to ``self.max_bytes``.
+
+        Returns:
+            Number of entries removed.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        if limit is None:
+            return 0
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            try:
+                # Open memory maps of the entry stay valid after the unlink
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry, including stale temporary files."""
+        if not self.directory.is_dir():
+            return
+        for path in self.directory.glob("*/*"):
+            if path.suffix in _SUFFIXES + (".tmp",):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def __repr__(self) -> str:
+        return f"<DiskCache(directory={str(self.directory)!r}, max_bytes={self.max_bytes})>"
+
+
+def memoize(
+    func: Optional[F] = None,
+    *,
+    cache: Optional[DiskCache] = None,
+    cache_dir: Union[str, Path, None] = None,
+    config: Union[Config, FrozenConfig, None] = None,
+    config_keys: Sequence[str] = (),
+    include_seed: bool = False,
+    ignore: Iterable[str] = (),
+    max_bytes: Optional[int] = None,
+) -> Any:
+    """Cache a function's results on disk, keyed by content.
+
+    Can be used bare (``@memoize``) or with arguments. The configuration is
+    loaded on the first call when it is needed (for ``core.cache_dir`` or
+    ``config_keys``) and not given.
+
+    Args:
+        func: Function to wrap.
+        cache: Cache to store results in. Defaults to one built from
+            ``cache_dir`` or the configuration.
+        cache_dir: Cache directory, overriding ``core.cache_dir``.
+        config: Configuration providing ``core.cache_dir`` and the values of
+            ``config_keys``.
+        config_keys: Dotted configuration keys the result depends on.
+        include_seed: Include the active seed in the key, for functions
+            whose result depends on it. Set a seed (``set_global_seed`` or a
+            seed scope) as well, or every process keys on a new random seed
+            and never reuses an entry.
+        ignore: Argument names excluded from the key (e.g. ``verbose``).
+        max_bytes: LRU size bound, overriding ``core.cache_max_bytes``.
+
+    Returns:
+        The wrapped function, with ``cache_key(*args, **kwargs)`` returning
+        the entry key of a call and ``cache`` the underlying DiskCache once
+        resolved.
+    """
+    if func is None:
+        return functools.partial(
+            memoize,
+            cache=cache,
+            cache_dir=cache_dir,
+            config=config,
+            config_keys=config_keys,
+            include_seed=include_seed,
+            ignore=ignore,
+            max_bytes=max_bytes,
+        )
+
+    signature = inspect.signature(func)
+    identity = _function_identity(func)
+    ignored = frozenset(ignore)
+    keys = tuple(config_keys)
+    resolved_cache = cache
+    resolved_config = config
+
+    def get_config() -> Union[Config, FrozenConfig]:
+        nonlocal resolved_config
+        if resolved_config is None:
+            from .config_loader import load_config
+
+            resolved_config = load_config()
+        return resolved_config
+
+    def get_cache() -> DiskCache:
+        nonlocal resolved_cache
+        if resolved_cache is None:
+            if cache_dir is not None:
+                resolved_cache = DiskCache(cache_dir, max_bytes=max_bytes)
+            else:
+                overrides = {} if max_bytes is None else {"max_bytes": max_bytes}
+                resolved_cache = DiskCache.from_config(get_config(), **overrides)
+            wrapper.cache = resolved_cache  # type: ignore[attr-defined]
+        return resolved_cache
+
+    def cache_key(*args: Any, **kwargs: Any) -> str:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = {name: value for name, value in bound.arguments.items() if name not in ignored}
+        settings = {key: get_config().get(key) for key in keys} if keys else {}
+        seed = None
+        if include_seed:
+            from ..utils.seed_manager import get_seed_manager
+
+            seed = get_seed_manager().seed
+        return DiskCache.make_key(identity, arguments, settings, seed)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        store = get_cache()
+        key = cache_key(*args, **kwargs)
+        value = store.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = func(*args, **kwargs)
+        try:
+            store.put(key, value)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as exc:
+            # Caching is an optimisation only; the computed value is still returned
+            logger.warning("Could not cache result of %s: %s", func.__qualname__, exc)
+        return value
+
+    wrapper.cache_key = cache_key  # type: ignore[attr-defined]
+    wrapper.cache = cache  # type: ignore[attr-defined]
+    return wrapper
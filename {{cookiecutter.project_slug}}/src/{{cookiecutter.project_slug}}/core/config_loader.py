@@ -0,0 +1,343 @@
+"""Load the ``conf/`` tree into a :class:`~{{ cookiecutter.project_slug }}.core.Config`.
+
+The loader composes the primary config (``conf/config.yaml``) from its
+``defaults:`` list, applies local overrides from ``conf/local/*.yaml`` and
+resolves the OmegaConf-style interpolations used in this template:
+
+* ``${a.b.c}`` - reference to another key of the composed config
+* ``${oc.env:NAME, default}`` - environment variable with optional default
+* ``${now:%Y-%m-%d}`` - current time formatted with ``strftime``
+* ``${hydra:runtime.cwd}`` - current working directory
+
+The composed config is cached before interpolation, together with the
+mtimes of the files it was read from; later loads skip YAML parsing entirely
+when none of them changed and only re-run the (cheap) interpolation. Values
+taken from the environment, such as credentials, are therefore never
+written to the cache. Caches are keyed on the config name and the resolved
+config directory, so trees sharing a ``cache_dir`` do not collide.
+
+Environment values are returned as strings, as in OmegaConf, so
+``PROJECT_VERSION=1.10`` or an id with leading zeros arrive unchanged;
+consumers that need a number convert it (``ParallelExecutor.from_config``
+calls ``int()`` on ``core.num_workers``). Unquoted defaults are parsed like
+YAML scalars, so the default of ``${oc.env:NUM_WORKERS, 4}`` is the ``int`` 4.
+"""
+
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from . import Config, get_project_root
+
+# Bump when the cache payload layout changes
+_CACHE_VERSION = 2
+
+_INT_RE = re.compile(r"^[-+]?[0-9]+$")
+_FLOAT_RE = re.compile(r"^[-+]?([0-9]+\.[0-9]*|\.[0-9]+|[0-9]+)([eE][-+]?[0-9]+)?$")
+
+
+def parse_scalar(text: str) -> Any:
+    """Parse an unquoted scalar the way YAML would."""
+    lowered = text.lower()
+    if lowered in ("null", "~", ""):
+        return None
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    if _INT_RE.match(text):
+        return int(text)
+    if _FLOAT_RE.match(text):
+        return float(text)
+    return text
+
+
+def _find_interpolations(text: str) -> List[Tuple[int, int]]:
+    """Return the ``(start, end)`` spans of top-level ``${...}`` expressions."""
+    spans: List[Tuple[int, int]] = []
+    pos = 0
+    while True:
+        start = text.find("${", pos)
+        if start < 0:
+            return spans
+        depth = 0
+        quote = None
+        index = start
+        while index < len(text):
+            char = text[index]
+            if quote:
+                if char == quote:
+                    quote = None
+            elif text.startswith("${", index):
+                depth += 1
+                index += 2
+                continue
+            elif char in "\"'":
+                quote = char
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    break
+            index += 1
+        else:
+            raise ValueError(f"Unterminated interpolation in {text!r}")
+        spans.append((start, index + 1))
+        pos = index + 1
+
+
+def _split_args(text: str) -> List[str]:
+    """Split resolver arguments on top-level commas."""
+    args = []
+    depth = 0
+    quote = None
+    current = ""
+    for char in text:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            args.append(current.strip())
+            current = ""
+            continue
+        current += char
+    if current.strip():
+        args.append(current.strip())
+    return args
+
+
+def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge ``override`` into ``base`` (in place)."""
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _deep_merge(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+def _file_dependency(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _current_dependency(key: str) -> Any:
+    """Recompute the current value of a recorded dependency."""
+    kind, _, name = key.partition(":")
+    if kind == "file":
+        path = Path(name)
+        return _file_dependency(path) if path.exists() else None
+    if kind == "dir":
+        directory = Path(name)
+        return tuple(sorted(p.name for p in directory.glob("*.yaml")))
+    raise ValueError(f"Unknown config dependency {key!r}")
+
+
+class _Resolver:
+    """Resolve interpolations in a composed config."""
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+        self._memo: Dict[str, Any] = {}
+        self._active: List[str] = []
+        self._resolvers: Dict[str, Callable[[List[Any]], Any]] = {
+            "oc.env": self._env,
+            "now": self._now,
+            "hydra": self._hydra,
+        }
+
+    def resolve(self, node: Any) -> Any:
+        if isinstance(node, dict):
+            return {key: self.resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [self.resolve(value) for value in node]
+        if isinstance(node, str) and "${" in node:
+            return self._interpolate(node)
+        return node
+
+    def _interpolate(self, text: str) -> Any:
+        spans = _find_interpolations(text)
+        if len(spans) == 1 and spans[0] == (0, len(text)):
+            return self._evaluate(text[2:-1])
+        parts = []
+        pos = 0
+        for start, end in spans:
+            value = self._evaluate(text[start + 2:end - 1])
+            if isinstance(value, (dict, list)):
+                raise ValueError(f"Cannot embed non-scalar {text[start:end]} in {text!r}")
+            parts.append(text[pos:start])
+            parts.append(str(value))
+            pos = end
+        parts.append(text[pos:])
+        return "".join(parts)
+
+    def _evaluate(self, body: str) -> Any:
+        body = body.strip()
+        name, sep, arg_text = body.partition(":")
+        if not sep:
+            return self._lookup(body)
+        resolver = self._resolvers.get(name.strip())
+        if resolver is None:
+            raise ValueError(f"Unsupported resolver {name!r} in " + "${" + body + "}")
+        return resolver([self._argument(arg) for arg in _split_args(arg_text)])
+
+    def _argument(self, text: str) -> Any:
+        if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+            inner = text[1:-1]
+            return str(self._interpolate(inner)) if "${" in inner else inner
+        if "${" in text:
+            return self._interpolate(text)
+        return parse_scalar(text)
+
+    def _lookup(self, key: str) -> Any:
+        if key in self._memo:
+            return self._memo[key]
+        if key in self._active:
+            cycle = " -> ".join(self._active + [key])
+            raise ValueError(f"Circular interpolation: {cycle}")
+        node: Any = self.raw
+        for part in key.split("."):
+            if not isinstance(node, dict) or part not in node:
+                raise KeyError("Interpolation ${" + key + "} refers to a missing key")
+            node = node[part]
+        self._active.append(key)
+        try:
+            value = self.resolve(node)
+        finally:
+            self._active.pop()
+        self._memo[key] = value
+        return value
+
+    def _env(self, args: List[Any]) -> Any:
+        if not args or len(args) > 2:
+            raise ValueError("oc.env takes a variable name and an optional default")
+        name = str(args[0])
+        value = os.environ.get(name)
+        if value is not None:
+            # Kept as a string like OmegaConf: "1.10" or "007" must not become numbers
+            return value
+        if len(args) == 2:
+            return args[1]
+        raise KeyError(f"Environment variable {name!r} is not set and has no default")
+
+    def _now(self, args: List[Any]) -> str:
+        pattern = ",".join(str(arg) for arg in args)
+        return datetime.now().strftime(pattern)
+
+    def _hydra(self, args: List[Any]) -> str:
+        if args != ["runtime.cwd"]:
+            raise ValueError(f"Unsupported hydra interpolation {args!r}")
+        return os.getcwd()
+
+
+def _read_yaml(path: Path, deps: Dict[str, Any]) -> Dict[str, Any]:
+    import yaml
+
+    deps[f"file:{path}"] = _file_dependency(path)
+    with open(path, "r", encoding="utf-8") as handle:
+        data = yaml.safe_load(handle)
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} must contain a mapping at the top level")
+    return data
+
+
+def _compose(conf_dir: Path, config_name: str, deps: Dict[str, Any]) -> Dict[str, Any]:
+    """Compose the primary config with its defaults and local overrides."""
+    primary = _read_yaml(conf_dir / f"{config_name}.yaml", deps)
+    defaults = primary.pop("defaults", None) or []
+    if "_self_" not in defaults:
+        defaults = list(defaults) + ["_self_"]
+
+    composed: Dict[str, Any] = {}
+    for entry in defaults:
+        if entry == "_self_":
+            _deep_merge(composed, primary)
+        elif isinstance(entry, str):
+            _deep_merge(composed, _read_yaml(conf_dir / f"{entry}.yaml", deps))
+        elif isinstance(entry, dict):
+            for group, option in entry.items():
+                group_config = _read_yaml(conf_dir / group / f"{option}.yaml", deps)
+                _deep_merge(composed, {group: group_config})
+        else:
+            raise ValueError(f"Invalid defaults entry {entry!r} in {config_name}.yaml")
+
+    local_dir = conf_dir / "local"
+    deps[f"dir:{local_dir}"] = _current_dependency(f"dir:{local_dir}")
+    for path in sorted(local_dir.glob("*.yaml")):
+        _deep_merge(composed, {path.stem: _read_yaml(path, deps)})
+    return composed
+
+
+def _read_cache(path: Path) -> Optional[Dict[str, Any]]:
+    """Return the cached composed config if none of its files changed."""
+    try:
+        with open(path, "rb") as handle:
+            payload = pickle.load(handle)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    if payload.get("version") != _CACHE_VERSION:
+        return None
+    for key, expected in payload["deps"].items():
+        if _current_dependency(key) != expected:
+            return None
+    raw: Dict[str, Any] = payload["config"]
+    return raw
+
+
+def _write_cache(path: Path, raw: Dict[str, Any], deps: Dict[str, Any]) -> None:
+    """Atomically persist the composed config and the files it was read from."""
+    payload = {"version": _CACHE_VERSION, "deps": deps, "config": raw}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except OSError:
+        # Caching is an optimisation only; a read-only tree still loads.
+        pass
+
+
+def load_config(
+    config_name: str = "config",
+    conf_dir: Optional[Union[str, Path]] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    use_cache: bool = True,
+) -> Config:
+    """Load, compose and resolve a configuration from the ``conf/`` tree.
+
+    Args:
+        config_name: Name of the primary config file without ``.yaml``.
+        conf_dir: Directory containing the configs. Defaults to ``conf/``
+            under the project root.
+        cache_dir: Directory for the composed-config cache. Defaults to
+            ``<conf_dir>/.cache``.
+        use_cache: Whether to read and write the composed-config cache.
+
+    Returns:
+        A Config holding the fully resolved configuration.
+    """
+    conf_dir = Path(conf_dir) if conf_dir else get_project_root() / "conf"
+    conf_dir = conf_dir.resolve()
+    conf_key = hashlib.blake2b(str(conf_dir).encode("utf-8"), digest_size=8).hexdigest()
+    cache_path = Path(cache_dir or conf_dir / ".cache") / f"{config_name}-{conf_key}.pkl"
+
+    raw = _read_cache(cache_path) if use_cache else None
+    if raw is None:
+        deps: Dict[str, Any] = {}
+        raw = _compose(conf_dir, config_name, deps)
+        if use_cache:
+            _write_cache(cache_path, raw, deps)
+    return Config(_Resolver(raw).resolve(raw))
@@ -0,0 +1,118 @@
+"""Opt-in, non-blocking logging setup driven by the ``logging:`` config section.
+
+``configure_logging()`` installs a single ``QueueHandler`` on the root logger.
+Log calls only enqueue the record; a ``QueueListener`` thread formats it and
+writes it to the console and to a size-rotated log file. Nothing here runs at
+import time, so the host application's logging setup is left alone unless it
+calls ``configure_logging()``.
+
+Recognised keys (see ``conf/base.yaml``)::
+
+    logging:
+      level: INFO
+      format: "[%(asctime)s][%(name)s][%(levelname)s] %(message)s"
+      file: ${paths.logs}/${now:%Y-%m-%d}.log
+      max_bytes: 10485760
+      backup_count: 5
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+from . import Config, FrozenConfig
+
+DEFAULT_FORMAT = "[%(asctime)s][%(name)s][%(levelname)s] %(message)s"
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+
+# The queue handler and listener installed by the last configure_logging() call
+_installed: Optional["_QueueHandler"] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that defers all formatting to the listener thread.
+
+    The stock ``prepare()`` merges the message arguments (and on newer Python
+    versions formats the whole record) in the calling thread. Records are
+    passed through untouched instead, so the caller only pays for the
+    enqueue; arguments must therefore not be mutated after logging them.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def stop_logging() -> None:
+    """Flush pending records and remove the handler installed by ``configure_logging()``."""
+    global _installed, _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    if _installed is not None:
+        logging.getLogger().removeHandler(_installed)
+        _installed = None
+
+
+def configure_logging(
+    config: Optional[Union[Config, FrozenConfig]] = None,
+    console: bool = True,
+) -> logging.handlers.QueueListener:
+    """Route root logging through a background thread.
+
+    Calling it again replaces the previous setup.
+
+    Args:
+        config: Configuration holding a ``logging`` section. Defaults to
+            ``load_config()``.
+        console: Whether to also log to stderr.
+
+    Returns:
+        The started QueueListener; it is stopped automatically at exit.
+    """
+    global _installed, _listener
+    if config is None:
+        from .config_loader import load_config
+
+        config = load_config()
+
+    level = config.get("logging.level", "INFO")
+    formatter = logging.Formatter(config.get("logging.format", DEFAULT_FORMAT))
+
+    handlers: List[logging.Handler] = []
+    if console:
+        handlers.append(logging.StreamHandler())
+    log_file: Any = config.get("logging.file")
+    if log_file:
+        path = Path(log_file)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(
+            logging.handlers.RotatingFileHandler(
+                path,
+                maxBytes=int(config.get("logging.max_bytes", DEFAULT_MAX_BYTES)),
+                backupCount=int(config.get("logging.backup_count", DEFAULT_BACKUP_COUNT)),
+                encoding="utf-8",
+            )
+        )
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    stop_logging()
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _installed = _QueueHandler(log_queue)
+
+    root = logging.getLogger()
+    root.addHandler(_installed)
+    root.setLevel(level)
+    _listener.start()
+    return _listener
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,384 @@
+"""Map functions over iterables with a thread or process pool.
+
+``ParallelExecutor`` sizes its pool from ``core.num_workers`` and its default
+batch size from ``data.batch_size`` when built with ``from_config()``:
+
+* Items are grouped into chunks of ``chunk_size`` so each task amortises the
+  submit and (for processes) pickling overhead over several items.
+* At most ``max_pending`` chunks are in flight; the input iterator is only
+  advanced when a slot frees up, so a lazy or unbounded input is never read
+  far ahead of the consumer.
+* Results are yielded in input order (``ordered=True``) or as soon as each
+  chunk completes.
+* Every worker gets its own ``SeedManager.spawn(index)`` stream. Process
+  workers seed the requested libraries and use the child as their global
+  manager; thread workers share the process-wide generators, so the child
+  is bound with ``SeedManager.scope()`` and tasks should draw from
+  ``get_seed_manager().python_rng`` / ``numpy_rng``. With
+  ``seed_per_chunk=True`` each chunk is instead scoped to
+  ``spawn(chunk_index)``, which makes results independent of scheduling.
+  Inline execution (``num_workers`` of 0 or 1) seeds the calling process
+  exactly like process worker 0, so it reseeds the caller's global
+  ``random`` / ``np.random`` state on first use.
+
+Example:
+    >>> with ParallelExecutor.from_config(load_config()) as executor:
+    ...     for features in executor.map_batches(extract, records):
+    ...         write(features)
+"""
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from . import Config, FrozenConfig
+
+if TYPE_CHECKING:
+    from ..utils.seed_manager import SeedManager
+
+BACKENDS = ("process", "thread")
+
+
+def _chunks(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _run_chunk(
+    func: Callable[[Any], Any],
+    chunk: List[Any],
+    seed: Union[Tuple[int, int], "SeedManager", None],
+) -> List[Any]:
+    """Apply ``func`` to every item of ``chunk``.
+
+    ``seed`` is ``(parent_seed, chunk_index)`` to scope the chunk to that
+    child stream, a manager to bind for the duration of the chunk, or None
+    to run in the worker's own context.
+    """
+    if seed is None:
+        return [func(item) for item in chunk]
+    from ..utils.seed_manager import SeedManager, _current_manager
+
+    if isinstance(seed, tuple):
+        parent_seed, index = seed
+        seed = SeedManager(parent_seed).spawn(index)
+    token = _current_manager.set(seed)
+    try:
+        return [func(item) for item in chunk]
+    finally:
+        _current_manager.reset(token)
+
+
+def _init_thread_worker(manager: "SeedManager", counter: Iterator[int], lock: threading.Lock) -> None:
+    """Thread pool initializer binding the worker's child stream to the thread."""
+    from ..utils.seed_manager import _current_manager
+
+    with lock:
+        index = next(counter)
+    # Pool threads run every task in the context set here
+    _current_manager.set(manager.spawn(index))
+
+
+class ParallelExecutor:
+    """Thread or process pool with chunking, backpressure and per-worker seeds.
+
+    The pool is created on first use and reused by later calls; close it
+    with ``shutdown()`` or by using the executor as a context manager. With
+    ``num_workers`` of 0 or 1 tasks run inline in the calling thread.
+
+    Attributes:
+        num_workers (int): Number of pool workers.
+        backend (str): ``"process"`` or ``"thread"``.
+        batch_size (Optional[int]): Default batch size for ``map_batches``.
+        max_pending (int): Maximum number of chunks in flight.
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        backend: str = "process",
+        seed: Union[int, "SeedManager", None] = None,
+        libraries: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        mp_context: Any = None,
+    ):
+        """Configure the executor.
+
+        Args:
+            num_workers: Pool size. Defaults to ``os.cpu_count()``.
+            backend: ``"process"`` for CPU-bound pure-Python work, ``"thread"``
+                for I/O or code that releases the GIL (NumPy, compression).
+            seed: Seed or manager the worker streams are spawned from.
+                Defaults to ``get_seed_manager()``.
+            libraries: Libraries each worker seeds. Defaults to the
+                libraries seeded by the manager, or python and numpy if none;
+                frameworks are only imported when listed.
+            batch_size: Default batch size for ``map_batches``.
+            max_pending: Maximum number of chunks submitted but not yet
+                consumed. Defaults to twice the number of workers.
+            mp_context: ``multiprocessing`` context for the process pool.
+
+        Raises:
+            ValueError: If ``backend`` or ``num_workers`` is invalid.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of {BACKENDS}")
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        if num_workers < 0:
+            raise ValueError(f"num_workers must be non-negative, got {num_workers}")
+        self.num_workers = int(num_workers)
+        self.backend = backend
+        self.batch_size = batch_size
+        self.max_pending = max_pending or 2 * max(self.num_workers, 1)
+        self._seed = seed
+        self._libraries = libraries
+        self._mp_context = mp_context
+        self._pool: Optional[Executor] = None
+        self._inline: Optional["SeedManager"] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Union[Config, FrozenConfig, None] = None,
+        **kwargs: Any,
+    ) -> "ParallelExecutor":
+        """Build an executor from ``core.num_workers`` and ``data.batch_size``.
+
+        Args:
+            config: Loaded configuration. Defaults to ``load_config()``.
+            **kwargs: Overrides for the other constructor arguments.
+
+        Returns:
+            A configured ParallelExecutor.
+        """
+        if config is None:
+            from .config_loader import load_config
+
+            config = load_config()
+        kwargs.setdefault("num_workers", config.get("core.num_workers"))
+        kwargs.setdefault("batch_size", config.get("data.batch_size"))
+        if kwargs["num_workers"] is not None:
+            kwargs["num_workers"] = int(kwargs["num_workers"])
+        if kwargs["batch_size"] is not None:
+            kwargs["batch_size"] = int(kwargs["batch_size"])
+        return cls(**kwargs)
+
+    @property
+    def seed_manager(self) -> "SeedManager":
+        """The manager worker streams are spawned from."""
+        from ..utils.seed_manager import SeedManager, get_seed_manager
+
+        if self._seed is None:
+            return get_seed_manager()
+        if isinstance(self._seed, SeedManager):
+            return self._seed
+        return SeedManager(self._seed)
+
+    def _get_pool(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                manager = self.seed_manager
+                if self.backend == "process":
+                    from concurrent.futures import ProcessPoolExecutor
+
+                    self._pool = ProcessPoolExecutor(
+                        self.num_workers,
+                        mp_context=self._mp_context,
+                        **manager.executor_kwargs(self._libraries),
+                    )
+                else:
+                    from concurrent.futures import ThreadPoolExecutor
+                    from itertools import count
+
+                    self._pool = ThreadPoolExecutor(
+                        self.num_workers,
+                        thread_name_prefix="parallel",
+                        initializer=_init_thread_worker,
+                        initargs=(manager, count(), threading.Lock()),
+                    )
+            return self._pool
+
+    def _inline_worker(self) -> "SeedManager":
+        """Seed the calling process as worker 0 of a process pool would be."""
+        with self._lock:
+            if self._inline is None:
+                manager = self.seed_manager
+                libraries = self._libraries if self._libraries is not None else manager._seeded_libraries()
+                self._inline = manager.spawn(0)
+                self._inline.seed_everything(libraries)
+            return self._inline
+
+    def _run(
+        self,
+        func: Callable[[Any], Any],
+        chunks: Iterator[List[Any]],
+        ordered: bool,
+        seed_per_chunk: bool,
+    ) -> Iterator[List[Any]]:
+        """Yield the result list of every chunk with bounded look-ahead."""
+        parent_seed = self.seed_manager.seed if seed_per_chunk else None
+        numbered = ((chunk, None if parent_seed is None else (parent_seed, index))
+                    for index, chunk in enumerate(chunks))
+
+        if self.num_workers <= 1:
+            # The calling thread acts as worker 0; its stream spans all chunks
+            worker = self._inline_worker()
+            for chunk, seed in numbered:
+                yield _run_chunk(func, chunk, seed or worker)
+            return
+
+        pool = self._get_pool()
+        pending: Deque["Future[List[Any]]"] = deque()
+        running: Set["Future[List[Any]]"] = set()
+        try:
+            for chunk, seed in numbered:
+                future = pool.submit(_run_chunk, func, chunk, seed)
+                if ordered:
+                    pending.append(future)
+                    if len(pending) >= self.max_pending:
+                        yield pending.popleft().result()
+                else:
+                    running.add(future)
+                    while len(running) >= self.max_pending:
+                        done, running = wait(running, return_when=FIRST_COMPLETED)
+                        for finished in done:
+                            yield finished.result()
+            while pending:
+                yield pending.popleft().result()
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for finished in done:
+                    yield finished.result()
+        finally:
+            # Reached early when the consumer stops or a task fails
+            for future in [*pending, *running]:
+                future.cancel()
+
+    def map(
+        self,
+        func: Callable[[Any], Any],
+        iterable: Iterable[Any],
+        chunk_size: int = 1,
+        ordered: bool = True,
+        seed_per_chunk: bool = False,
+    ) -> Iterator[Any]:
+        """Apply ``func`` to every item in parallel.
+
+        Args:
+            func: Function of one item. Must be picklable (defined at module
+                level) for the process backend.
+            iterable: Items to process; read lazily.
+            chunk_size: Items sent to a worker per task.
+            ordered: Yield results in input order; otherwise as chunks finish.
+            seed_per_chunk: Scope every chunk to ``spawn(chunk_index)`` for
+                results that do not depend on scheduling.
+
+        Yields:
+            ``func(item)`` for every item.
+
+        Raises:
+            ValueError: If ``chunk_size`` is not positive.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        for results in self._run(func, _chunks(iterable, chunk_size), ordered, seed_per_chunk):
+            yield from results
+
+    def map_batches(
+        self,
+        func: Callable[[List[Any]], Any],
+        iterable: Iterable[Any],
+        batch_size: Optional[int] = None,
+        ordered: bool = True,
+        seed_per_chunk: bool = False,
+    ) -> Iterator[Any]:
+        """Apply ``func`` to batches of items in parallel.
+
+        Args:
+            func: Function of a list of up to ``batch_size`` items.
+            iterable: Items to batch; read lazily.
+            batch_size: Items per batch. Defaults to ``self.batch_size``.
+            ordered: Yield results in input order; otherwise as batches finish.
+            seed_per_chunk: Scope every batch to ``spawn(batch_index)``.
+
+        Yields:
+            ``func(batch)`` for every batch.
+
+        Raises:
+            ValueError: If no positive batch size is given or configured.
+        """
+        batch_size = batch_size or self.batch_size
+        if not batch_size or batch_size < 1:
+            raise ValueError("map_batches needs a positive batch_size")
+        batches = ([batch] for batch in _chunks(iterable, batch_size))
+        for results in self._run(func, batches, ordered, seed_per_chunk):
+            yield from results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut the pool down; the next call creates (or reseeds) a new one."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._inline = None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def __enter__(self) -> "ParallelExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+    def __repr__(self) -> str:
+        return (
+            f"<ParallelExecutor(backend={self.backend!r}, num_workers={self.num_workers}, "
+            f"max_pending={self.max_pending})>"
+        )
+
+
+def parallel_map(
+    func: Callable[[Any], Any],
+    iterable: Iterable[Any],
+    num_workers: Optional[int] = None,
+    backend: str = "process",
+    chunk_size: int = 1,
+    ordered: bool = True,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Map ``func`` over ``iterable`` with a pool that lives for the iteration.
+
+    Args:
+        func: Function of one item.
+        iterable: Items to process; read lazily.
+        num_workers: Pool size. Defaults to ``os.cpu_count()``.
+        backend: ``"process"`` or ``"thread"``.
+        chunk_size: Items sent to a worker per task.
+        ordered: Yield results in input order.
+        **kwargs: Other ``ParallelExecutor`` arguments.
+
+    Yields:
+        ``func(item)`` for every item.
+    """
+    with ParallelExecutor(num_workers, backend, **kwargs) as executor:
+        yield from executor.map(func, iterable, chunk_size=chunk_size, ordered=ordered)
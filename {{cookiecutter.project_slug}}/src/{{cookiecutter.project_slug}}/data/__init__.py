@@ -0,0 +1,34 @@
+"""Data loading and processing for {{ cookiecutter.project_name }}.
+
+``Pipeline`` streams the files in ``data.raw_dir`` through batch transforms
+into shards in ``data.processed_dir``, reading the next batch on a
+background thread while the current one is transformed. Register readers
+for other raw formats with ``register_reader`` and shard formats with
+``register_writer``.
+
+``ColumnStore`` reads processed datasets stored as one ``.npy`` file per
+column plus a JSON schema as zero-copy memory maps, which worker processes
+share through the page cache; write them with ``StoreWriter`` or
+``write_store``.
+
+``HashSplit`` assigns rows to the train or test split from a seeded hash of
+a stable row key, so splits are streamable, parallel and reproducible
+across machines.
+"""
+
+from .pipeline import Pipeline, prefetch, process, register_reader, register_writer
+from .split import HashSplit, train_test_split
+from .store import ColumnStore, StoreWriter, write_store
+
+__all__ = [
+    'ColumnStore',
+    'HashSplit',
+    'Pipeline',
+    'StoreWriter',
+    'prefetch',
+    'process',
+    'register_reader',
+    'register_writer',
+    'train_test_split',
+    'write_store',
+]
@@ -0,0 +1,394 @@
+"""Stream raw files through batch transforms into processed shards.
+
+``Pipeline`` reads every file in ``data.raw_dir`` in batches of
+``data.batch_size``, applies its transforms to each batch and writes one
+shard per batch to ``data.processed_dir``. Nothing is materialised beyond
+the batches in flight, so datasets larger than memory stream through:
+
+* Readers are generators picked by file suffix (``.csv``, ``.jsonl``,
+  ``.txt``, ``.npy``; add more with ``register_reader``). Text formats yield
+  lists of records; ``.npy`` files are memory-mapped and yield read-only
+  array slices. Batches never span files, so a batch has a single schema.
+* The next batch is read on a background thread (``prefetch``) while the
+  current one is transformed, so file I/O overlaps compute. Pass a
+  ``ParallelExecutor`` to ``run()`` to spread transforms over workers too.
+* Shards are named ``part-00000.<suffix>``: arrays are written as ``.npy``,
+  lists of mappings as ``.jsonl`` and anything else pickled. Each shard is
+  written to a temporary file and renamed into place, and shards left over
+  from an earlier, longer run are removed.
+
+Example:
+    >>> pipeline = Pipeline.from_config(config).map(normalize).map(featurize)
+    >>> shards = pipeline.run()
+"""
+
+import contextlib
+import csv
+import json
+import logging
+import os
+import pickle
+import queue
+import tempfile
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from ..core import Config, FrozenConfig
+
+if TYPE_CHECKING:
+    from ..core.parallel import ParallelExecutor
+
+logger = logging.getLogger(__name__)
+
+Reader = Callable[[Path, int], Iterator[Any]]
+Writer = Callable[[Any, IO[bytes]], None]
+Transform = Callable[[Any], Any]
+
+
+def _chunks(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+#: Batch readers keyed by file suffix
+_READERS: Dict[str, Reader] = {}
+
+#: Shard writers keyed by file suffix
+_WRITERS: Dict[str, Writer] = {}
+
+
+def register_reader(*suffixes: str) -> Callable[[Reader], Reader]:
+    """Register a batch reader for files with the given suffixes.
+
+    A reader takes a path and a batch size and yields batches. It must read
+    lazily so that only the current batch is held in memory.
+
+    Args:
+        *suffixes: File suffixes including the dot, e.g. ``".parquet"``.
+
+    Returns:
+        Decorator registering the reader.
+    """
+    def decorator(func: Reader) -> Reader:
+        for suffix in suffixes:
+            _READERS[suffix.lower()] = func
+        return func
+    return decorator
+
+
+def register_writer(suffix: str) -> Callable[[Writer], Writer]:
+    """Register a shard writer for ``shard_format=suffix``.
+
+    Args:
+        suffix: Shard suffix including the dot.
+
+    Returns:
+        Decorator registering a function writing a batch to a binary file.
+    """
+    def decorator(func: Writer) -> Writer:
+        _WRITERS[suffix] = func
+        return func
+    return decorator
+
+
+@register_reader(".csv")
+def _read_csv(path: Path, batch_size: int) -> Iterator[List[Dict[str, str]]]:
+    with open(path, newline="", encoding="utf-8") as handle:
+        yield from _chunks(csv.DictReader(handle), batch_size)
+
+
+@register_reader(".jsonl", ".ndjson")
+def _read_jsonl(path: Path, batch_size: int) -> Iterator[List[Any]]:
+    with open(path, encoding="utf-8") as handle:
+        records = (json.loads(line) for line in handle if line.strip())
+        yield from _chunks(records, batch_size)
+
+
+@register_reader(".txt")
+def _read_lines(path: Path, batch_size: int) -> Iterator[List[str]]:
+    with open(path, encoding="utf-8") as handle:
+        yield from _chunks((line.rstrip("\r\n") for line in handle), batch_size)
+
+
+@register_reader(".npy")
+def _read_npy(path: Path, batch_size: int) -> Iterator[Any]:
+    import numpy as np
+
+    array = np.load(path, mmap_mode="r")
+    if array.ndim == 0:
+        yield np.asarray(array)
+        return
+    for start in range(0, len(array), batch_size):
+        yield array[start:start + batch_size]
+
+
+@register_writer(".jsonl")
+def _write_jsonl(batch: Any, handle: IO[bytes]) -> None:
+    for record in batch:
+        handle.write(json.dumps(record, default=str).encode("utf-8"))
+        handle.write(b"\n")
+
+
+@register_writer(".npy")
+def _write_npy(batch: Any, handle: IO[bytes]) -> None:
+    import numpy as np
+
+    np.save(handle, np.asarray(batch), allow_pickle=False)
+
+
+@register_writer(".pkl")
+def _write_pickle(batch: Any, handle: IO[bytes]) -> None:
+    pickle.dump(batch, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _shard_suffix(batch: Any) -> str:
+    if type(batch).__module__ == "numpy" and not batch.dtype.hasobject:
+        return ".npy"
+    if isinstance(batch, list) and all(isinstance(record, dict) for record in batch):
+        return ".jsonl"
+    return ".pkl"
+
+
+_DONE = object()
+
+
+def prefetch(iterable: Iterable[Any], depth: int = 1) -> Iterator[Any]:
+    """Iterate ``iterable`` on a background thread, ``depth`` items ahead.
+
+    Exceptions raised by the iterable are re-raised in the consumer. When
+    the consumer stops early, the producer thread exits at its next item.
+
+    Args:
+        iterable: Items to produce, e.g. a generator of batches.
+        depth: Maximum number of items read ahead; 0 disables the thread.
+
+    Yields:
+        The items of ``iterable`` in order.
+    """
+    if depth < 1:
+        yield from iterable
+        return
+
+    items: "queue.Queue[Tuple[Any, Optional[BaseException]]]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item: Any, error: Optional[BaseException] = None) -> bool:
+        while not stop.is_set():
+            try:
+                items.put((item, error), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+        except BaseException as exc:  # re-raised by the consumer
+            put(None, exc)
+            return
+        put(_DONE)
+
+    thread = threading.Thread(target=produce, name="prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = items.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def _apply(transforms: Tuple[Transform, ...], batch: Any) -> Any:
+    for transform in transforms:
+        batch = transform(batch)
+        if batch is None:
+            break
+    return batch
+
+
+class Pipeline:
+    """Batch pipeline from a raw directory to processed shards.
+
+    Attributes:
+        raw_dir (Path): Directory the raw files are read from.
+        processed_dir (Optional[Path]): Directory shards are written to.
+        batch_size (int): Maximum number of records per batch.
+        pattern (str): Glob selecting raw files, relative to ``raw_dir``.
+        prefetch (int): Number of batches read ahead on a background thread.
+        shard_format (Optional[str]): Shard suffix (``".jsonl"``, ``".npy"``,
+            ``".pkl"``); chosen per batch when None.
+        transforms (List[Callable]): Functions applied to every batch in
+            order. A transform returning None drops the batch.
+    """
+
+    def __init__(
+        self,
+        raw_dir: Union[str, Path],
+        processed_dir: Union[str, Path, None] = None,
+        batch_size: int = 32,
+        transforms: Optional[Iterable[Transform]] = None,
+        pattern: str = "**/*",
+        prefetch: int = 1,
+        shard_format: Optional[str] = None,
+    ):
+        """Configure the pipeline.
+
+        Raises:
+            ValueError: If ``batch_size`` is not positive or ``shard_format``
+                has no registered writer.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if shard_format is not None and shard_format not in _WRITERS:
+            raise ValueError(f"Unknown shard format {shard_format!r}; expected one of {sorted(_WRITERS)}")
+        self.raw_dir = Path(raw_dir)
+        self.processed_dir = Path(processed_dir) if processed_dir is not None else None
+        self.batch_size = int(batch_size)
+        self.transforms: List[Transform] = list(transforms or [])
+        self.pattern = pattern
+        self.prefetch = prefetch
+        self.shard_format = shard_format
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Union[Config, FrozenConfig, None] = None,
+        **kwargs: Any,
+    ) -> "Pipeline":
+        """Build a pipeline from ``data.raw_dir``, ``data.processed_dir`` and ``data.batch_size``.
+
+        Args:
+            config: Loaded configuration. Defaults to ``load_config()``.
+            **kwargs: Overrides for the other constructor arguments.
+
+        Returns:
+            A configured Pipeline.
+        """
+        if config is None:
+            from ..core.config_loader import load_config
+
+            config = load_config()
+        kwargs.setdefault("raw_dir", config.get("data.raw_dir"))
+        kwargs.setdefault("processed_dir", config.get("data.processed_dir"))
+        kwargs.setdefault("batch_size", int(config.get("data.batch_size", 32)))
+        if kwargs["raw_dir"] is None:
+            raise ValueError("data.raw_dir is not configured")
+        return cls(**kwargs)
+
+    def map(self, transform: Transform) -> "Pipeline":
+        """Append a batch transform and return the pipeline for chaining."""
+        self.transforms.append(transform)
+        return self
+
+    def files(self) -> List[Path]:
+        """Raw files with a registered reader, in sorted order."""
+        return sorted(
+            path for path in self.raw_dir.glob(self.pattern)
+            if path.is_file() and path.suffix.lower() in _READERS
+        )
+
+    def read_batches(self) -> Iterator[Any]:
+        """Yield raw batches of every file, without transforms or prefetching."""
+        for path in self.files():
+            logger.debug("Reading %s", path)
+            yield from _READERS[path.suffix.lower()](path, self.batch_size)
+
+    def apply(self, batch: Any) -> Any:
+        """Apply the transforms to one batch."""
+        return _apply(tuple(self.transforms), batch)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield transformed batches, reading ahead on a background thread."""
+        for batch in prefetch(self.read_batches(), self.prefetch):
+            batch = self.apply(batch)
+            if batch is not None:
+                yield batch
+
+    def run(self, executor: Optional["ParallelExecutor"] = None) -> List[Path]:
+        """Transform every batch and write it to a shard in ``processed_dir``.
+
+        Args:
+            executor: Optional executor the transforms run on. The process
+                backend needs module-level (picklable) transforms.
+
+        Returns:
+            Paths of the written shards in batch order.
+
+        Raises:
+            ValueError: If ``processed_dir`` is not set.
+        """
+        directory = self.processed_dir
+        if directory is None:
+            raise ValueError("Pipeline.run() needs a processed_dir")
+        directory.mkdir(parents=True, exist_ok=True)
+        if executor is None:
+            batches: Iterable[Any] = self
+        else:
+            raw = prefetch(self.read_batches(), self.prefetch)
+            batches = (batch for batch in executor.map(self.apply, raw) if batch is not None)
+
+        shards = [self._write_shard(directory, index, batch) for index, batch in enumerate(batches)]
+        written = set(shards)
+        for stale in directory.glob("part-*"):
+            if stale not in written and stale.suffix in _WRITERS:
+                stale.unlink()
+        logger.info("Wrote %d shards to %s", len(shards), directory)
+        return shards
+
+    def _write_shard(self, directory: Path, index: int, batch: Any) -> Path:
+        suffix = self.shard_format or _shard_suffix(batch)
+        path = directory / f"part-{index:05d}{suffix}"
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                _WRITERS[suffix](batch, handle)
+            os.replace(tmp_name, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+        return path
+
+    def __repr__(self) -> str:
+        return (
+            f"<Pipeline(raw_dir={str(self.raw_dir)!r}, processed_dir={str(self.processed_dir)!r}, "
+            f"batch_size={self.batch_size}, transforms={len(self.transforms)})>"
+        )
+
+
+def process(config: Union[Config, FrozenConfig]) -> int:
+    """Entry point for ``run``: process ``data.raw_dir`` without transforms.
+
+    Copy this function into your own module and add transforms with
+    ``Pipeline.map`` to build a project pipeline.
+
+    Returns:
+        Exit code 0.
+    """
+    Pipeline.from_config(config).run()
+    return 0
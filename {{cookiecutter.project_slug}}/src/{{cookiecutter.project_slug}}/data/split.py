@@ -0,0 +1,269 @@
+"""Deterministic train/test splits by hashing row keys with the seed.
+
+Instead of shuffling row indices, every row is assigned from a 64-bit hash
+of a stable key (an id column, a file name, a row number) mixed with the
+split seed: the row is in the test split when its hash falls below
+``test_size * 2**64``. The assignment of one row therefore needs no other
+row, which makes the split
+
+* O(1) in memory and streamable (``HashSplit.is_test`` / ``filter``),
+* trivially parallel, since workers agree without coordinating,
+* identical across machines, processes and NumPy versions, and
+* stable as the dataset grows: adding rows never moves existing ones.
+
+Integer keys are hashed with the SplitMix64 finaliser; strings and bytes
+are first reduced to 64 bits with BLAKE2b. ``HashSplit.mask`` is the
+vectorised NumPy path for in-memory key arrays and agrees exactly with
+the scalar path. With ``strata`` it instead takes, within every stratum,
+the ``round(test_size * n)`` rows with the smallest hashes, so each
+stratum is split in exactly the requested proportion (this needs all keys
+of a stratum at once).
+
+Example:
+    >>> splitter = HashSplit.from_config(config)
+    >>> train_ids = [row for row in rows if not splitter.is_test(row["id"])]
+    >>> X_train, X_test, y_train, y_test = splitter.split(X, y, keys=ids, strata=y)
+"""
+
+import hashlib
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Optional, Union
+
+from ..core import Config, FrozenConfig
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_MASK = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_MUL1 = 0xBF58476D1CE4E5B9
+_MUL2 = 0x94D049BB133111EB
+# Rows hashed per vectorised step, bounding the temporaries of ``mask``
+_CHUNK = 1 << 20
+
+
+def _mix(value: int) -> int:
+    """SplitMix64 finaliser on a Python int."""
+    value = (value + _GOLDEN) & _MASK
+    value = ((value ^ (value >> 30)) * _MUL1) & _MASK
+    value = ((value ^ (value >> 27)) * _MUL2) & _MASK
+    return value ^ (value >> 31)
+
+
+def _mix_array(values: "np.ndarray") -> "np.ndarray":
+    """SplitMix64 finaliser on a uint64 array; wraps like ``_mix``."""
+    import numpy as np
+
+    values = values + np.uint64(_GOLDEN)
+    values ^= values >> np.uint64(30)
+    values *= np.uint64(_MUL1)
+    values ^= values >> np.uint64(27)
+    values *= np.uint64(_MUL2)
+    values ^= values >> np.uint64(31)
+    return values
+
+
+def _key_to_int(key: Any) -> int:
+    if isinstance(key, bool):
+        raise TypeError("Boolean split keys are ambiguous; use integers")
+    if isinstance(key, int):
+        return key & _MASK
+    if hasattr(key, "dtype") and key.dtype.kind in "iu":  # NumPy integer scalar
+        return int(key) & _MASK
+    if isinstance(key, str):
+        key = key.encode("utf-8")
+    if isinstance(key, (bytes, bytearray, memoryview)):
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+    raise TypeError(f"Split keys must be integers, strings or bytes, got {type(key).__name__}")
+
+
+def _keys_to_array(keys: Any) -> "np.ndarray":
+    import numpy as np
+
+    array = np.asarray(keys)
+    if array.dtype.kind == "i":
+        return np.ascontiguousarray(array, dtype=np.int64).view(np.uint64)
+    if array.dtype.kind == "u":
+        return array.astype(np.uint64, copy=False)
+    if array.dtype.kind in "USO":
+        return np.fromiter((_key_to_int(key) for key in array.tolist()), np.uint64, len(array))
+    raise TypeError(f"Split keys must be integers, strings or bytes, got dtype {array.dtype}")
+
+
+class HashSplit:
+    """Seeded hash-based assignment of rows to a train and a test split.
+
+    Attributes:
+        test_size (float): Fraction of rows in the test split.
+        seed (int): Seed mixed into every row hash.
+    """
+
+    def __init__(self, test_size: float = 0.2, seed: Optional[int] = None):
+        """Configure the split.
+
+        Args:
+            test_size: Fraction of rows in the test split, in ``[0, 1]``.
+            seed: Split seed. Defaults to ``get_seed_manager().seed``.
+
+        Raises:
+            ValueError: If ``test_size`` is outside ``[0, 1]``.
+        """
+        if not 0.0 <= test_size <= 1.0:
+            raise ValueError(f"test_size must be in [0, 1], got {test_size}")
+        if seed is None:
+            from ..utils.seed_manager import get_seed_manager
+
+            seed = get_seed_manager().seed
+        self.test_size = float(test_size)
+        self.seed = int(seed)
+        self._salt = _mix(self.seed & _MASK)
+        # Rows whose hash is below the threshold are in the test split
+        self._threshold = min(int(self.test_size * 2.0 ** 64), 1 << 64)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Union[Config, FrozenConfig, None] = None,
+        **kwargs: Any,
+    ) -> "HashSplit":
+        """Build a split from ``data.test_size`` and ``data.random_state``.
+
+        Args:
+            config: Loaded configuration. Defaults to ``load_config()``.
+            **kwargs: Overrides for ``test_size`` and ``seed``.
+
+        Returns:
+            A configured HashSplit.
+        """
+        if config is None:
+            from ..core.config_loader import load_config
+
+            config = load_config()
+        kwargs.setdefault("test_size", float(config.get("data.test_size", 0.2)))
+        random_state = config.get("data.random_state")
+        kwargs.setdefault("seed", int(random_state) if random_state is not None else None)
+        return cls(**kwargs)
+
+    def hash(self, key: Any) -> int:
+        """Return the seeded 64-bit hash of one row key."""
+        return _mix(_key_to_int(key) ^ self._salt)
+
+    def hash_array(self, keys: Any) -> "np.ndarray":
+        """Return the seeded 64-bit hashes of an array of keys as uint64."""
+        import numpy as np
+
+        values = _keys_to_array(keys)
+        hashes = np.empty(len(values), dtype=np.uint64)
+        salt = np.uint64(self._salt)
+        for start in range(0, len(values), _CHUNK):
+            hashes[start:start + _CHUNK] = _mix_array(values[start:start + _CHUNK] ^ salt)
+        return hashes
+
+    def is_test(self, key: Any) -> bool:
+        """Whether the row with ``key`` belongs to the test split."""
+        return self.hash(key) < self._threshold
+
+    def mask(self, keys: Any, strata: Any = None) -> "np.ndarray":
+        """Vectorised test-split membership of an array of keys.
+
+        Args:
+            keys: Integer, string or bytes keys, one per row.
+            strata: Optional labels, one per row. When given, every stratum
+                contributes exactly ``round(test_size * n_stratum)`` rows:
+                those with the smallest hashes.
+
+        Returns:
+            Boolean array that is True for test rows. Without ``strata`` it
+            equals ``[is_test(key) for key in keys]``.
+        """
+        import numpy as np
+
+        if strata is None:
+            values = _keys_to_array(keys)
+            out = np.empty(len(values), dtype=bool)
+            if self._threshold >= 1 << 64:
+                out[:] = True
+                return out
+            salt, threshold = np.uint64(self._salt), np.uint64(self._threshold)
+            for start in range(0, len(values), _CHUNK):
+                out[start:start + _CHUNK] = _mix_array(values[start:start + _CHUNK] ^ salt) < threshold
+            return out
+
+        hashes = self.hash_array(keys)
+        labels = np.asarray(strata)
+        if len(labels) != len(hashes):
+            raise ValueError(f"Got {len(labels)} strata for {len(hashes)} keys")
+        _, codes = np.unique(labels, return_inverse=True)
+        codes = codes.reshape(-1)
+        order = np.lexsort((hashes, codes))
+        counts = np.bincount(codes)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        quota = np.floor(counts * self.test_size + 0.5).astype(np.int64)
+        # Rank of every row among the rows of its stratum, in hash order
+        ranks = np.empty(len(hashes), dtype=np.int64)
+        ranks[order] = np.arange(len(hashes)) - np.repeat(starts, counts)
+        test: np.ndarray = ranks < quota[codes]
+        return test
+
+    def split(self, *arrays: Any, keys: Any = None, strata: Any = None) -> List[Any]:
+        """Split arrays into train and test parts, like scikit-learn.
+
+        Args:
+            *arrays: Arrays (or sequences) of equal length to split.
+            keys: Stable row keys. Defaults to the row positions, which are
+                only stable while the row order is.
+            strata: Optional labels for exact per-stratum proportions.
+
+        Returns:
+            ``[train_0, test_0, train_1, test_1, ...]``.
+        """
+        import numpy as np
+
+        if not arrays:
+            raise ValueError("split() needs at least one array")
+        converted = [np.asarray(array) for array in arrays]
+        length = len(converted[0])
+        if any(len(array) != length for array in converted):
+            raise ValueError("All arrays must have the same length")
+        test = self.mask(np.arange(length) if keys is None else keys, strata)
+        if len(test) != length:
+            raise ValueError(f"Got {len(test)} keys for {length} rows")
+        result: List[Any] = []
+        for array in converted:
+            result.extend((array[~test], array[test]))
+        return result
+
+    def filter(self, rows: Iterable[Any], key: Callable[[Any], Any], split: str = "train") -> Iterator[Any]:
+        """Lazily yield the rows of one split from a stream.
+
+        Args:
+            rows: Rows to filter, read lazily.
+            key: Function returning the stable key of a row.
+            split: ``"train"`` or ``"test"``.
+
+        Yields:
+            Rows of the requested split, in input order.
+        """
+        if split not in ("train", "test"):
+            raise ValueError(f"split must be 'train' or 'test', got {split!r}")
+        want_test = split == "test"
+        for row in rows:
+            if self.is_test(key(row)) == want_test:
+                yield row
+
+    def __repr__(self) -> str:
+        return f"<HashSplit(test_size={self.test_size}, seed={self.seed})>"
+
+
+def train_test_split(
+    *arrays: Any,
+    keys: Any = None,
+    test_size: float = 0.2,
+    seed: Optional[int] = None,
+    strata: Any = None,
+) -> List[Any]:
+    """Split arrays with a ``HashSplit``; see ``HashSplit.split``.
+
+    Returns:
+        ``[train_0, test_0, train_1, test_1, ...]``.
+    """
+    return HashSplit(test_size, seed).split(*arrays, keys=keys, strata=strata)
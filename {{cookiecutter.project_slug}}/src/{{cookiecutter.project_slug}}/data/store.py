@@ -0,0 +1,401 @@
+"""Memory-mapped columnar storage for processed datasets.
+
+A store is a directory with one ``.npy`` file per column and a
+``schema.json`` index recording the row count and, for every column, its
+dtype, per-row shape, file name and data offset::
+
+    processed/features/
+        schema.json
+        label.0.npy
+        embedding.0.npy
+
+``ColumnStore`` opens the columns as read-only ``np.memmap`` views at the
+recorded offsets, so reading is zero-copy and any number of worker
+processes opening the same store share one copy of the data through the
+page cache. A store pickles as its path, which makes it cheap to hand to a
+``ParallelExecutor``: workers re-map the files instead of receiving copies.
+
+``StoreWriter`` appends batches of equal-length columns without holding the
+dataset in memory. Every column file reserves a header large enough for any
+row count, so data starts on a 64-byte boundary and the final header is
+written in place on ``close()``. Rewriting a store writes a new generation
+of column files (``label.1.npy``) and atomically replaces ``schema.json``
+before the previous generation is deleted, so a reader sees either the old
+or the new store, never a mix; views mapped before the switch stay valid.
+
+Example:
+    >>> with StoreWriter("data/processed/features") as writer:
+    ...     for batch in pipeline:
+    ...         writer.append({"label": batch.labels, "embedding": batch.vectors})
+    >>> store = ColumnStore("data/processed/features")
+    >>> store["embedding"][:10].mean()
+"""
+
+import json
+import os
+import re
+import struct
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+SCHEMA_FILE = "schema.json"
+FORMAT_VERSION = 1
+
+_NAME = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9_.-]*$")
+_MAGIC = b"\x93NUMPY\x01\x00"
+# Row count used to size the reserved header of a column being written
+_MAX_ROWS = 10 ** 18
+
+
+def _npy_header(dtype: Any, shape: Tuple[int, ...], size: Optional[int] = None) -> bytes:
+    """Build a version 1.0 ``.npy`` header, padded to ``size`` bytes.
+
+    Without ``size`` the header is padded to the next multiple of 64, as
+    ``np.save`` does, so the data that follows is aligned.
+    """
+    from numpy.lib import format as npy_format
+
+    text = repr({"descr": npy_format.dtype_to_descr(dtype), "fortran_order": False, "shape": shape})
+    used = len(_MAGIC) + 2 + len(text) + 1
+    if size is None:
+        size = -(-used // 64) * 64
+    if used > size or size - len(_MAGIC) - 2 > 0xFFFF:
+        raise ValueError(f"Header for dtype {dtype} does not fit in {size} bytes")
+    return (
+        _MAGIC
+        + struct.pack("<H", size - len(_MAGIC) - 2)
+        + text.encode("latin1")
+        + b" " * (size - used)
+        + b"\n"
+    )
+
+
+def _check_name(name: str) -> str:
+    if not _NAME.match(name) or name == Path(SCHEMA_FILE).stem:
+        raise ValueError(f"Invalid column name {name!r}; use letters, digits, '_', '.' and '-'")
+    return name
+
+
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2)
+    os.replace(tmp_name, path)
+
+
+class _ColumnFile:
+    """A column being written to a temporary file."""
+
+    def __init__(self, directory: Path, name: str, dtype: Any, row_shape: Tuple[int, ...]):
+        self.name = name
+        self.dtype = dtype
+        self.row_shape = row_shape
+        self.rows = 0
+        self.offset = len(_npy_header(dtype, (_MAX_ROWS, *row_shape)))
+        fd, self.tmp_name = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+        self.handle: IO[bytes] = os.fdopen(fd, "wb")
+        self.handle.write(b"\0" * self.offset)
+
+    def write(self, array: Any) -> None:
+        array.tofile(self.handle)
+        self.rows += len(array)
+
+    def finish(self) -> None:
+        self.handle.seek(0)
+        self.handle.write(_npy_header(self.dtype, (self.rows, *self.row_shape), self.offset))
+        self.handle.close()
+
+    def discard(self) -> None:
+        self.handle.close()
+        try:
+            os.unlink(self.tmp_name)
+        except FileNotFoundError:
+            pass
+
+
+class StoreWriter:
+    """Append batches of columns to a new store, replacing any existing one.
+
+    The first ``append`` fixes the column names, per-row shapes and any
+    dtypes not given up front; later batches must have the same columns and
+    are cast to the column dtype when that loses no information (e.g. int32
+    into an int64 column). Give string columns a wide enough dtype in
+    ``dtypes``, since a fixed-width string column cannot grow.
+
+    Attributes:
+        directory (Path): Directory of the store.
+        metadata (Dict[str, Any]): JSON-serialisable metadata saved in the
+            schema.
+        num_rows (int): Rows appended so far.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        metadata: Optional[Mapping[str, Any]] = None,
+        dtypes: Optional[Mapping[str, Any]] = None,
+    ):
+        """Prepare a writer; nothing is written before the first ``append``.
+
+        Args:
+            directory: Directory of the store; created if needed.
+            metadata: JSON-serialisable metadata saved in the schema.
+            dtypes: Dtypes of columns, overriding those of the first batch.
+        """
+        self.directory = Path(directory)
+        self.metadata = dict(metadata or {})
+        self._dtypes = dict(dtypes or {})
+        self.num_rows = 0
+        self._files: Dict[str, _ColumnFile] = {}
+        self._started = False
+        self._closed = False
+
+    def append(self, columns: Mapping[str, Any]) -> None:
+        """Append one batch of equal-length columns.
+
+        Args:
+            columns: Mapping of column name to array-like with one entry per
+                row along the first axis.
+
+        Raises:
+            ValueError: If the columns differ from the first batch, have
+                different lengths, use object dtype or cannot be cast.
+        """
+        import numpy as np
+
+        if self._closed:
+            raise ValueError("StoreWriter is closed")
+        arrays = {name: np.asarray(values) for name, values in columns.items()}
+        lengths = {len(array) if array.ndim else -1 for array in arrays.values()}
+        if len(lengths) > 1 or -1 in lengths:
+            raise ValueError(f"Columns must be arrays of equal length, got lengths {sorted(lengths)}")
+
+        if not self._started:
+            layout = {}
+            for name, array in arrays.items():
+                _check_name(name)
+                dtype = np.dtype(self._dtypes.get(name, array.dtype))
+                if dtype.hasobject:
+                    raise ValueError(f"Column {name!r} has object dtype, which cannot be memory-mapped")
+                layout[name] = (dtype, array.shape[1:])
+        else:
+            if set(arrays) != set(self._files):
+                raise ValueError(f"Batch columns {sorted(arrays)} differ from {sorted(self._files)}")
+            layout = {name: (column.dtype, column.row_shape) for name, column in self._files.items()}
+
+        # Validate the whole batch first so a bad column never leaves the others longer
+        for name, array in arrays.items():
+            dtype, row_shape = layout[name]
+            if array.shape[1:] != row_shape:
+                raise ValueError(f"Column {name!r} rows have shape {array.shape[1:]}, expected {row_shape}")
+            if array.dtype != dtype:
+                if not np.can_cast(array.dtype, dtype, "safe"):
+                    raise ValueError(f"Cannot cast column {name!r} from {array.dtype} to {dtype}")
+                arrays[name] = array.astype(dtype)
+
+        if not self._started:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for name, (dtype, row_shape) in layout.items():
+                self._files[name] = _ColumnFile(self.directory, name, dtype, row_shape)
+            self._started = True
+        for name, array in arrays.items():
+            self._files[name].write(np.ascontiguousarray(array))
+        self.num_rows += lengths.pop() if lengths else 0
+
+    def close(self) -> "ColumnStore":
+        """Finalise the column files, publish the schema and open the store.
+
+        Returns:
+            The written store.
+        """
+        if not self._closed:
+            self._closed = True
+            self.directory.mkdir(parents=True, exist_ok=True)
+            schema_path = self.directory / SCHEMA_FILE
+            previous: Dict[str, Any] = {}
+            if schema_path.exists():
+                with open(schema_path, encoding="utf-8") as handle:
+                    previous = json.load(handle)
+            generation = previous.get("generation", -1) + 1
+            schema: Dict[str, Any] = {
+                "version": FORMAT_VERSION,
+                "generation": generation,
+                "num_rows": self.num_rows,
+                "columns": {},
+                "metadata": self.metadata,
+            }
+            for name, column in self._files.items():
+                column.finish()
+                path = self.directory / f"{name}.{generation}.npy"
+                os.replace(column.tmp_name, path)
+                schema["columns"][name] = {
+                    "file": path.name,
+                    "dtype": column.dtype.str if column.dtype.fields is None else column.dtype.descr,
+                    "shape": list(column.row_shape),
+                    "offset": column.offset,
+                }
+            _write_json(schema_path, schema)
+            for file_name in {spec["file"] for spec in previous.get("columns", {}).values()}:
+                try:
+                    (self.directory / file_name).unlink()
+                except FileNotFoundError:
+                    pass
+        return ColumnStore(self.directory)
+
+    def abort(self) -> None:
+        """Discard everything written; an existing store is left untouched."""
+        self._closed = True
+        for column in self._files.values():
+            column.discard()
+
+    def __enter__(self) -> "StoreWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_store(
+    directory: Union[str, Path],
+    columns: Mapping[str, Any],
+    metadata: Optional[Mapping[str, Any]] = None,
+    dtypes: Optional[Mapping[str, Any]] = None,
+) -> "ColumnStore":
+    """Write in-memory columns as a store and open it.
+
+    Args:
+        directory: Directory of the store; an existing store is replaced.
+        columns: Mapping of column name to array-like of equal length.
+        metadata: JSON-serialisable metadata saved in the schema.
+        dtypes: Dtypes of columns, overriding those inferred from the data.
+
+    Returns:
+        The written store.
+    """
+    writer = StoreWriter(directory, metadata, dtypes)
+    try:
+        writer.append(columns)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
+
+
+class ColumnStore:
+    """Read-only, zero-copy view of a store written by ``StoreWriter``.
+
+    Columns are memory-mapped on first access and cached. Slicing a column
+    returns a view; only the pages that are read are loaded.
+
+    Attributes:
+        directory (Path): Directory of the store.
+        schema (Dict[str, Any]): Parsed ``schema.json``.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """Open the store in ``directory``.
+
+        Raises:
+            FileNotFoundError: If the directory has no ``schema.json``.
+            ValueError: If the schema version is not supported.
+        """
+        self.directory = Path(directory)
+        with open(self.directory / SCHEMA_FILE, encoding="utf-8") as handle:
+            self.schema: Dict[str, Any] = json.load(handle)
+        if self.schema.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported store version {self.schema.get('version')!r} in {self.directory}")
+        self._columns: Dict[str, Any] = {}
+
+    @property
+    def num_rows(self) -> int:
+        """Number of rows in every column."""
+        return int(self.schema["num_rows"])
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names in the order they were written."""
+        return list(self.schema["columns"])
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Metadata saved with the store."""
+        return dict(self.schema.get("metadata", {}))
+
+    def column(self, name: str) -> Any:
+        """Return a read-only memory-mapped view of a column.
+
+        Raises:
+            KeyError: If the column does not exist.
+            ValueError: If the column file is shorter than the schema says.
+        """
+        view = self._columns.get(name)
+        if view is not None:
+            return view
+        import numpy as np
+
+        spec = self.schema["columns"][name]
+        descr = spec["dtype"]
+        dtype = np.dtype(descr if isinstance(descr, str) else [tuple(field) for field in descr])
+        shape = (self.num_rows, *spec["shape"])
+        path = self.directory / spec["file"]
+        expected = spec["offset"] + dtype.itemsize * int(np.prod(shape))
+        if path.stat().st_size < expected:
+            raise ValueError(f"Column file {path} is truncated")
+        if expected == spec["offset"]:
+            # np.memmap cannot map zero bytes
+            view = np.empty(shape, dtype)
+            view.flags.writeable = False
+        else:
+            view = np.memmap(path, dtype=dtype, mode="r", offset=spec["offset"], shape=shape)
+        self._columns[name] = view
+        return view
+
+    def __getitem__(self, name: str) -> Any:
+        return self.column(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.schema["columns"]
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def read(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Return views of rows ``start:stop`` of the selected columns.
+
+        Args:
+            columns: Column names. Defaults to all columns.
+            start: First row.
+            stop: End row (exclusive). Defaults to the last row.
+
+        Returns:
+            Mapping of column name to a zero-copy view.
+        """
+        names = self.columns if columns is None else list(columns)
+        return {name: self.column(name)[start:stop] for name in names}
+
+    def batches(self, batch_size: int, columns: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield views of consecutive batches of ``batch_size`` rows.
+
+        Raises:
+            ValueError: If ``batch_size`` is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        for start in range(0, self.num_rows, batch_size):
+            yield self.read(columns, start, start + batch_size)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Workers re-map the files instead of receiving copies of the data
+        return (ColumnStore, (str(self.directory),))
+
+    def __repr__(self) -> str:
+        return f"<ColumnStore(directory={str(self.directory)!r}, rows={self.num_rows}, columns={self.columns})>"
@@ -0,0 +1,46 @@
+"""Database access for {{ cookiecutter.project_name }}."""
+
+from .async_session import (
+    AsyncSessionLocal,
+    dispose_async_engine,
+    get_async_db,
+    get_async_engine,
+    get_async_pool_metrics,
+)
+from .bulk import bulk_insert, bulk_upsert, stream_columns, stream_rows
+from .session import (
+    Base,
+    RoutingSession,
+    SessionLocal,
+    dispose_engine,
+    get_db,
+    get_engine,
+    get_pool_metrics,
+    get_read_db,
+    get_read_engine,
+    get_replica_engines,
+    session_scope,
+)
+
+__all__ = [
+    'AsyncSessionLocal',
+    'dispose_async_engine',
+    'get_async_db',
+    'get_async_engine',
+    'get_async_pool_metrics',
+    'Base',
+    'bulk_insert',
+    'bulk_upsert',
+    'RoutingSession',
+    'SessionLocal',
+    'dispose_engine',
+    'get_db',
+    'get_engine',
+    'get_pool_metrics',
+    'get_read_db',
+    'get_read_engine',
+    'get_replica_engines',
+    'session_scope',
+    'stream_columns',
+    'stream_rows',
+]
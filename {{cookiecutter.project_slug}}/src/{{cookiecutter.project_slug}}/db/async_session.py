@@ -0,0 +1,147 @@
+"""Async database session management.
+
+Mirrors :mod:`.session` for asyncio code: the engine is created lazily from
+the same ``Settings`` pool options, re-created after a fork, and sessions are
+handed out by the ``get_async_db()`` dependency. The async URL is taken from
+``ASYNC_DATABASE_URI`` or derived from ``DATABASE_URI`` by swapping in an
+async driver (``asyncpg`` for PostgreSQL, ``aiosqlite`` for SQLite).
+
+Async pools hold connections tied to the event loop that opened them; call
+``await dispose_async_engine()`` before switching loops (e.g. between
+``asyncio.run()`` calls).
+"""
+
+import os
+import threading
+from typing import Any, AsyncIterator, Dict, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from ..config import get_settings
+from .session import TimedPoolMixin, database_uri, engine_kwargs, pool_metrics
+
+# Async driver used for each backend when the URL names a sync one
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+    "mysql": "aiomysql",
+}
+
+
+class _TimedAsyncQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait times."""
+
+
+_async_engine: Optional[AsyncEngine] = None
+_async_engine_pid: Optional[int] = None
+_async_engine_lock = threading.Lock()
+
+
+def to_async_url(url: str) -> str:
+    """Return ``url`` with the async driver for its backend.
+
+    URLs that already name an async driver are returned unchanged.
+
+    Args:
+        url: Database URL, e.g. ``postgresql://user@host/db``.
+
+    Returns:
+        The URL rendered with its async driver, e.g.
+        ``postgresql+asyncpg://user@host/db``.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None or parsed.get_driver_name() in ASYNC_DRIVERS.values():
+        return url
+    return parsed.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+
+def _async_database_uri() -> str:
+    return get_settings().ASYNC_DATABASE_URI or to_async_url(database_uri())
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return the async engine for the current process, creating it on first use.
+
+    Returns:
+        The process-local SQLAlchemy ``AsyncEngine``.
+    """
+    global _async_engine, _async_engine_pid
+    pid = os.getpid()
+    if _async_engine is None or _async_engine_pid != pid:
+        with _async_engine_lock:
+            if _async_engine is None or _async_engine_pid != pid:
+                if _async_engine is not None:
+                    # Inherited from the parent: forget its connections
+                    # without closing sockets the parent is still using.
+                    _async_engine.sync_engine.dispose(close=False)
+                url = _async_database_uri()
+                _async_engine = create_async_engine(
+                    url, **engine_kwargs(url, poolclass=_TimedAsyncQueuePool)
+                )
+                _async_engine_pid = pid
+    return _async_engine
+
+
+async def dispose_async_engine() -> None:
+    """Close the pooled connections and drop the async engine.
+
+    The next ``get_async_engine()`` call builds a new engine from the current
+    settings.
+    """
+    global _async_engine, _async_engine_pid
+    engine, pid = _async_engine, _async_engine_pid
+    _async_engine = None
+    _async_engine_pid = None
+    if engine is not None and pid == os.getpid():
+        await engine.dispose()
+
+
+def get_async_pool_metrics() -> Dict[str, Any]:
+    """Report async connection pool usage.
+
+    Returns:
+        The same keys as :func:`.session.get_pool_metrics`, for the async
+        engine. Empty if no async engine has been created in this process.
+    """
+    if _async_engine is None or _async_engine_pid != os.getpid():
+        return {}
+    return pool_metrics(_async_engine.pool)
+
+
+class _AsyncEngineSessionMaker(async_sessionmaker):
+    """async_sessionmaker binding each new session to the current process's engine."""
+
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        local_kw.setdefault("bind", get_async_engine())
+        session: AsyncSession = super().__call__(**local_kw)
+        return session
+
+
+# Create a configured "AsyncSession" class
+AsyncSessionLocal = _AsyncEngineSessionMaker(
+    autoflush=False,
+    expire_on_commit=False,  # Attributes stay readable without awaiting a refresh
+)
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency function that yields async database sessions.
+
+    Yields:
+        AsyncSession: An async database session, closed after use.
+    """
+    db = AsyncSessionLocal()
+    try:
+        yield db
+    finally:
+        await db.close()
@@ -0,0 +1,228 @@
+"""Batched writes and streaming reads.
+
+The ORM unit of work builds, tracks and flushes one object per row, which
+dominates the cost of loading large datasets. The helpers here bypass it:
+
+* ``bulk_insert`` / ``bulk_upsert`` send rows in fixed-size batches through a
+  single executemany per batch (rendered as multi-row ``INSERT ... VALUES``
+  by SQLAlchemy's insertmanyvalues on PostgreSQL and SQLite).
+* ``stream_rows`` / ``stream_columns`` read through a server-side cursor
+  (``stream_results``/``yield_per``), so only one batch of rows is held in
+  memory at a time.
+
+All helpers accept a ``Session`` or a ``Connection`` and run inside its
+current transaction; committing is left to the caller.
+"""
+
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from sqlalchemy import Table, insert
+from sqlalchemy.engine import Connection, Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Executable
+
+DEFAULT_BATCH_SIZE = 1000
+
+Executor = Union[Session, Connection]
+
+
+def _table(target: Any) -> Table:
+    """Return the Table behind ``target`` (a Table or a mapped class)."""
+    table = getattr(target, "__table__", target)
+    if not isinstance(table, Table):
+        raise TypeError(f"Expected a Table or mapped class, got {target!r}")
+    return table
+
+
+def _dialect_name(executor: Executor) -> str:
+    bind = executor.get_bind() if isinstance(executor, Session) else executor
+    return bind.dialect.name
+
+
+def iter_batches(rows: Iterable[Mapping[str, Any]], batch_size: int) -> Iterator[List[Mapping[str, Any]]]:
+    """Yield lists of at most ``batch_size`` rows, consuming ``rows`` lazily."""
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def bulk_insert(
+    executor: Executor,
+    target: Any,
+    rows: Iterable[Mapping[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Insert rows in batches without going through the ORM unit of work.
+
+    Args:
+        executor: Session or Connection to execute on.
+        target: Table or mapped class to insert into.
+        rows: Iterable of column-name to value mappings. It is consumed
+            lazily, one batch at a time.
+        batch_size: Number of rows sent per executemany.
+
+    Returns:
+        The number of rows inserted.
+    """
+    statement = insert(_table(target))
+    count = 0
+    for batch in iter_batches(rows, batch_size):
+        executor.execute(statement, batch)
+        count += len(batch)
+    return count
+
+
+def _upsert_statement(
+    dialect: str,
+    table: Table,
+    index_elements: Sequence[str],
+    update_columns: Sequence[str],
+) -> Any:
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
+            statement: Any = postgresql_insert(table)
+        else:
+            from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+            statement = sqlite_insert(table)
+        if not update_columns:
+            return statement.on_conflict_do_nothing(index_elements=list(index_elements))
+        return statement.on_conflict_do_update(
+            index_elements=list(index_elements),
+            set_={name: statement.excluded[name] for name in update_columns},
+        )
+    if dialect in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        statement = mysql_insert(table)
+        if not update_columns:
+            # Assigning a key column to itself turns the insert into a no-op
+            update_columns = list(index_elements[:1])
+        return statement.on_duplicate_key_update(
+            {name: statement.inserted[name] for name in update_columns}
+        )
+    raise ValueError(f"upsert is not supported for dialect {dialect!r}")
+
+
+def bulk_upsert(
+    executor: Executor,
+    target: Any,
+    rows: Iterable[Mapping[str, Any]],
+    index_elements: Optional[Sequence[str]] = None,
+    update_columns: Optional[Sequence[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Insert rows in batches, updating the rows that already exist.
+
+    Supported on PostgreSQL and SQLite (``ON CONFLICT``) and MySQL/MariaDB
+    (``ON DUPLICATE KEY UPDATE``; conflicts are detected on any unique key).
+
+    Args:
+        executor: Session or Connection to execute on.
+        target: Table or mapped class to write to.
+        rows: Iterable of column-name to value mappings. Every row must have
+            the same keys.
+        index_elements: Columns of the unique constraint that detects
+            conflicts. Defaults to the primary key.
+        update_columns: Columns overwritten on conflict. Defaults to every
+            other column of the first row; pass an empty sequence to skip
+            conflicting rows instead.
+        batch_size: Number of rows sent per executemany.
+
+    Returns:
+        The number of rows sent (inserted or updated).
+    """
+    table = _table(target)
+    if index_elements is None:
+        index_elements = [column.name for column in table.primary_key.columns]
+    if not index_elements:
+        raise ValueError(f"Table {table.name!r} has no primary key; pass index_elements")
+    dialect = _dialect_name(executor)
+
+    statement = None
+    count = 0
+    for batch in iter_batches(rows, batch_size):
+        if statement is None:
+            if update_columns is None:
+                update_columns = [name for name in batch[0] if name not in index_elements]
+            statement = _upsert_statement(dialect, table, index_elements, update_columns)
+        executor.execute(statement, batch)
+        count += len(batch)
+    return count
+
+
+def stream_rows(
+    executor: Executor,
+    statement: Executable,
+    params: Optional[Mapping[str, Any]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Row]:
+    """Iterate over the rows of a query through a server-side cursor.
+
+    Args:
+        executor: Session or Connection to execute on.
+        statement: Query to run, e.g. ``select(table)``.
+        params: Bound parameter values.
+        batch_size: Number of rows fetched from the cursor at a time.
+
+    Yields:
+        Result rows; at most ``batch_size`` of them are buffered.
+    """
+    result = executor.execute(
+        statement,
+        params,
+        execution_options={"stream_results": True, "yield_per": batch_size},
+    )
+    try:
+        yield from result
+    finally:
+        result.close()
+
+
+def stream_columns(
+    executor: Executor,
+    statement: Executable,
+    params: Optional[Mapping[str, Any]] = None,
+    batch_size: int = 10_000,
+    dtypes: Optional[Mapping[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Read a query as columnar NumPy chunks through a server-side cursor.
+
+    Args:
+        executor: Session or Connection to execute on.
+        statement: Column query to run, e.g. ``select(table.c.x, table.c.y)``.
+        params: Bound parameter values.
+        batch_size: Maximum number of rows per chunk.
+        dtypes: Optional NumPy dtype per column name; other columns use the
+            dtype NumPy infers.
+
+    Yields:
+        Dicts mapping each column name to a 1-D array of up to
+        ``batch_size`` values.
+    """
+    import numpy as np
+
+    dtypes = dtypes or {}
+    result = executor.execute(
+        statement,
+        params,
+        execution_options={"stream_results": True, "yield_per": batch_size},
+    )
+    try:
+        names = list(result.keys())
+        for partition in result.partitions(batch_size):
+            columns = zip(*partition)
+            yield {
+                name: np.asarray(values, dtype=dtypes.get(name))
+                for name, values in zip(names, columns)
+            }
+    finally:
+        result.close()
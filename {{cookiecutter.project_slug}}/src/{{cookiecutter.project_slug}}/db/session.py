@@ -1,25 +1,268 @@
-"""Database session management."""
+"""Database session management.
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+Engines are created lazily on first use from the pool settings in
+``Settings`` and are re-created in a child process after a fork, so
+process-pool workers never share connections with their parent.
 
-from ..config import settings
+When ``DATABASE_REPLICA_URIS`` is set, every replica gets its own engine and
+pool. Sessions opened with ``read_only=True`` (``get_read_db()``,
+``session_scope(read_only=True)``) send their queries to one replica, picked
+per session by ``DB_REPLICA_STRATEGY``; flushes and INSERT/UPDATE/DELETE
+statements always go to the primary.
+"""
+
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import Delete, Insert, Update, create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from ..config import get_settings
+
+
+class TimedPoolMixin:
+    """Record how long pool checkouts wait for a connection.
+
+    Mix it in before the pool class, as ``_TimedQueuePool`` does.
+    """
+
+    checkouts = 0
+    wait_time_total = 0.0
+    wait_time_max = 0.0
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        finally:
+            waited = time.perf_counter() - start
+            self.checkouts += 1
+            self.wait_time_total += waited
+            if waited > self.wait_time_max:
+                self.wait_time_max = waited
+
+
+class _TimedQueuePool(TimedPoolMixin, QueuePool):
+    """QueuePool that records checkout wait times."""
+
+
+_engine: Optional[Engine] = None
+_replica_engines: List[Engine] = []
+_engine_pid: Optional[int] = None
+_engine_lock = threading.Lock()
+_replica_counter = itertools.count()
+
+REPLICA_STRATEGIES = ("round_robin", "least_connections")
+
+
+def engine_kwargs(url: str, poolclass: type = _TimedQueuePool) -> Dict[str, Any]:
+    """Build ``create_engine`` arguments for ``url`` from the pool settings.
+
+    Args:
+        url: Database URL the engine connects to.
+        poolclass: Pool class used for sized (non in-memory) databases.
+
+    Returns:
+        Keyword arguments for ``create_engine`` or ``create_async_engine``.
+    """
+    settings = get_settings()
+    parsed = make_url(url)
+    kwargs: Dict[str, Any] = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    # In-memory SQLite uses a per-thread singleton pool without sizing
+    if not (parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")):
+        kwargs.update(
+            poolclass=poolclass,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    if settings.DB_STATEMENT_TIMEOUT_MS and parsed.get_backend_name() == "postgresql":
+        timeout = str(int(settings.DB_STATEMENT_TIMEOUT_MS))
+        if parsed.get_driver_name() == "asyncpg":
+            kwargs["connect_args"] = {"server_settings": {"statement_timeout": timeout}}
+        else:
+            kwargs["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return kwargs
+
+
+def database_uri() -> str:
+    """Return ``DATABASE_URI``.
+
+    Raises:
+        RuntimeError: If ``DATABASE_URI`` is not configured.
+    """
+    uri = get_settings().DATABASE_URI
+    if uri is None:
+        raise RuntimeError("DATABASE_URI is not set; configure it or the POSTGRES_* settings")
+    return uri
+
+
+def _ensure_engines() -> Engine:
+    """Create the primary and replica engines for the current process.
+
+    Returns:
+        The primary engine.
+    """
+    global _engine, _replica_engines, _engine_pid
+    pid = os.getpid()
+    engine = _engine
+    if engine is not None and _engine_pid == pid:
+        return engine
+    with _engine_lock:
+        if _engine is None or _engine_pid != pid:
+            if _engine is not None:
+                # Inherited from the parent: drop its connections without
+                # closing sockets the parent is still using.
+                for inherited in [_engine, *_replica_engines]:
+                    inherited.dispose(close=False)
+            uri = database_uri()
+            _engine = create_engine(uri, **engine_kwargs(uri))
+            _replica_engines = [
+                create_engine(replica_uri, **engine_kwargs(replica_uri))
+                for replica_uri in get_settings().DATABASE_REPLICA_URIS or []
+            ]
+            _engine_pid = pid
+        return _engine
+
+
+def get_engine() -> Engine:
+    """Return the primary engine for the current process, creating it on first use.
+
+    Returns:
+        The process-local SQLAlchemy engine.
+    """
+    return _ensure_engines()
+
+
+def get_replica_engines() -> List[Engine]:
+    """Return the replica engines for the current process.
+
+    Returns:
+        One engine per entry of ``DATABASE_REPLICA_URIS``, in order.
+    """
+    _ensure_engines()
+    return list(_replica_engines)
+
+
+def get_read_engine() -> Engine:
+    """Pick the engine for a read-only session.
+
+    ``round_robin`` cycles through the replicas; ``least_connections`` picks
+    the replica with the fewest checked-out connections, breaking ties in
+    round-robin order.
+
+    Returns:
+        A replica engine, or the primary if no replicas are configured.
+    """
+    primary = _ensure_engines()
+    replicas = _replica_engines
+    if not replicas:
+        return primary
+    strategy = get_settings().DB_REPLICA_STRATEGY
+    if strategy not in REPLICA_STRATEGIES:
+        raise ValueError(
+            f"Unknown DB_REPLICA_STRATEGY {strategy!r}; expected one of {REPLICA_STRATEGIES}"
+        )
+    start = next(_replica_counter) % len(replicas)
+    if strategy == "round_robin":
+        return replicas[start]
+    rotated = replicas[start:] + replicas[:start]
+    return min(rotated, key=lambda engine: pool_metrics(engine.pool).get("checked_out", 0))
+
+
+def dispose_engine() -> None:
+    """Close the pooled connections and drop the primary and replica engines.
+
+    The next ``get_engine()`` call builds new engines from the current
+    settings.
+    """
+    global _engine, _replica_engines, _engine_pid
+    with _engine_lock:
+        if _engine is not None and _engine_pid == os.getpid():
+            for engine in [_engine, *_replica_engines]:
+                engine.dispose()
+        _engine = None
+        _replica_engines = []
+        _engine_pid = None
+
+
+def get_pool_metrics() -> Dict[str, Any]:
+    """Report connection pool usage for monitoring.
+
+    Returns:
+        Dict with ``size``, ``checked_out``, ``checked_in`` and ``overflow``
+        connection counts, plus ``checkouts``, ``wait_time_total`` and
+        ``wait_time_max`` (seconds) for sized pools, of the primary engine.
+        With replicas configured, ``replicas`` holds the same metrics for
+        each replica. Empty if no engine has been created in this process yet.
+    """
+    if _engine is None or _engine_pid != os.getpid():
+        return {}
+    metrics = pool_metrics(_engine.pool)
+    if _replica_engines:
+        metrics["replicas"] = [pool_metrics(engine.pool) for engine in _replica_engines]
+    return metrics
+
+
+def pool_metrics(pool: Any) -> Dict[str, Any]:
+    """Return the usage metrics of one pool (see :func:`get_pool_metrics`)."""
+    metrics: Dict[str, Any] = {}
+    if isinstance(pool, QueuePool):
+        metrics.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+        )
+    if isinstance(pool, TimedPoolMixin):
+        metrics.update(
+            checkouts=pool.checkouts,
+            wait_time_total=pool.wait_time_total,
+            wait_time_max=pool.wait_time_max,
+        )
+    return metrics
+
+
+class RoutingSession(Session):
+    """Session routing statements between the primary and the replicas.
+
+    Read-write sessions use the primary for everything, so they always read
+    their own writes. Read-only sessions run queries on a single replica
+    chosen when the session first needs a connection; any flush or ORM
+    INSERT/UPDATE/DELETE still goes to the primary. An explicit ``bind``
+    disables routing.
+    """
+
+    def __init__(self, *args: Any, read_only: bool = False, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.read_only = read_only
+        self._replica: Optional[Engine] = None
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Any:
+        if self.bind is not None:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        if not self.read_only or self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            return get_engine()
+        if self._replica is None:
+            self._replica = get_read_engine()
+        return self._replica
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URI,
-    pool_pre_ping=True,  # Verify the connection before using it
-    pool_recycle=3600,    # Recycle connections after 1 hour
-    pool_size=5,         # Number of connections to keep open
-    max_overflow=10,     # Number of connections to create if pool is exhausted
-)
 
 # Create a configured "Session" class
 SessionLocal = sessionmaker(
+    class_=RoutingSession,
     autocommit=False,
     autoflush=False,
-    bind=engine,
     expire_on_commit=False,  # Prevent attribute refresh issues
 )
 
@@ -27,10 +270,10 @@ SessionLocal = sessionmaker(
 Base = declarative_base()
 
 
-def get_db() -> SessionLocal:
+def get_db() -> Iterator[Session]:
     """
     Dependency function that yields database sessions.
-    
+
     Yields:
         Session: A database session.
     """
@@ -39,3 +282,59 @@ def get_db() -> SessionLocal:
         yield db
     finally:
         db.close()
+
+
+def get_read_db() -> Iterator[Session]:
+    """
+    Dependency function that yields read-only database sessions.
+
+    Queries run on a replica when replicas are configured.
+
+    Yields:
+        Session: A read-only database session.
+    """
+    db = SessionLocal(read_only=True)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# The session opened by the innermost session_scope() of the current context
+_current_session: ContextVar[Optional[RoutingSession]] = ContextVar("current_session", default=None)
+
+
+@contextmanager
+def session_scope(read_only: bool = False) -> Iterator[Session]:
+    """Provide a transactional session, reusing the one already open in this context.
+
+    A nested scope reuses the enclosing session unless it needs to write and
+    the enclosing one is read-only; only the outermost scope commits (or
+    rolls back on error) and closes it.
+
+    Example:
+        >>> with session_scope() as db:
+        ...     db.add(item)
+        ...     load_related(item)  # its session_scope() reuses ``db``
+
+    Args:
+        read_only: Whether the session only reads and may use a replica.
+
+    Yields:
+        Session: The active database session.
+    """
+    current = _current_session.get()
+    if current is not None and (read_only or not current.read_only):
+        yield current
+        return
+    db = SessionLocal(read_only=read_only)
+    token = _current_session.set(db)
+    try:
+        yield db
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
+    finally:
+        _current_session.reset(token)
+        db.close()
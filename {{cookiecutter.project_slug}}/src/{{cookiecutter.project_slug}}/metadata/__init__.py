@@ -0,0 +1,33 @@
+"""Canonical project metadata for {{ cookiecutter.project_name }}.
+
+``load_metadata()`` reads ``metadata/people.csv``, ``projects.csv`` and
+``deliverables.csv`` into typed records with hash indexes on their primary
+and foreign keys, validating referential integrity in the same pass. The
+parsed form is cached until one of the files changes.
+
+``metadata.sync.sync_metadata()`` mirrors the records into SQL tables,
+writing only the rows whose contents changed. It is imported on demand so
+that reading the metadata does not load SQLAlchemy or the settings.
+"""
+
+from .registry import (
+    RECORD_TYPES,
+    Deliverable,
+    MetadataError,
+    MetadataRegistry,
+    Person,
+    Project,
+    Record,
+    load_metadata,
+)
+
+__all__ = [
+    'RECORD_TYPES',
+    'Deliverable',
+    'MetadataError',
+    'MetadataRegistry',
+    'Person',
+    'Project',
+    'Record',
+    'load_metadata',
+]
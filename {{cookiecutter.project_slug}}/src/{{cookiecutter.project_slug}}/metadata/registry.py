@@ -0,0 +1,543 @@
+"""Indexed, validated view of the canonical metadata CSVs.
+
+``load_metadata()`` parses ``metadata/people.csv``, ``projects.csv`` and
+``deliverables.csv`` once into typed ``__slots__`` records and builds, in
+the same pass:
+
+* a hash index on every primary key (``id``),
+* a hash index on every foreign key (``projects.lead_id``,
+  ``deliverables.project_id``, ``deliverables.owner_id``), mapping a key to
+  the records that reference it, and
+* a list of referential-integrity problems: duplicate or missing ids,
+  unparsable values and foreign keys without a matching row.
+
+Lookups by id are O(1) and joins such as "deliverables of project X with
+their owners" are O(k) in the number of matching rows. Columns beyond the
+known ones are kept as strings in ``record.extra``, so the CSV headers can
+be extended freely.
+
+The parsed registry is cached in memory and pickled to
+``metadata/.cache/registry.pkl``, keyed on the mtime and size of every CSV,
+so repeated loads in one process are free and a new process skips the
+parse until a file changes.
+
+Example:
+    >>> registry = load_metadata()
+    >>> for deliverable, owner in registry.deliverables_with_owners(1):
+    ...     print(deliverable.title, owner.name if owner else "-")
+"""
+
+import csv
+import gc
+import os
+import pickle
+import tempfile
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from ..core import get_project_root
+
+R = TypeVar("R", bound="Record")
+
+_CACHE_VERSION = 1
+
+
+def parse_date(text: str) -> date:
+    """Parse an ISO ``YYYY-MM-DD`` date cell."""
+    return date.fromisoformat(text)
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Suspend the cyclic garbage collector while building many records.
+
+    Records never form cycles, but allocating hundreds of thousands of them
+    would otherwise trigger repeated full collections.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class Record:
+    """Base class of metadata rows.
+
+    Subclasses list their CSV columns in ``fields`` (also their slots),
+    converters for typed columns in ``types`` and their foreign keys as
+    ``column -> (table, required)``. Empty typed cells become None; other
+    cells are kept as strings.
+    """
+
+    __slots__ = ("extra",)
+
+    table: ClassVar[str] = ""
+    file: ClassVar[str] = ""
+    fields: ClassVar[Tuple[str, ...]] = ()
+    types: ClassVar[Dict[str, Callable[[str], Any]]] = {}
+    foreign_keys: ClassVar[Dict[str, Tuple[str, bool]]] = {}
+
+    id: Optional[int]
+
+    def __init__(self, extra: Optional[Dict[str, str]] = None, **values: Any):
+        for name in self.fields:
+            setattr(self, name, values.pop(name, None))
+        if values:
+            raise TypeError(f"Unknown {type(self).__name__} fields: {', '.join(sorted(values))}")
+        self.extra = dict(extra or {})
+
+    @classmethod
+    def from_row(cls: Type[R], row: Dict[str, str]) -> R:
+        """Build a record from a ``csv.DictReader`` row.
+
+        Raises:
+            ValueError: If a typed cell cannot be parsed.
+        """
+        header = [key for key in row if key is not None]
+        return cls.row_parser(header)([row[key] or "" for key in header])
+
+    @classmethod
+    def row_parser(cls: Type[R], header: List[str]) -> Callable[[List[str]], R]:
+        """Return a function building records from ``csv.reader`` rows.
+
+        Column positions and converters are resolved once for ``header``,
+        so parsing a row is a single pass over the known fields.
+
+        Args:
+            header: Column names of the CSV.
+
+        Returns:
+            A function taking a list of cells and returning a record. It
+            raises ``ValueError`` if a typed cell cannot be parsed.
+        """
+        positions = {name: index for index, name in reversed(list(enumerate(header)))}
+        plan = [(name, positions.get(name), cls.types.get(name)) for name in cls.fields]
+        extra_columns = [(index, name) for index, name in enumerate(header) if name not in cls.fields]
+        new = cls.__new__
+
+        def parse(cells: List[str]) -> R:
+            record = new(cls)
+            count = len(cells)
+            for name, index, convert in plan:
+                text = cells[index].strip() if index is not None and index < count else ""
+                if convert is None:
+                    value: Any = text
+                elif text:
+                    try:
+                        value = convert(text)
+                    except ValueError:
+                        raise ValueError(f"invalid {name} {text!r}") from None
+                else:
+                    value = None
+                setattr(record, name, value)
+            record.extra = {name: cells[index] for index, name in extra_columns if index < count}
+            return record
+
+        return parse
+
+    @classmethod
+    def _build(cls: Type[R], values: Tuple[Any, ...], extra: Dict[str, str]) -> R:
+        """Rebuild a record from already-typed ``values`` without checks."""
+        record = cls.__new__(cls)
+        for name, value in zip(cls.fields, values):
+            setattr(record, name, value)
+        record.extra = extra
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the known fields followed by the extra columns."""
+        values = {name: getattr(self, name) for name in self.fields}
+        values.update(self.extra)
+        return values
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __reduce__(self) -> Any:
+        return (_restore, (type(self), tuple(getattr(self, name) for name in self.fields), self.extra))
+
+    def __repr__(self) -> str:
+        label = getattr(self, "name", None) or getattr(self, "title", None)
+        return f"<{type(self).__name__}(id={self.id!r}, {label!r})>"
+
+
+def _restore(cls: Type[R], values: Tuple[Any, ...], extra: Dict[str, str]) -> R:
+    return cls._build(values, extra)
+
+
+class Person(Record):
+    """A row of ``people.csv``."""
+
+    fields = ("id", "name", "email", "affiliation", "orcid", "role", "github", "notes")
+    __slots__ = fields
+    table = "people"
+    file = "people.csv"
+    types = {"id": int}
+
+    name: str
+    email: str
+    affiliation: str
+    orcid: str
+    role: str
+    github: str
+    notes: str
+
+
+class Project(Record):
+    """A row of ``projects.csv``."""
+
+    fields = ("id", "title", "description", "start_date", "end_date", "status", "lead_id", "github_url", "notes")
+    __slots__ = fields
+    table = "projects"
+    file = "projects.csv"
+    types = {"id": int, "lead_id": int, "start_date": parse_date, "end_date": parse_date}
+    foreign_keys = {"lead_id": ("people", False)}
+
+    title: str
+    description: str
+    start_date: Optional[date]
+    end_date: Optional[date]
+    status: str
+    lead_id: Optional[int]
+    github_url: str
+    notes: str
+
+
+class Deliverable(Record):
+    """A row of ``deliverables.csv``."""
+
+    fields = ("id", "project_id", "title", "description", "due_date", "status", "priority", "owner_id", "notes")
+    __slots__ = fields
+    table = "deliverables"
+    file = "deliverables.csv"
+    types = {"id": int, "project_id": int, "owner_id": int, "due_date": parse_date}
+    foreign_keys = {"project_id": ("projects", True), "owner_id": ("people", False)}
+
+    project_id: int
+    title: str
+    description: str
+    due_date: Optional[date]
+    status: str
+    priority: str
+    owner_id: Optional[int]
+    notes: str
+
+
+#: Record types in dependency order: referenced tables come first
+RECORD_TYPES: Tuple[Type[Record], ...] = (Person, Project, Deliverable)
+
+
+class MetadataError(ValueError):
+    """Raised when the metadata CSVs fail validation.
+
+    Attributes:
+        errors (List[str]): Every problem found, as ``file:line: message``.
+    """
+
+    def __init__(self, errors: List[str]):
+        self.errors = list(errors)
+        shown = "\n  ".join(self.errors[:20])
+        more = f"\n  ... and {len(self.errors) - 20} more" if len(self.errors) > 20 else ""
+        super().__init__(f"{len(self.errors)} metadata problem(s):\n  {shown}{more}")
+
+
+class MetadataRegistry:
+    """Parsed metadata tables with primary- and foreign-key indexes.
+
+    Attributes:
+        directory (Path): Directory the CSVs were read from.
+        errors (List[str]): Validation problems found while loading.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.errors: List[str] = []
+        self._tables: Dict[str, Dict[int, Record]] = {}
+        self._indexes: Dict[Tuple[str, str], Dict[int, List[Record]]] = {}
+
+    @classmethod
+    def from_directory(cls, directory: Union[str, Path]) -> "MetadataRegistry":
+        """Parse, index and validate the CSVs in ``directory`` in one pass.
+
+        Missing files load as empty tables. Problems are collected in
+        ``errors`` rather than raised; rows with an unparsable value or a
+        missing or duplicate id are skipped.
+        """
+        registry = cls(directory)
+        with _gc_paused():
+            for record_type in RECORD_TYPES:
+                registry._load_table(record_type)
+        return registry
+
+    def _load_table(self, record_type: Type[Record]) -> None:
+        rows: Dict[int, Record] = {}
+        indexes: Dict[str, Dict[int, List[Record]]] = {column: {} for column in record_type.foreign_keys}
+        self._tables[record_type.table] = rows
+        for column, index in indexes.items():
+            self._indexes[(record_type.table, column)] = index
+
+        path = self.directory / record_type.file
+        if not path.exists():
+            return
+        foreign_keys = [
+            (column, indexes[column], self._tables[target], target, required)
+            for column, (target, required) in record_type.foreign_keys.items()
+        ]
+        with open(path, newline="", encoding="utf-8") as handle:
+            reader = csv.reader(handle)
+            parse = record_type.row_parser(next(reader, []))
+
+            def report(message: str) -> None:
+                self.errors.append(f"{record_type.file}:{reader.line_num}: {message}")
+
+            for cells in reader:
+                if not cells:
+                    continue
+                try:
+                    record = parse(cells)
+                except ValueError as exc:
+                    report(str(exc))
+                    continue
+                key = record.id
+                if key is None:
+                    report("missing id")
+                    continue
+                if key in rows:
+                    report(f"duplicate id {key}")
+                    continue
+                rows[key] = record
+                for column, index, targets, target, required in foreign_keys:
+                    key = getattr(record, column)
+                    if key is None:
+                        if required:
+                            report(f"missing {column}")
+                        continue
+                    if key not in targets:
+                        report(f"{column} {key} does not match any {target} id")
+                    index.setdefault(key, []).append(record)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Records are stored as plain tuples and the indexes are rebuilt on
+        # load, which keeps the cache small and fast to unpickle.
+        tables = {
+            table: [(tuple(getattr(record, name) for name in record.fields), record.extra) for record in rows.values()]
+            for table, rows in self._tables.items()
+        }
+        return {"directory": self.directory, "errors": self.errors, "tables": tables}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["directory"])  # type: ignore[misc]
+        self.errors = state["errors"]
+        with _gc_paused():
+            self._restore_tables(state["tables"])
+
+    def _restore_tables(self, tables: Dict[str, List[Tuple[Tuple[Any, ...], Dict[str, str]]]]) -> None:
+        for record_type in RECORD_TYPES:
+            build = record_type._build
+            rows: Dict[int, Record] = {}
+            self._tables[record_type.table] = rows
+            indexes: List[Tuple[str, Dict[int, List[Record]]]] = [(column, {}) for column in record_type.foreign_keys]
+            for column, index in indexes:
+                self._indexes[(record_type.table, column)] = index
+            for values, extra in tables.get(record_type.table, ()):
+                record = build(values, extra)
+                # Cached tables only hold records that passed the id checks
+                rows[cast(int, record.id)] = record
+                for column, index in indexes:
+                    key = getattr(record, column)
+                    if key is not None:
+                        index.setdefault(key, []).append(record)
+
+    def get(self, table: str, key: int) -> Optional[Record]:
+        """Return the record of ``table`` with primary key ``key``, or None."""
+        return self._tables[table].get(key)
+
+    def records(self, table: str) -> List[Record]:
+        """Return the records of ``table`` in file order."""
+        return list(self._tables[table].values())
+
+    def referencing(self, table: str, column: str, key: int) -> List[Record]:
+        """Return the records of ``table`` whose foreign key ``column`` is ``key``.
+
+        Raises:
+            KeyError: If ``column`` is not a foreign key of ``table``.
+        """
+        return list(self._indexes[(table, column)].get(key, ()))
+
+    def person(self, person_id: int) -> Optional[Person]:
+        """Return the person with ``person_id``, or None."""
+        return self._tables["people"].get(person_id)  # type: ignore[return-value]
+
+    def project(self, project_id: int) -> Optional[Project]:
+        """Return the project with ``project_id``, or None."""
+        return self._tables["projects"].get(project_id)  # type: ignore[return-value]
+
+    def deliverable(self, deliverable_id: int) -> Optional[Deliverable]:
+        """Return the deliverable with ``deliverable_id``, or None."""
+        return self._tables["deliverables"].get(deliverable_id)  # type: ignore[return-value]
+
+    @property
+    def people(self) -> List[Person]:
+        return self.records("people")  # type: ignore[return-value]
+
+    @property
+    def projects(self) -> List[Project]:
+        return self.records("projects")  # type: ignore[return-value]
+
+    @property
+    def deliverables(self) -> List[Deliverable]:
+        return self.records("deliverables")  # type: ignore[return-value]
+
+    def deliverables_for_project(self, project_id: int) -> List[Deliverable]:
+        """Return the deliverables of a project in file order."""
+        return self.referencing("deliverables", "project_id", project_id)  # type: ignore[return-value]
+
+    def deliverables_owned_by(self, person_id: int) -> List[Deliverable]:
+        """Return the deliverables owned by a person in file order."""
+        return self.referencing("deliverables", "owner_id", person_id)  # type: ignore[return-value]
+
+    def projects_led_by(self, person_id: int) -> List[Project]:
+        """Return the projects led by a person in file order."""
+        return self.referencing("projects", "lead_id", person_id)  # type: ignore[return-value]
+
+    def deliverables_with_owners(self, project_id: int) -> List[Tuple[Deliverable, Optional[Person]]]:
+        """Join a project's deliverables with their owners.
+
+        Returns:
+            ``(deliverable, owner)`` pairs; ``owner`` is None when the
+            deliverable has no owner or the owner does not exist.
+        """
+        people = self._tables["people"]
+        pairs: List[Tuple[Deliverable, Optional[Person]]] = []
+        for deliverable in self.deliverables_for_project(project_id):
+            owner = None if deliverable.owner_id is None else people.get(deliverable.owner_id)
+            pairs.append((deliverable, cast(Optional[Person], owner)))
+        return pairs
+
+    def __iter__(self) -> Iterator[Record]:
+        for rows in self._tables.values():
+            yield from rows.values()
+
+    def __len__(self) -> int:
+        return sum(len(rows) for rows in self._tables.values())
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{table}={len(rows)}" for table, rows in self._tables.items())
+        return f"<MetadataRegistry({counts}, errors={len(self.errors)})>"
+
+
+def _file_state(directory: Path) -> Tuple[Any, ...]:
+    """``(mtime_ns, size)`` of every metadata CSV, None for missing files."""
+    state: List[Optional[Tuple[int, int]]] = []
+    for record_type in RECORD_TYPES:
+        path = directory / record_type.file
+        if path.exists():
+            stat = path.stat()
+            state.append((stat.st_mtime_ns, stat.st_size))
+        else:
+            state.append(None)
+    return tuple(state)
+
+
+#: Registries parsed in this process, keyed by resolved directory
+_loaded: Dict[Path, Tuple[Tuple[Any, ...], MetadataRegistry]] = {}
+
+
+def _read_cache(path: Path, state: Tuple[Any, ...]) -> Optional[MetadataRegistry]:
+    try:
+        with open(path, "rb") as handle, _gc_paused():
+            payload = pickle.load(handle)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    if payload.get("version") != _CACHE_VERSION or payload.get("state") != state:
+        return None
+    registry: MetadataRegistry = payload["registry"]
+    return registry
+
+
+def _write_cache(path: Path, state: Tuple[Any, ...], registry: MetadataRegistry) -> None:
+    payload = {"version": _CACHE_VERSION, "state": state, "registry": registry}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+    except OSError:
+        # Caching is an optimisation only; a read-only tree still loads.
+        pass
+
+
+def load_metadata(
+    directory: Union[str, Path, None] = None,
+    strict: bool = True,
+    use_cache: bool = True,
+    cache_dir: Union[str, Path, None] = None,
+) -> MetadataRegistry:
+    """Load the metadata registry, reusing the cached parse when files are unchanged.
+
+    Args:
+        directory: Directory with the CSVs. Defaults to ``metadata/`` under
+            the project root.
+        strict: Raise ``MetadataError`` if validation found problems;
+            otherwise they are left in ``registry.errors``.
+        use_cache: Whether to use the in-process and on-disk caches.
+        cache_dir: Directory of the on-disk cache. Defaults to
+            ``<directory>/.cache``.
+
+    Returns:
+        The loaded registry. Treat it as read-only: it is shared by every
+        caller until a CSV changes.
+
+    Raises:
+        MetadataError: If ``strict`` and the CSVs fail validation.
+    """
+    directory = Path(directory) if directory else get_project_root() / "metadata"
+    key = directory.resolve()
+    state = _file_state(directory)
+
+    registry: Optional[MetadataRegistry] = None
+    if use_cache:
+        cached = _loaded.get(key)
+        if cached is not None and cached[0] == state:
+            registry = cached[1]
+        else:
+            cache_path = Path(cache_dir or directory / ".cache") / "registry.pkl"
+            registry = _read_cache(cache_path, state)
+            if registry is None:
+                registry = MetadataRegistry.from_directory(directory)
+                _write_cache(cache_path, state, registry)
+            _loaded[key] = (state, registry)
+    else:
+        registry = MetadataRegistry.from_directory(directory)
+
+    if strict and registry.errors:
+        raise MetadataError(registry.errors)
+    return registry
@@ -4,18 +4,28 @@ This module contains various utility functions and classes that are used through
 the package. These are not part of the main API but provide supporting functionality.
 """
 
+from .batched_sampler import BatchedSampler
+from .jax_keys import JaxKeyPool
 from .seed_manager import (
+    DEFAULT_SEED_LIBRARIES,
     SeedManager,
     seed_manager,
     set_global_seed,
     get_global_seed,
     get_seed_manager,
+    register_backend,
+    register_state_handler,
 )
 
 __all__ = [
+    'BatchedSampler',
+    'DEFAULT_SEED_LIBRARIES',
+    'JaxKeyPool',
     'SeedManager',
     'seed_manager',
     'set_global_seed',
     'get_global_seed',
     'get_seed_manager',
+    'register_backend',
+    'register_state_handler',
 ]
@@ -0,0 +1,104 @@
+"""Pre-split JAX PRNG keys for independent consumers.
+
+JAX has no global random state: every random call takes an explicit key and
+reusing a key reuses its stream. ``JaxKeyPool`` owns one key per consumer and
+hands out fresh subkeys from batches produced by a single vectorised
+``jax.random.split`` call, so callers never share or reuse a key and the jax
+module itself is never modified.
+"""
+
+from typing import Any, Dict
+
+
+class JaxKeyPool:
+    """Serve fresh JAX PRNG keys from pre-split batches.
+
+    Example:
+        >>> pool = JaxKeyPool(jax.random.PRNGKey(0))
+        >>> x = jax.random.normal(pool.next_key(), (3,))
+        >>> keys = pool.take(8)  # key array for vmap
+
+    Attributes:
+        batch_size: Number of subkeys produced per split.
+    """
+
+    def __init__(self, key: Any, batch_size: int = 1024):
+        """Initialize the pool.
+
+        Args:
+            key: Root PRNG key of this consumer's stream.
+            batch_size: Number of subkeys to pre-split per batch.
+        """
+        import jax
+
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        self._random = jax.random
+        self._key = key
+        self.batch_size = batch_size
+        self._keys: Any = None
+        self._pos = batch_size
+
+    def _split(self, num: int) -> Any:
+        """Advance the root key and split ``num`` fresh subkeys off it."""
+        self._key, subkey = self._random.split(self._key)
+        return self._random.split(subkey, num)
+
+    def next_key(self) -> Any:
+        """Return a single unused key."""
+        if self._pos >= self.batch_size:
+            self._keys = self._split(self.batch_size)
+            self._pos = 0
+        key = self._keys[self._pos]
+        self._pos += 1
+        return key
+
+    def take(self, num: int) -> Any:
+        """Return a key array of ``num`` unused keys.
+
+        Args:
+            num: Number of keys, e.g. the size of a ``vmap``-ed batch.
+
+        Returns:
+            Array of keys with leading dimension ``num``.
+        """
+        if num > self.batch_size:
+            return self._split(num)
+        if self._pos + num > self.batch_size:
+            self._keys = self._split(self.batch_size)
+            self._pos = 0
+        start = self._pos
+        self._pos += num
+        return self._keys[start:self._pos]
+
+    def get_state(self) -> Dict[str, Any]:
+        """Return the root key and batch position as host arrays.
+
+        Returns:
+            Picklable state accepted by ``set_state()``.
+        """
+        import numpy as np
+
+        return {
+            'key': np.asarray(self._key),
+            'keys': None if self._keys is None else np.asarray(self._keys),
+            'pos': self._pos,
+            'batch_size': self.batch_size,
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Resume the pool from a state captured by ``get_state()``.
+
+        Args:
+            state: State dictionary of a pool.
+        """
+        import jax.numpy as jnp
+
+        self._key = jnp.asarray(state['key'])
+        self._keys = None if state['keys'] is None else jnp.asarray(state['keys'])
+        self._pos = state['pos']
+        self.batch_size = state['batch_size']
+
+    def __repr__(self) -> str:
+        """Return a string representation of the pool."""
+        return f"<JaxKeyPool(batch_size={self.batch_size})>"
@@ -2,26 +2,200 @@
 
 This module provides functions to set and get random seeds for various libraries
 that use random number generation, ensuring reproducibility across runs.
+
+Parallel workers get independent, reproducible child streams derived from the
+manager's seed with ``numpy.random.SeedSequence`` spawn keys, via
+``SeedManager.spawn()``, ``SeedManager.worker_init_fn`` for torch DataLoaders
+and ``SeedManager.executor_kwargs()`` for process pools. ``SeedManager.sampler()``
+serves vectorised draws from pre-generated blocks for hot loops, and
+``SeedManager.jax_keys()`` hands out pre-split JAX keys per consumer.
+
+``SeedManager.get_state()``/``set_state()`` checkpoint the actual generator
+state of every seeded backend that has a registered state handler, and
+``state_bytes()`` serialises it compactly so resumed jobs continue their
+random streams instead of replaying them.
+
+``SeedManager.scope()`` binds a manager to the current thread or asyncio task
+through a ``contextvars.ContextVar``. Scoped code draws from the manager's own
+``python_rng``/``numpy_rng`` generators instead of the process-wide ones, so
+concurrent requests stay individually reproducible without any locking.
+
+Frameworks are imported lazily: each backend is registered as a seeding
+function that imports its library only when ``SeedManager.seed_everything()``
+is asked to seed it, so importing this module never pulls in numpy, torch,
+tensorflow or jax.
 """
 
+import multiprocessing
 import os
+import pickle
 import random
-from typing import Optional, Dict, Any
-import numpy as np
-import torch
+import struct
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Any,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .batched_sampler import BatchedSampler
+    from .jax_keys import JaxKeyPool
+
+#: Libraries seeded on behalf of a manager that has seeded none itself;
+#: both are cheap to import, unlike the deep learning frameworks
+DEFAULT_SEED_LIBRARIES = ['python', 'numpy']
+
+#: Tags folded into the JAX root key before the consumer id, so integer
+#: consumers and CRC32s of consumer names never share a stream
+_JAX_INDEXED_CONSUMER = 0
+_JAX_NAMED_CONSUMER = 1
+
+#: Registry of seeding functions keyed by library name. Each function receives
+#: the seed and raises ``ImportError`` if its framework is not installed.
+_BACKENDS: Dict[str, Callable[[int], None]] = {}
+
+#: Functions capturing and restoring the generator state of a backend, keyed
+#: by library name. Captured states must be small picklable objects.
+_STATE_HANDLERS: Dict[str, Tuple[Callable[[], Any], Callable[[Any], None]]] = {}
+
+
+def register_backend(name: str) -> Callable[[Callable[[int], None]], Callable[[int], None]]:
+    """Register a seeding function for a library.
+
+    The decorated function must import its framework inside its body so that
+    the import cost is only paid when the library is actually seeded.
+
+    Args:
+        name: Library name used as key in ``SeedManager.libraries``.
+
+    Returns:
+        Decorator registering the seeding function under ``name``.
+    """
+    def decorator(func: Callable[[int], None]) -> Callable[[int], None]:
+        _BACKENDS[name] = func
+        return func
+    return decorator
+
+
+def register_state_handler(
+    name: str,
+    get_state: Callable[[], Any],
+    set_state: Callable[[Any], None],
+) -> None:
+    """Register functions to checkpoint the generator state of a library.
+
+    Both functions must import their framework lazily, like seeding functions.
+
+    Args:
+        name: Library name, matching the one given to ``register_backend``.
+        get_state: Returns the current generator state as a picklable object.
+        set_state: Restores a state returned by ``get_state``.
+    """
+    _STATE_HANDLERS[name] = (get_state, set_state)
+
+
+@register_backend('python')
+def _seed_python(seed: int) -> None:
+    random.seed(seed)
+
+
+@register_backend('numpy')
+def _seed_numpy(seed: int) -> None:
+    import numpy as np
+
+    np.random.seed(seed)
+
+
+@register_backend('pytorch')
+def _seed_pytorch(seed: int) -> None:
+    import torch
+
+    torch.manual_seed(seed)
+    if torch.cuda.is_available():
+        torch.cuda.manual_seed_all(seed)
+        torch.backends.cudnn.deterministic = True
+        torch.backends.cudnn.benchmark = False
+
 
-# Try to import other common ML libraries
-try:
+@register_backend('tensorflow')
+def _seed_tensorflow(seed: int) -> None:
     import tensorflow as tf
-except ImportError:
-    tf = None
 
-try:
-    import jax
-    import jax.numpy as jnp
-except ImportError:
-    jax = None
-    jnp = None
+    tf.random.set_seed(seed)
+    os.environ['TF_DETERMINISTIC_OPS'] = '1'
+    os.environ['TF_DISABLE_SEGMENT_REDUCTION_OP_DETERMINISM_EXCEPT_WEB_LAYER'] = '1'
+
+
+@register_backend('jax')
+def _seed_jax(seed: int) -> None:
+    # JAX has no global random state to seed; keys come from
+    # SeedManager.jax_keys(), so only check that jax is importable.
+    import jax  # noqa: F401
+
+
+def _get_python_state(rng: Any = random) -> Tuple[int, bytes, Optional[float]]:
+    version, internal, gauss_next = rng.getstate()
+    return version, struct.pack(f'<{len(internal)}I', *internal), gauss_next
+
+
+def _set_python_state(state: Tuple[int, bytes, Optional[float]], rng: Any = random) -> None:
+    version, internal, gauss_next = state
+    words = struct.unpack(f'<{len(internal) // 4}I', internal)
+    rng.setstate((version, words, gauss_next))
+
+
+def _get_numpy_state() -> Tuple[str, bytes, int, int, float]:
+    import numpy as np
+
+    name, keys, pos, has_gauss, cached_gaussian = cast(
+        Tuple[str, 'np.ndarray', int, int, float], np.random.get_state(legacy=True)
+    )
+    return name, keys.astype('<u4').tobytes(), pos, has_gauss, cached_gaussian
+
+
+def _set_numpy_state(state: Tuple[str, bytes, int, int, float]) -> None:
+    import numpy as np
+
+    name, keys, pos, has_gauss, cached_gaussian = state
+    np.random.set_state(
+        (name, np.frombuffer(keys, dtype='<u4'), pos, has_gauss, cached_gaussian)
+    )
+
+
+def _get_pytorch_state() -> Dict[str, Any]:
+    import torch
+
+    state: Dict[str, Any] = {'cpu': torch.get_rng_state().numpy().tobytes()}
+    if torch.cuda.is_available():
+        state['cuda'] = [s.cpu().numpy().tobytes() for s in torch.cuda.get_rng_state_all()]
+    return state
+
+
+def _set_pytorch_state(state: Dict[str, Any]) -> None:
+    import torch
+
+    torch.set_rng_state(torch.frombuffer(bytearray(state['cpu']), dtype=torch.uint8))
+    if 'cuda' in state and torch.cuda.is_available():
+        torch.cuda.set_rng_state_all(
+            [torch.frombuffer(bytearray(s), dtype=torch.uint8) for s in state['cuda']]
+        )
+
+
+register_state_handler('python', _get_python_state, _set_python_state)
+register_state_handler('numpy', _get_numpy_state, _set_numpy_state)
+register_state_handler('pytorch', _get_pytorch_state, _set_pytorch_state)
 
 
 class SeedManager:
@@ -45,17 +219,17 @@ class SeedManager:
         if seed is None:
             seed = random.randint(0, 2**32 - 1)
         self.seed = seed
-        self.libraries: Dict[str, bool] = {
-            'python': False,
-            'numpy': False,
-            'pytorch': False,
-            'tensorflow': False,
-            'jax': False,
-        }
+        self.libraries: Dict[str, bool] = {name: False for name in _BACKENDS}
+        self._jax_pools: Dict[Union[int, str], "JaxKeyPool"] = {}
+        self._python_rng: Optional[random.Random] = None
+        self._numpy_rng: Optional["np.random.Generator"] = None
     
-    def seed_everything(self, libraries: Optional[list] = None) -> Dict[str, bool]:
+    def seed_everything(self, libraries: Optional[List[str]] = None) -> Dict[str, bool]:
         """Set random seeds for specified libraries.
         
+        Each library is imported on demand; libraries that are not installed
+        are skipped.
+        
         Args:
             libraries: List of libraries to seed. If None, all available
                 libraries will be seeded.
@@ -68,61 +242,286 @@ class SeedManager:
             
         results = {}
         
-        if 'python' in libraries and hasattr(random, 'seed'):
-            random.seed(self.seed)
-            self.libraries['python'] = True
-            results['python'] = True
+        for name in libraries:
+            seeder = _BACKENDS.get(name)
+            if seeder is None:
+                continue
+            try:
+                seeder(self.seed)
+            except ImportError:
+                continue
+            self.libraries[name] = True
+            results[name] = True
+            
+        return results
+    
+    def spawn_seed(self, index: int) -> int:
+        """Derive the seed of an independent child stream.
+        
+        Child seeds follow ``numpy.random.SeedSequence(seed).spawn()``: the
+        child with index ``i`` is the sequence with spawn key ``(i,)``, so the
+        same (seed, index) pair yields the same stream on every machine.
+        
+        Args:
+            index: Worker id or task index identifying the child stream.
             
-        if 'numpy' in libraries and np is not None:
-            np.random.seed(self.seed)
-            self.libraries['numpy'] = True
-            results['numpy'] = True
+        Returns:
+            A 32-bit seed for the child stream.
+        """
+        import numpy as np
+
+        if index < 0:
+            raise ValueError(f"Child stream index must be non-negative, got {index}")
+        sequence = np.random.SeedSequence(self.seed, spawn_key=(index,))
+        return int(sequence.generate_state(1)[0])
+    
+    def spawn(self, index: int) -> "SeedManager":
+        """Create a child manager for worker or task ``index``.
+        
+        Args:
+            index: Worker id or task index identifying the child stream.
             
-        if 'pytorch' in libraries and torch is not None:
-            torch.manual_seed(self.seed)
-            if torch.cuda.is_available():
-                torch.cuda.manual_seed_all(self.seed)
-                torch.backends.cudnn.deterministic = True
-                torch.backends.cudnn.benchmark = False
-            self.libraries['pytorch'] = True
-            results['pytorch'] = True
+        Returns:
+            A new, not yet seeded, SeedManager for the child stream.
+        """
+        return SeedManager(self.spawn_seed(index))
+    
+    def worker_init_fn(self, worker_id: int) -> None:
+        """Seed a worker process with its own child stream.
+        
+        Pass the bound method as ``torch.utils.data.DataLoader(...,
+        worker_init_fn=manager.worker_init_fn)``; each worker is seeded with
+        ``spawn(worker_id)`` for the libraries seeded in the parent, or
+        ``DEFAULT_SEED_LIBRARIES`` if it has seeded none.
+        
+        Args:
+            worker_id: Index of the worker, as supplied by the DataLoader.
+        """
+        self.spawn(worker_id).seed_everything(self._seeded_libraries())
+    
+    def executor_kwargs(self, libraries: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Keyword arguments that seed every ``ProcessPoolExecutor`` worker.
+        
+        Each worker process claims the next free index from a shared counter,
+        is seeded with ``spawn(index)`` and uses that child as its global
+        manager, so workers never share a stream. Results are only bitwise
+        reproducible when seeding per task (e.g. with ``spawn(task_index)``),
+        since task-to-worker assignment is not fixed.
+        
+        Example:
+            >>> with ProcessPoolExecutor(4, **manager.executor_kwargs()) as pool:
+            ...     results = list(pool.map(work, items))
+        
+        Args:
+            libraries: Libraries to seed in each worker. Defaults to the
+                libraries seeded by this manager, or
+                ``DEFAULT_SEED_LIBRARIES`` if none.
+        
+        Returns:
+            Dict with ``initializer`` and ``initargs`` entries.
+        """
+        counter = multiprocessing.Value('i', 0)
+        if libraries is None:
+            libraries = self._seeded_libraries()
+        return {
+            'initializer': _init_pool_worker,
+            'initargs': (self.seed, libraries, counter),
+        }
+    
+    def sampler(self, block_size: int = 65536) -> "BatchedSampler":
+        """Create a batched sampler seeded from this manager.
+        
+        The sampler owns a ``numpy.random.Generator`` seeded with ``seed``
+        and is independent of the global ``np.random`` state. Samplers made
+        by the same manager replay the same stream; use
+        ``spawn(i).sampler()`` for independent ones.
+        
+        Args:
+            block_size: Number of samples pre-generated per block.
             
-        if 'tensorflow' in libraries and tf is not None:
-            tf.random.set_seed(self.seed)
-            os.environ['TF_DETERMINISTIC_OPS'] = '1'
-            os.environ['TF_DISABLE_SEGMENT_REDUCTION_OP_DETERMINISM_EXCEPT_WEB_LAYER'] = '1'
-            self.libraries['tensorflow'] = True
-            results['tensorflow'] = True
+        Returns:
+            A BatchedSampler drawing from this manager's seed.
+        """
+        import numpy as np
+
+        from .batched_sampler import BatchedSampler
+
+        return BatchedSampler(np.random.default_rng(self.seed), block_size)
+    
+    def jax_keys(self, consumer: Union[int, str] = 0, batch_size: int = 1024) -> "JaxKeyPool":
+        """Get the JAX key pool of a consumer.
+        
+        Each consumer's stream is ``fold_in(fold_in(PRNGKey(seed), kind), id)``
+        where ``kind`` is 0 for integer consumers and 1 for names, and ``id``
+        is the integer or the CRC32 of the name. Folding in the kind first
+        keeps the two id spaces apart, so a name whose CRC32 equals some
+        integer consumer still gets its own stream. Streams are stable
+        across runs. The pool is created on first use and reused afterwards.
+        
+        Args:
+            consumer: Integer index or name identifying the consumer.
+            batch_size: Number of keys pre-split per batch for a new pool.
             
-        if 'jax' in libraries and jax is not None:
-            jax.config.update('jax_enable_x64', True)
-            key = jax.random.PRNGKey(self.seed)
-            jax.random.PRNGKey = lambda _: key  # type: ignore
-            self.libraries['jax'] = True
-            results['jax'] = True
+        Returns:
+            The consumer's JaxKeyPool.
+        """
+        pool = self._jax_pools.get(consumer)
+        if pool is None:
+            import jax
+
+            from .jax_keys import JaxKeyPool
+
+            if isinstance(consumer, str):
+                kind, consumer_id = _JAX_NAMED_CONSUMER, zlib.crc32(consumer.encode('utf-8'))
+            else:
+                kind, consumer_id = _JAX_INDEXED_CONSUMER, consumer
+            domain = jax.random.fold_in(jax.random.PRNGKey(self.seed), kind)
+            key = jax.random.fold_in(domain, consumer_id)
+            pool = self._jax_pools[consumer] = JaxKeyPool(key, batch_size)
+        return pool
+    
+    @property
+    def python_rng(self) -> random.Random:
+        """A ``random.Random`` instance private to this manager."""
+        if self._python_rng is None:
+            self._python_rng = random.Random(self.seed)
+        return self._python_rng
+    
+    @property
+    def numpy_rng(self) -> "np.random.Generator":
+        """A ``numpy.random.Generator`` private to this manager."""
+        if self._numpy_rng is None:
+            import numpy as np
+
+            self._numpy_rng = np.random.default_rng(self.seed)
+        return self._numpy_rng
+    
+    @contextmanager
+    def scope(self, seed: Optional[int] = None) -> Iterator["SeedManager"]:
+        """Run a block with its own seed manager bound to the current context.
+        
+        Inside the block ``get_seed_manager()`` returns a new manager for
+        ``seed`` in this thread or asyncio task only. The process-wide
+        generators are left untouched; draw from the yielded manager's
+        ``python_rng``, ``numpy_rng``, ``sampler()`` or ``jax_keys()``.
+        
+        Example:
+            >>> with seed_manager.scope(request_seed) as scoped:
+            ...     noise = scoped.numpy_rng.normal(size=8)
+        
+        Args:
+            seed: Seed of the scoped manager. Defaults to this manager's seed.
             
-        return results
+        Yields:
+            The scoped SeedManager.
+        """
+        manager = SeedManager(self.seed if seed is None else seed)
+        token = _current_manager.set(manager)
+        try:
+            yield manager
+        finally:
+            _current_manager.reset(token)
+    
+    def _seeded_libraries(self) -> List[str]:
+        """Libraries seeded by this manager, or the cheap defaults if none.
+        
+        Never None: that would make workers import every framework.
+        """
+        seeded = [name for name, done in self.libraries.items() if done]
+        return seeded or list(DEFAULT_SEED_LIBRARIES)
     
     def get_state(self) -> Dict[str, Any]:
         """Get the current state of the seed manager.
         
+        The ``rng_states`` entry holds the generator state of every seeded
+        library with a registered state handler (Python ``random``, NumPy's
+        global generator and torch by default), plus the manager's own
+        ``python_rng`` and ``numpy_rng`` generators and the positions of its
+        JAX key pools once they have been created.
+        
         Returns:
-            Dictionary containing the current seed and library states.
+            Dictionary containing the current seed, library states and
+            generator states.
         """
+        rng_states = {
+            name: _STATE_HANDLERS[name][0]()
+            for name, seeded in self.libraries.items()
+            if seeded and name in _STATE_HANDLERS
+        }
+        if self._python_rng is not None:
+            rng_states['python_rng'] = _get_python_state(self._python_rng)
+        if self._numpy_rng is not None:
+            rng_states['numpy_rng'] = self._numpy_rng.bit_generator.state
+        if self._jax_pools:
+            rng_states['jax_keys'] = {
+                consumer: pool.get_state() for consumer, pool in self._jax_pools.items()
+            }
         return {
             'seed': self.seed,
             'libraries': self.libraries.copy(),
+            'rng_states': rng_states,
         }
     
+    def set_state(self, state: Union[Dict[str, Any], bytes]) -> None:
+        """Restore a state captured by ``get_state()`` or ``state_bytes()``.
+        
+        Generator states are restored in place, so every random stream
+        continues exactly where it was checkpointed. Only load bytes from
+        trusted checkpoints: they are unpickled.
+        
+        Args:
+            state: A state dictionary or its serialised form.
+        """
+        loaded: Dict[str, Any] = pickle.loads(state) if isinstance(state, bytes) else state
+        self.seed = loaded['seed']
+        self.libraries.update(loaded['libraries'])
+        rng_states = dict(loaded.get('rng_states', {}))
+        python_rng = rng_states.pop('python_rng', None)
+        numpy_rng = rng_states.pop('numpy_rng', None)
+        jax_keys = rng_states.pop('jax_keys', {})
+        for name, rng_state in rng_states.items():
+            _STATE_HANDLERS[name][1](rng_state)
+        self._python_rng = self._numpy_rng = None
+        if python_rng is not None:
+            _set_python_state(python_rng, self.python_rng)
+        if numpy_rng is not None:
+            self.numpy_rng.bit_generator.state = numpy_rng
+        self._jax_pools.clear()
+        for consumer, pool_state in jax_keys.items():
+            self.jax_keys(consumer, pool_state['batch_size']).set_state(pool_state)
+    
+    def state_bytes(self) -> bytes:
+        """Serialise ``get_state()`` for checkpointing.
+        
+        Returns:
+            Compact binary form accepted by ``set_state()``.
+        """
+        return pickle.dumps(self.get_state(), protocol=pickle.HIGHEST_PROTOCOL)
+    
     def __repr__(self) -> str:
         """Return a string representation of the seed manager."""
         libs = ", ".join(f"{k}:{'✓' if v else '✗'}" for k, v in self.libraries.items())
         return f"<SeedManager(seed={self.seed}, libraries={{{libs}}})>"
 
 
+def _init_pool_worker(seed: int, libraries: Optional[List[str]], counter: Any) -> None:
+    """Process pool initializer seeding the worker with the next child stream."""
+    global seed_manager
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    seed_manager = SeedManager(seed).spawn(index)
+    seed_manager.seed_everything(libraries)
+
+
 # Global instance for convenience
 seed_manager = SeedManager()
 
+# Manager bound by SeedManager.scope() in the current thread or task, if any
+_current_manager: ContextVar[Optional[SeedManager]] = ContextVar(
+    'current_seed_manager', default=None
+)
+
 
 def set_global_seed(seed: int) -> None:
     """Set the global random seed for all supported libraries.
@@ -130,6 +529,9 @@ def set_global_seed(seed: int) -> None:
     This is a convenience function that creates and configures a global
     SeedManager instance.
     
+    The global instance is shared by all threads; use ``SeedManager.scope()``
+    for per-thread or per-task reproducibility.
+    
     Args:
         seed: The random seed to use.
     """
@@ -142,18 +544,20 @@ def get_global_seed() -> int:
     """Get the current global random seed.
     
     Returns:
-        The current global random seed.
+        The seed of the manager returned by ``get_seed_manager()``.
     """
-    return seed_manager.seed
+    return get_seed_manager().seed
 
 
 def get_seed_manager() -> SeedManager:
-    """Get the global SeedManager instance.
+    """Get the SeedManager for the current context.
     
     Returns:
-        The global SeedManager instance.
+        The manager bound by an enclosing ``SeedManager.scope()`` in this
+        thread or task, otherwise the global SeedManager instance.
     """
-    return seed_manager
+    manager = _current_manager.get()
+    return seed_manager if manager is None else manager
 
 
 # Example usage
@@ -31,33 +31,29 @@ def setup_logging():
     logging.disable(logging.NOTSET)
 
 
+def is_installed(name: str) -> bool:
+    """Return True if ``name`` is a real installed module rather than a stub."""
+
+    module = sys.modules.get(name)
+    if module is not None:
+        return getattr(module, "__spec__", None) is not None
+    return importlib.util.find_spec(name) is not None
+
+
 def _create_stub_modules() -> None:
     """Install lightweight stubs for optional dependencies."""
 
-    if "pydantic" not in sys.modules:
+    if not is_installed("pydantic"):
         pydantic = types.ModuleType("pydantic")
 
-        class BaseSettings:
-            def __init__(self, **values: object) -> None:
-                for name, default in self.__class__.__dict__.items():
-                    if name.isupper():
-                        setattr(self, name, values.get(name, os.getenv(name, default)))
-                import inspect
-                for attr in dir(self.__class__):
-                    method = getattr(self.__class__, attr)
-                    if hasattr(method, "_validator_field"):
-                        field = method._validator_field
-                        val = getattr(self, field, None)
-                        params = inspect.signature(method).parameters
-                        if len(params) == 3:
-                            new_val = method(cls=self.__class__, v=val, values=self.__dict__)
-                        else:
-                            new_val = method(cls=self.__class__, v=val)
-                        setattr(self, field, new_val)
-
-        def validator(field: str, pre: bool = False):
+        class FieldInfo:
+            def __init__(self, default: object = None, **kwargs: object) -> None:
+                self.default = default
+
+        def field_validator(field: str, mode: str = "after"):
             def decorator(func):
-                func._validator_field = field
+                function = func.__func__ if isinstance(func, classmethod) else func
+                function._validator_field = field
                 return func
 
             return decorator
@@ -68,13 +64,46 @@ def _create_stub_modules() -> None:
         class AnyHttpUrl(str):
             pass
 
-        pydantic.BaseSettings = BaseSettings
-        pydantic.validator = validator
+        pydantic.Field = FieldInfo
+        pydantic.ValidationInfo = types.SimpleNamespace
+        pydantic.field_validator = field_validator
         pydantic.EmailStr = EmailStr
         pydantic.AnyHttpUrl = AnyHttpUrl
         sys.modules["pydantic"] = pydantic
 
-    if "numpy" not in sys.modules:
+    if not is_installed("pydantic_settings"):
+        pydantic_settings = types.ModuleType("pydantic_settings")
+
+        class BaseSettings:
+            model_config: dict = {}
+
+            def __init__(self, **values: object) -> None:
+                validators = {}
+                for attr in dir(self.__class__):
+                    function = getattr(getattr(self.__class__, attr), "__func__", None)
+                    if hasattr(function, "_validator_field"):
+                        validators[function._validator_field] = function
+                data: dict = {}
+                for name in self.__class__.__annotations__:
+                    if not name.isupper():
+                        continue
+                    default = self.__class__.__dict__.get(name)
+                    if isinstance(default, pydantic.Field):
+                        default = default.default
+                    value = values.get(name, os.getenv(name, default))
+                    if name in validators:
+                        validator = validators[name]
+                        args = [self.__class__, value, types.SimpleNamespace(data=data)]
+                        value = validator(*args[: validator.__code__.co_argcount])
+                    data[name] = value
+                    setattr(self, name, value)
+
+        pydantic_settings.BaseSettings = BaseSettings
+        pydantic_settings.NoDecode = object()
+        pydantic_settings.SettingsConfigDict = dict
+        sys.modules["pydantic_settings"] = pydantic_settings
+
+    if not is_installed("numpy"):
         numpy = types.ModuleType("numpy")
         numpy.random = types.SimpleNamespace(seed=lambda seed: None)
         sys.modules["numpy"] = numpy
@@ -82,6 +111,12 @@ def _create_stub_modules() -> None:
     if "torch" not in sys.modules:
         torch = types.ModuleType("torch")
         torch.manual_seed = lambda seed: None
+        torch.uint8 = "uint8"
+        torch.get_rng_state = lambda: types.SimpleNamespace(
+            numpy=lambda: types.SimpleNamespace(tobytes=lambda: b"")
+        )
+        torch.set_rng_state = lambda state: None
+        torch.frombuffer = lambda buffer, dtype=None: buffer
         torch.cuda = types.SimpleNamespace(is_available=lambda: False, manual_seed_all=lambda seed: None)
         torch.backends = types.SimpleNamespace(cudnn=types.SimpleNamespace(deterministic=False, benchmark=False))
         sys.modules["torch"] = torch
@@ -91,28 +126,49 @@ def _create_stub_modules() -> None:
         tf.random = types.SimpleNamespace(set_seed=lambda seed: None)
         sys.modules["tensorflow"] = tf
 
-    if "jax" not in sys.modules:
+    if not is_installed("jax"):
         jax = types.ModuleType("jax")
         jax.config = types.SimpleNamespace(update=lambda *args, **kwargs: None)
         jax.random = types.SimpleNamespace(PRNGKey=lambda seed: seed)
         sys.modules["jax"] = jax
         sys.modules["jax.numpy"] = types.ModuleType("jax.numpy")
 
-    if "sqlalchemy" not in sys.modules:
+    if not is_installed("sqlalchemy"):
         sqlalchemy = types.ModuleType("sqlalchemy")
         sqlalchemy.create_engine = lambda *args, **kwargs: None
+        sqlalchemy.Insert = type("Insert", (), {})
+        sqlalchemy.Update = type("Update", (), {})
+        sqlalchemy.Delete = type("Delete", (), {})
+
+        sqlalchemy_engine = types.ModuleType("sqlalchemy.engine")
+        sqlalchemy_engine.Engine = type("Engine", (), {})
+        sqlalchemy_engine.make_url = lambda url: url
 
         sqlalchemy_ext = types.ModuleType("sqlalchemy.ext")
         sqlalchemy_declarative = types.ModuleType("sqlalchemy.ext.declarative")
         sqlalchemy_declarative.declarative_base = lambda *args, **kwargs: type("Base", (), {})
 
+        class sessionmaker:
+            def __init__(self, *args, **kwargs) -> None:
+                self.kw = kwargs
+
+            def __call__(self, **local_kw):
+                return None
+
         sqlalchemy_orm = types.ModuleType("sqlalchemy.orm")
-        sqlalchemy_orm.sessionmaker = lambda *args, **kwargs: lambda *a, **kw: None
+        sqlalchemy_orm.sessionmaker = sessionmaker
+        sqlalchemy_orm.Session = type("Session", (), {})
+        sqlalchemy_orm.declarative_base = sqlalchemy_declarative.declarative_base
+
+        sqlalchemy_pool = types.ModuleType("sqlalchemy.pool")
+        sqlalchemy_pool.QueuePool = type("QueuePool", (), {})
 
         sys.modules["sqlalchemy"] = sqlalchemy
+        sys.modules["sqlalchemy.engine"] = sqlalchemy_engine
         sys.modules["sqlalchemy.ext"] = sqlalchemy_ext
         sys.modules["sqlalchemy.ext.declarative"] = sqlalchemy_declarative
         sys.modules["sqlalchemy.orm"] = sqlalchemy_orm
+        sys.modules["sqlalchemy.pool"] = sqlalchemy_pool
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -129,12 +185,18 @@ def load_module_from_path(name: str, path: Path):
         source = handle.read()
     source = re.sub(r"{%.+?%}", "", source, flags=re.DOTALL)
     source = re.sub(r"from\s+{{.*?}}\s+import\s+__version__", "__version__ = '0.0.0'", source)
-    spec = importlib.util.spec_from_loader(name, loader=None)
+    is_package = path.name == "__init__.py"
+    spec = importlib.util.spec_from_loader(name, loader=None, is_package=is_package)
+    if is_package:
+        # Let relative imports inside the package find its submodules, and
+        # re-import them so they bind to this copy of the package
+        spec.submodule_search_locations.append(str(path.parent))
+        for loaded in [m for m in sys.modules if m.startswith(f"{name}.")]:
+            del sys.modules[loaded]
     module = importlib.util.module_from_spec(spec)
     module.__file__ = str(path)
-    module.__package__ = name.rpartition('.')[0]
-    exec(compile(source, str(path), "exec"), module.__dict__)
     sys.modules[name] = module
+    exec(compile(source, str(path), "exec"), module.__dict__)
     return module
 
 
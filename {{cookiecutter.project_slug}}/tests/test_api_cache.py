@@ -0,0 +1,253 @@
+import asyncio
+import json
+import sys
+
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+# Register the package root so that ``from ..config import ...`` resolves
+load_project_module("pkg", "__init__.py")
+api_mod = load_project_module("pkg.api", "api", "__init__.py")
+cache_mod = api_mod.cache
+middleware_mod = api_mod.middleware
+
+
+class CountingApp:
+    """ASGI app returning a JSON body that counts handler calls."""
+
+    def __init__(self, status=200, headers=(), chunks=1):
+        self.calls = 0
+        self.status = status
+        self.headers = list(headers)
+        self.chunks = chunks
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        body = json.dumps({"path": scope["path"], "calls": self.calls}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": self.status if scope["method"] in ("GET", "HEAD") else 201,
+            "headers": [(b"content-type", b"application/json")] + self.headers,
+        })
+        step = max(1, len(body) // self.chunks)
+        parts = [body[i:i + step] for i in range(0, len(body), step)]
+        for index, part in enumerate(parts):
+            await send({"type": "http.response.body", "body": part, "more_body": index < len(parts) - 1})
+
+
+def request(app, path="/api/v1/items", method="GET", query=b"", headers=()):
+    """Run one request through an ASGI app and return (status, headers, body)."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query,
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers],
+    }
+    asyncio.run(app(scope, receive, send))
+    start = messages[0]
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], {k.decode(): v.decode() for k, v in start["headers"]}, body
+
+
+def make_cached(app, **kwargs):
+    cache = cache_mod.ResponseCache(**kwargs)
+    return middleware_mod.ResponseCacheMiddleware(app, cache, paths=["/api/v1"]), cache
+
+
+def test_in_memory_cache_expires_and_evicts_lru(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_mod.time, "monotonic", lambda: now[0])
+    backend = cache_mod.InMemoryCache(max_entries=2)
+    entry = cache_mod.CachedResponse(200, [], b"x", '"x"')
+    backend.set("a", entry, ttl=10)
+    backend.set("b", entry, ttl=10)
+    assert backend.get("a") is entry  # "a" becomes most recently used
+    backend.set("c", entry, ttl=10)
+    assert backend.get("b") is None
+    assert backend.evictions == 1
+    now[0] = 111.0
+    assert backend.get("a") is None
+    assert len(backend) == 1
+
+
+def test_key_normalises_query_order():
+    key = cache_mod.ResponseCache.key
+    assert key("/items", b"b=2&a=1") == key("/items", b"a=1&b=2") == "/items?a=1&b=2"
+    assert key("/items") == "/items"
+    assert key("/items", b"a=1") != key("/other", b"a=1")
+
+
+def test_etag_matching():
+    assert cache_mod.etag_matches('"abc"', '"abc"')
+    assert cache_mod.etag_matches('W/"abc", "def"', '"abc"')
+    assert cache_mod.etag_matches("*", '"abc"')
+    assert not cache_mod.etag_matches('"abd"', '"abc"')
+
+
+def test_second_get_is_served_from_cache():
+    app = CountingApp()
+    cached, cache = make_cached(app)
+    status, headers, body = request(cached, query=b"b=2&a=1")
+    assert (status, headers["x-cache"]) == (200, "MISS")
+    status, headers2, body2 = request(cached, query=b"a=1&b=2")
+    assert (status, headers2["x-cache"]) == (200, "HIT")
+    assert body2 == body
+    assert headers2["etag"] == headers["etag"]
+    assert app.calls == 1
+    metrics = cache.metrics()
+    assert metrics["hits"] == 1 and metrics["misses"] == 1
+    assert metrics["hit_ratio"] == 0.5
+    assert metrics["entries"] == 1
+
+
+def test_if_none_match_returns_304():
+    app = CountingApp()
+    cached, cache = make_cached(app)
+    _, headers, _ = request(cached)
+    status, headers304, body = request(cached, headers=[("If-None-Match", headers["etag"])])
+    assert status == 304
+    assert body == b""
+    assert headers304["etag"] == headers["etag"]
+    assert cache.metrics()["not_modified"] == 1
+
+
+def test_head_uses_cached_get_without_body():
+    app = CountingApp()
+    cached, _ = make_cached(app)
+    request(cached)
+    status, headers, body = request(cached, method="HEAD")
+    assert (status, body, headers["x-cache"]) == (200, b"", "HIT")
+    assert app.calls == 1
+
+
+@pytest.mark.parametrize(
+    "app",
+    [
+        CountingApp(headers=[(b"cache-control", b"no-store")]),
+        CountingApp(headers=[(b"set-cookie", b"session=1")]),
+        CountingApp(status=404),
+    ],
+)
+def test_uncacheable_responses_pass_through(app):
+    cached, cache = make_cached(app)
+    request(cached)
+    status, headers, _ = request(cached)
+    assert status == app.status
+    assert "x-cache" not in headers
+    assert app.calls == 2
+    assert cache.metrics()["stores"] == 0
+
+
+@pytest.mark.parametrize("credentials", [("Authorization", "Bearer token-a"), ("Cookie", "session=a")])
+def test_requests_with_credentials_bypass_the_cache(credentials):
+    app = CountingApp()
+    cached, cache = make_cached(app)
+    _, headers, _ = request(cached, headers=[credentials])
+    assert "x-cache" not in headers
+    # An anonymous request must not see the per-user response, and vice versa
+    _, headers, body = request(cached)
+    assert headers["x-cache"] == "MISS" and json.loads(body)["calls"] == 2
+    _, headers, body = request(cached, headers=[credentials])
+    assert "x-cache" not in headers and json.loads(body)["calls"] == 3
+    assert cache.metrics()["stores"] == 1
+
+
+def test_paths_outside_prefix_are_not_cached():
+    app = CountingApp()
+    cached, _ = make_cached(app)
+    request(cached, path="/other")
+    request(cached, path="/other")
+    assert app.calls == 2
+
+
+def test_large_streamed_bodies_are_not_cached():
+    app = CountingApp(chunks=4)
+    cached, cache = make_cached(app, max_body_bytes=10)
+    _, _, body = request(cached)
+    assert json.loads(body)["calls"] == 1
+    request(cached)
+    assert app.calls == 2
+    assert cache.metrics()["stores"] == 0
+
+
+def test_successful_write_invalidates_cache():
+    app = CountingApp()
+    cached, cache = make_cached(app)
+    request(cached)
+    request(cached, method="POST")
+    _, headers, _ = request(cached)
+    assert headers["x-cache"] == "MISS"
+    assert cache.metrics()["invalidations"] == 1
+
+
+def test_writes_outside_cached_paths_keep_the_cache():
+    app = CountingApp()
+    cached, cache = make_cached(app)
+    request(cached)
+    request(cached, path="/login", method="POST")
+    _, headers, _ = request(cached)
+    assert headers["x-cache"] == "HIT"
+    assert cache.metrics()["invalidations"] == 0
+
+
+def test_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        cache_mod.CacheBackend()
+
+
+def test_request_no_cache_refreshes_entry():
+    app = CountingApp()
+    cached, _ = make_cached(app)
+    request(cached)
+    _, headers, body = request(cached, headers=[("Cache-Control", "no-cache")])
+    assert headers["x-cache"] == "MISS"
+    assert json.loads(body)["calls"] == 2
+    _, _, body = request(cached)
+    assert json.loads(body)["calls"] == 2
+
+
+def test_importing_api_does_not_import_fastapi():
+    assert "create_app" not in api_mod.__all__
+    assert "app" not in vars(api_mod)
+
+
+@pytest.mark.skipif(
+    not (is_installed("fastapi") and is_installed("httpx") and is_installed("sqlalchemy")),
+    reason="fastapi and httpx not installed",
+)
+def test_create_app_serves_cached_routes(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    create_app = api_mod.create_app
+    # The database engine reads the settings of the modules the factory imported
+    session_mod = sys.modules["pkg.db.session"]
+    settings = session_mod.get_settings()
+    monkeypatch.setattr(settings, "DATABASE_URI", f"sqlite:///{tmp_path / 'api.db'}")
+    session_mod.dispose_engine()
+    app = create_app(settings)
+
+    @app.get(f"{settings.API_V1_STR}/items")
+    def items():
+        return {"items": [1, 2, 3]}
+
+    client = TestClient(app)
+    assert client.get(f"{settings.API_V1_STR}/health").json() == {"status": "ok"}
+    first = client.get(f"{settings.API_V1_STR}/items")
+    second = client.get(f"{settings.API_V1_STR}/items", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 304
+    metrics = client.get(f"{settings.API_V1_STR}/metrics").json()
+    assert metrics["cache"]["hits"] == 1
+    # Authenticated requests are never answered from the shared cache
+    private = client.get(f"{settings.API_V1_STR}/items", headers={"Authorization": "Bearer x"})
+    assert "x-cache" not in private.headers
+    session_mod.dispose_engine()
@@ -0,0 +1,143 @@
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+serialization_mod = load_project_module("pkg.api.serialization", "api", "serialization.py")
+
+PAYLOAD = {
+    "id": 1,
+    "name": "café",
+    "day": date(2024, 5, 17),
+    "at": datetime(2024, 5, 17, 12, 30, 5),
+    "price": Decimal("9.99"),
+    "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+    "tags": ["a", "b"],
+}
+EXPECTED = {
+    "id": 1,
+    "name": "café",
+    "day": "2024-05-17",
+    "at": "2024-05-17T12:30:05",
+    "price": "9.99",
+    "uuid": "12345678-1234-5678-1234-567812345678",
+    "tags": ["a", "b"],
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    if request.param == "orjson":
+        if serialization_mod.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(serialization_mod, "orjson", None)
+    return request.param
+
+
+def test_dumps_handles_extra_types(encoder):
+    data = serialization_mod.dumps(PAYLOAD)
+    assert isinstance(data, bytes)
+    assert json.loads(data) == EXPECTED
+    assert b" " not in data.replace(b"caf\xc3\xa9", b"")
+
+
+@pytest.mark.skipif(not is_installed("numpy"), reason="numpy not installed")
+def test_dumps_handles_numpy(encoder):
+    import numpy as np
+
+    data = serialization_mod.dumps({"values": np.arange(3), "scalar": np.float32(0.5)})
+    assert json.loads(data) == {"values": [0, 1, 2], "scalar": 0.5}
+
+
+def test_dumps_rejects_unknown_types(encoder):
+    with pytest.raises(TypeError):
+        serialization_mod.dumps({"value": object()})
+    with pytest.raises(TypeError):
+        serialization_mod.dumps({(1, 2): "tuple key"})
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Point:
+    x: float
+    y: float
+
+
+EDGE_CASES = {
+    "blob": b"\xff\x00caf\xc3\xa9",
+    "color": Color.RED,
+    "point": Point(1.0, float("nan")),
+    "values": [float("nan"), float("inf"), 1.5],
+    1: "int key",
+    None: "none key",
+    date(2024, 5, 17): "date key",
+    UUID(int=1): "uuid key",
+    Color.RED: "enum key",
+}
+EDGE_EXPECTED = (
+    b'{"blob":"/wBjYWbDqQ==","color":"red","point":{"x":1.0,"y":null},"values":[null,null,1.5],'
+    b'"1":"int key","null":"none key","2024-05-17":"date key",'
+    b'"00000000-0000-0000-0000-000000000001":"uuid key","red":"enum key"}'
+)
+
+
+def test_encoders_agree_on_edge_cases(encoder):
+    # bytes are base64, non-finite floats null and non-str keys strings in both
+    assert serialization_mod.dumps(EDGE_CASES) == EDGE_EXPECTED
+
+
+class FakeModel:
+    """Stands in for a pydantic v2 model."""
+
+    validated = 0
+
+    def __init__(self, **values):
+        FakeModel.validated += 1
+        self.__dict__.update(values)
+
+    @classmethod
+    def model_construct(cls, **values):
+        instance = cls.__new__(cls)
+        instance.__dict__.update(values)
+        return instance
+
+    def model_dump(self):
+        return dict(self.__dict__)
+
+
+def test_construct_models_skips_validation(encoder):
+    models = serialization_mod.construct_models(FakeModel, [{"id": 1}, {"id": 2}])
+    assert FakeModel.validated == 0
+    assert json.loads(serialization_mod.dumps(models)) == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.skipif(not is_installed("sqlalchemy"), reason="sqlalchemy not installed")
+def test_rows_to_dicts():
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        rows = connection.execute(text("SELECT 1 AS id, 'x' AS name UNION ALL SELECT 2, 'y'"))
+        assert serialization_mod.rows_to_dicts(rows) == [
+            {"id": 1, "name": "x"},
+            {"id": 2, "name": "y"},
+        ]
+
+
+@pytest.mark.skipif(not is_installed("starlette"), reason="starlette not installed")
+def test_trusted_response_renders_without_validation():
+    responses_mod = load_project_module("pkg.api.responses", "api", "responses.py")
+    response = responses_mod.trusted_response((row for row in [PAYLOAD]), headers={"X-Test": "1"})
+    assert isinstance(response, responses_mod.FastJSONResponse)
+    assert json.loads(response.body) == [EXPECTED]
+    assert response.headers["x-test"] == "1"
@@ -0,0 +1,205 @@
+import asyncio
+import gzip
+import json
+import os
+import zlib
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+pytestmark = pytest.mark.skipif(not is_installed("sqlalchemy"), reason="sqlalchemy not installed")
+
+middleware_mod = load_project_module("pkg.api", "api", "__init__.py").middleware
+if is_installed("sqlalchemy"):
+    config_mod = load_project_module("pkg.config", "config", "__init__.py")
+    session_mod = load_project_module("pkg.db.session", "db", "session.py")
+    bulk_mod = load_project_module("pkg.db.bulk", "db", "bulk.py")
+    streaming_mod = load_project_module("pkg.api.streaming", "api", "streaming.py")
+
+requires_pyarrow = pytest.mark.skipif(not is_installed("pyarrow"), reason="pyarrow not installed")
+requires_zstd = pytest.mark.skipif(not is_installed("zstandard"), reason="zstandard not installed")
+
+
+def chunk_app(chunks, headers=()):
+    """ASGI app streaming ``chunks`` as separate body messages."""
+
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/x-ndjson")] + list(headers),
+        })
+        items = list(chunks) if not callable(chunks) else chunks()
+        for chunk in items:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    return app
+
+
+def run(app, accept_encoding, on_body=None):
+    """Run a GET through ``app``; return the start message and body bytes."""
+    received = {"start": None, "body": []}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            received["start"] = message
+        elif on_body is not None:
+            on_body(message.get("body", b""))
+        else:
+            received["body"].append(message.get("body", b""))
+
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else []
+    scope = {"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": headers}
+    asyncio.run(app(scope, receive, send))
+    start = received["start"]
+    return {k.decode(): v.decode() for k, v in start["headers"]}, b"".join(received["body"])
+
+
+def test_iter_ndjson_encodes_rows_in_chunks():
+    rows = [{"id": i, "day": date(2024, 1, i + 1), "price": Decimal("1.50")} for i in range(5)]
+    chunks = list(streaming_mod.iter_ndjson(rows, rows_per_chunk=2))
+    assert len(chunks) == 3
+    lines = b"".join(chunks).decode().splitlines()
+    assert json.loads(lines[4]) == {"id": 4, "day": "2024-01-05", "price": "1.50"}
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=1.0, zstd;q=0.5", "gzip"),
+        ("identity", None),
+        ("gzip;q=0", None),
+        (None, None),
+    ],
+)
+def test_negotiate_encoding(header, expected):
+    assert middleware_mod._negotiate_encoding(header) == expected
+
+
+@requires_zstd
+def test_negotiate_prefers_zstd_on_ties():
+    assert middleware_mod._negotiate_encoding("gzip, zstd") == "zstd"
+    assert middleware_mod._negotiate_encoding("*") == "zstd"
+
+
+def test_small_responses_are_not_compressed():
+    app = middleware_mod.CompressionMiddleware(chunk_app([b"x" * 10]), minimum_size=100)
+    headers, body = run(app, "gzip")
+    assert "content-encoding" not in headers
+    assert body == b"x" * 10
+
+
+def test_large_response_is_gzipped_with_length_and_weak_etag():
+    payload = b'{"value": 1}\n' * 1000
+
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-length", str(len(payload)).encode()), (b"etag", b'"abc"')],
+        })
+        await send({"type": "http.response.body", "body": payload})
+
+    headers, body = run(middleware_mod.CompressionMiddleware(app, minimum_size=100), "gzip")
+    assert headers["content-encoding"] == "gzip"
+    assert headers["content-length"] == str(len(body))
+    assert headers["etag"] == 'W/"abc"'
+    assert headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(body) == payload
+
+
+def test_stream_is_compressed_incrementally():
+    chunks = [b"line %d\n" % i * 50 for i in range(20)]
+    app = middleware_mod.CompressionMiddleware(chunk_app(chunks), minimum_size=100)
+    headers, body = run(app, "gzip")
+    assert "content-length" not in headers
+    assert gzip.decompress(body) == b"".join(chunks)
+
+
+@requires_zstd
+def test_stream_is_zstd_compressed_when_preferred():
+    import zstandard
+
+    chunks = [b"row\n" * 500] * 4
+    headers, body = run(middleware_mod.CompressionMiddleware(chunk_app(chunks)), "zstd")
+    assert headers["content-encoding"] == "zstd"
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(body) == b"".join(chunks)
+
+
+def test_already_encoded_responses_pass_through():
+    app = chunk_app([b"x" * 5000], headers=[(b"content-encoding", b"br")])
+    headers, body = run(middleware_mod.CompressionMiddleware(app), "gzip")
+    assert headers["content-encoding"] == "br"
+    assert body == b"x" * 5000
+
+
+@requires_pyarrow
+def test_iter_arrow_ipc_round_trip():
+    import numpy as np
+    import pyarrow as pa
+
+    chunks = [{"id": np.arange(i, i + 3), "value": np.full(3, i / 2)} for i in (0, 3)]
+    data = b"".join(streaming_mod.iter_arrow_ipc(chunks))
+    table = pa.ipc.open_stream(data).read_all()
+    assert table.num_rows == 6
+    assert table.column("id").to_pylist() == list(range(6))
+
+
+@requires_pyarrow
+def test_iter_arrow_ipc_empty_result_with_schema():
+    import pyarrow as pa
+
+    schema = pa.schema([("id", pa.int64())])
+    table = pa.ipc.open_stream(b"".join(streaming_mod.iter_arrow_ipc([], schema))).read_all()
+    assert table.num_rows == 0
+    assert table.schema == schema
+
+
+def _rss_bytes():
+    with open("/proc/self/statm") as handle:
+        return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="needs /proc")
+def test_streaming_a_million_rows_keeps_rss_bounded(tmp_path):
+    from sqlalchemy import create_engine, text
+
+    total_rows = 1_000_000
+    query = text(
+        "WITH RECURSIVE seq(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM seq LIMIT :n) "
+        "SELECT x AS id, x * 0.5 AS value, 'row-' || x AS name FROM seq"
+    )
+    engine = create_engine(f"sqlite:///{tmp_path / 'stream.db'}")
+    connection = engine.connect()
+
+    def chunks():
+        rows = bulk_mod.stream_rows(connection, query, {"n": total_rows}, batch_size=5000)
+        return streaming_mod.iter_ndjson(rows, rows_per_chunk=5000)
+
+    app = middleware_mod.CompressionMiddleware(chunk_app(chunks))
+    decompressor = zlib.decompressobj(31)
+    stats = {"lines": 0, "bytes": 0, "peak": 0}
+    baseline = _rss_bytes()
+
+    def on_body(body):
+        data = decompressor.decompress(body)
+        stats["lines"] += data.count(b"\n")
+        stats["bytes"] += len(data)
+        stats["peak"] = max(stats["peak"], _rss_bytes() - baseline)
+
+    run(app, "gzip", on_body=on_body)
+    connection.close()
+    engine.dispose()
+
+    assert stats["lines"] == total_rows
+    # ~50 MB of NDJSON went through; materialising it would hold several times that
+    assert stats["bytes"] > 40 * 1024 * 1024
+    assert stats["peak"] < 32 * 1024 * 1024
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+pytestmark = pytest.mark.skipif(
+    not (is_installed("sqlalchemy") and is_installed("aiosqlite") and is_installed("greenlet")),
+    reason="sqlalchemy[asyncio] and aiosqlite not installed",
+)
+
+if is_installed("sqlalchemy"):
+    config_mod = load_project_module("pkg.config", "config", "__init__.py")
+    session_mod = load_project_module("pkg.db.session", "db", "session.py")
+    async_mod = load_project_module("pkg.db.async_session", "db", "async_session.py")
+
+
+@pytest.fixture
+def sqlite_settings(tmp_path, monkeypatch):
+    settings = async_mod.get_settings()
+    monkeypatch.setattr(settings, "DATABASE_URI", f"sqlite:///{tmp_path / 'app.db'}")
+    monkeypatch.setattr(settings, "ASYNC_DATABASE_URI", None)
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 3)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 1)
+    yield settings
+    asyncio.run(async_mod.dispose_async_engine())
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("postgresql://u:p@host/db", "postgresql+asyncpg://u:p@host/db"),
+        ("postgresql+psycopg2://u@host/db", "postgresql+asyncpg://u@host/db"),
+        ("postgresql+asyncpg://u@host/db", "postgresql+asyncpg://u@host/db"),
+        ("sqlite:///app.db", "sqlite+aiosqlite:///app.db"),
+        ("sqlite+aiosqlite:///app.db", "sqlite+aiosqlite:///app.db"),
+    ],
+)
+def test_to_async_url(url, expected):
+    assert async_mod.to_async_url(url) == expected
+
+
+def test_import_does_not_create_engine():
+    assert async_mod.get_async_pool_metrics() == {}
+
+
+def test_engine_uses_async_driver_and_pool_settings(sqlite_settings):
+    engine = async_mod.get_async_engine()
+    assert async_mod.get_async_engine() is engine
+    assert engine.url.drivername == "sqlite+aiosqlite"
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 1
+
+
+def test_explicit_async_uri_wins(sqlite_settings, tmp_path):
+    sqlite_settings.ASYNC_DATABASE_URI = f"sqlite+aiosqlite:///{tmp_path / 'other.db'}"
+    assert async_mod.get_async_engine().url.database.endswith("other.db")
+
+
+def test_get_async_db_yields_bound_session_and_closes(sqlite_settings):
+    from sqlalchemy import text
+
+    async def run():
+        generator = async_mod.get_async_db()
+        session = await generator.__anext__()
+        assert session.bind is async_mod.get_async_engine()
+        assert (await session.execute(text("select 1"))).scalar() == 1
+        assert async_mod.get_async_pool_metrics()["checked_out"] == 1
+        with pytest.raises(StopAsyncIteration):
+            await generator.__anext__()
+        return async_mod.get_async_pool_metrics()
+
+    metrics = asyncio.run(run())
+    assert metrics["checked_out"] == 0
+    assert metrics["checkouts"] >= 1
+
+
+def test_session_closed_when_request_fails(sqlite_settings):
+    from sqlalchemy import text
+
+    async def run():
+        generator = async_mod.get_async_db()
+        session = await generator.__anext__()
+        await session.execute(text("select 1"))
+        with pytest.raises(RuntimeError):
+            await generator.athrow(RuntimeError("handler failed"))
+        return async_mod.get_async_pool_metrics()
+
+    assert asyncio.run(run())["checked_out"] == 0
+
+
+def test_concurrent_sessions_share_the_pool(sqlite_settings):
+    from sqlalchemy import text
+
+    async def query(value):
+        async with async_mod.AsyncSessionLocal() as session:
+            return (await session.execute(text(f"select {value}"))).scalar()
+
+    async def run():
+        results = await asyncio.gather(*(query(i) for i in range(8)))
+        return results, async_mod.get_async_pool_metrics()
+
+    results, metrics = asyncio.run(run())
+    assert results == list(range(8))
+    assert metrics["checked_out"] == 0
+    assert metrics["checkouts"] >= 4
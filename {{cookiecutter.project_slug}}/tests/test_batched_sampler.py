@@ -0,0 +1,59 @@
+"""Tests for the batched RNG sampler."""
+
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+pytestmark = pytest.mark.skipif(not is_installed("numpy"), reason="numpy not installed")
+
+sampler_mod = load_project_module("pkg.utils.batched_sampler", "utils", "batched_sampler.py")
+seed_mod = load_project_module("pkg.utils.seed_manager", "utils", "seed_manager.py")
+
+
+def test_views_are_zero_copy_and_match_generator():
+    import numpy as np
+
+    sampler = sampler_mod.BatchedSampler(np.random.default_rng(3), block_size=16)
+    first = sampler.uniform(4)
+    second = sampler.uniform(4)
+    assert np.shares_memory(first, second) is False
+    assert first.base is second.base
+    expected = np.random.default_rng(3).random(16)
+    np.testing.assert_array_equal(np.concatenate([first, second]), expected[:8])
+
+
+def test_refill_discards_remainder_and_keeps_old_views():
+    import numpy as np
+
+    sampler = sampler_mod.BatchedSampler(np.random.default_rng(0), block_size=10)
+    head = sampler.normal(8)
+    kept = head.copy()
+    tail = sampler.normal(5)
+    reference = np.random.default_rng(0)
+    reference.standard_normal(10)
+    np.testing.assert_array_equal(tail, reference.standard_normal(10)[:5])
+    np.testing.assert_array_equal(head, kept)
+
+
+def test_scalars_and_oversized_requests():
+    import numpy as np
+
+    sampler = sampler_mod.BatchedSampler(np.random.default_rng(1), block_size=4)
+    values = [sampler.integers(0, 10) for _ in range(9)]
+    assert all(0 <= v < 10 for v in values)
+    assert sampler.integers(0, 10, size=100).shape == (100,)
+    with pytest.raises(ValueError):
+        sampler.integers(5, 5)
+    with pytest.raises(ValueError):
+        sampler_mod.BatchedSampler(np.random.default_rng(1), block_size=0)
+
+
+def test_seed_manager_sampler_is_reproducible():
+    import numpy as np
+
+    manager = seed_mod.SeedManager(11)
+    a = manager.sampler(block_size=32).uniform(20)
+    b = seed_mod.SeedManager(11).sampler(block_size=32).uniform(20)
+    np.testing.assert_array_equal(a, b)
+    c = manager.spawn(0).sampler(block_size=32).uniform(20)
+    assert not np.array_equal(a, c)
@@ -0,0 +1,207 @@
+"""Tests for the content-addressed disk cache."""
+
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+core = load_project_module("pkg.core", "core", "__init__.py")
+load_project_module("pkg.utils.seed_manager", "utils", "seed_manager.py")
+cache_mod = core.cache
+
+requires_numpy = pytest.mark.skipif(not is_installed("numpy"), reason="numpy not installed")
+
+
+def make_counted(tmp_path, **kwargs):
+    calls = []
+
+    @core.memoize(cache_dir=tmp_path, **kwargs)
+    def add(a, b=1, verbose=False):
+        calls.append((a, b))
+        return {"sum": a + b}
+
+    return add, calls
+
+
+def test_results_are_computed_once_per_unique_input(tmp_path):
+    add, calls = make_counted(tmp_path, ignore=["verbose"])
+    assert add(1) == {"sum": 2}
+    assert add(1, b=1, verbose=True) == {"sum": 2}
+    assert add(a=1) == {"sum": 2}
+    assert add(2) == {"sum": 3}
+    assert calls == [(1, 1), (2, 1)]
+    assert len(list(tmp_path.glob("*/*.pkl"))) == 2
+
+
+def test_key_is_stable_across_container_ordering(tmp_path):
+    add, _ = make_counted(tmp_path)
+    assert add.cache_key({"x": 1, "y": [1, 2]}) == add.cache_key({"y": [1, 2], "x": 1})
+    assert add.cache_key({"x": 1}) != add.cache_key({"x": 1.0})
+    assert add.cache_key((1, 2)) != add.cache_key([1, 2])
+    assert add.cache_key({3, 1, 2}) == add.cache_key({1, 2, 3})
+
+
+def test_function_identity_changes_with_code(tmp_path):
+    namespace = {}
+    exec("def f(x):\n    return x + 1\n", namespace)
+    first = core.memoize(namespace["f"], cache_dir=tmp_path)
+    exec("def f(x):\n    return x + 2\n", namespace)
+    second = core.memoize(namespace["f"], cache_dir=tmp_path)
+    assert first(1) == 2
+    assert second(1) == 3
+
+
+def test_config_keys_and_opted_in_seed_are_part_of_the_key(tmp_path):
+    config = core.Config({"core": {"cache_dir": str(tmp_path)}, "data": {"test_size": 0.2}})
+
+    @core.memoize(config=config, config_keys=["data.test_size"], include_seed=True)
+    def split(n):
+        return n
+
+    @core.memoize(config=config)
+    def deterministic(n):
+        return n
+
+    # Resolve the module the cache imports, which later test modules may reload
+    manager = sys.modules["pkg.utils.seed_manager"].SeedManager(1)
+    with manager.scope():
+        base = split.cache_key(10)
+        plain = deterministic.cache_key(10)
+        assert split.cache_key(10) == base
+    with manager.scope(2):
+        assert split.cache_key(10) != base
+        assert deterministic.cache_key(10) == plain
+    with manager.scope():
+        config.set("data.test_size", 0.3)
+        assert split.cache_key(10) != base
+    assert split(10) == 10 and split.cache.directory == tmp_path
+
+
+@requires_numpy
+def test_arrays_are_stored_as_npy_and_memory_mapped(tmp_path):
+    import numpy as np
+
+    calls = []
+
+    @core.memoize(cache_dir=tmp_path)
+    def features(data):
+        calls.append(1)
+        return data * 2
+
+    data = np.arange(10, dtype=np.float32)
+    first = features(data)
+    second = features(np.arange(10, dtype=np.float32))
+    assert calls == [1]
+    assert isinstance(second, np.memmap)
+    assert not second.flags.writeable
+    np.testing.assert_array_equal(first, second)
+    assert features.cache_key(data) != features.cache_key(data.astype(np.float64))
+    assert [p.suffix for p in tmp_path.glob("*/*")] == [".npy"]
+
+
+def test_lru_eviction_keeps_recently_used_entries(tmp_path):
+    cache = cache_mod.DiskCache(tmp_path)
+    payload = b"x" * 1000
+    keys = [cache.make_key(i) for i in range(4)]
+    for offset, key in enumerate(keys):
+        cache.put(key, payload)
+        path = next(tmp_path.glob(f"*/{key}.pkl"))
+        os.utime(path, (time.time() - 100 + offset, time.time() - 100 + offset))
+    assert cache.get(keys[0]) == payload  # refreshes the oldest entry
+
+    entry_size = cache.size() // 4
+    assert cache.evict(2 * entry_size) == 2
+    assert keys[0] in cache and keys[3] in cache
+    assert keys[1] not in cache and keys[2] not in cache
+
+
+def test_put_enforces_max_bytes(tmp_path):
+    cache = cache_mod.DiskCache(tmp_path, max_bytes=2500)
+    for i in range(5):
+        cache.put(cache.make_key(i), b"x" * 1000)
+    assert cache.size() <= 2500
+    assert cache.make_key(4) in cache
+
+
+def test_corrupt_entries_are_misses(tmp_path):
+    cache = cache_mod.DiskCache(tmp_path)
+    key = cache.make_key("k")
+    path = cache.put(key, [1, 2])
+    path.write_bytes(b"not a pickle")
+    assert cache.get(key, "missing") == "missing"
+
+
+def test_unpicklable_results_are_returned_uncached(tmp_path):
+    @core.memoize(cache_dir=tmp_path, include_seed=False)
+    def make_lock():
+        import threading
+
+        return threading.Lock()
+
+    assert make_lock() is not None
+    assert not list(tmp_path.glob("*/*.pkl"))
+
+
+def test_from_config_requires_cache_dir():
+    with pytest.raises(ValueError, match="cache_dir"):
+        cache_mod.DiskCache.from_config(core.Config({}))
+    cache = cache_mod.DiskCache.from_config(core.Config({"core": {"cache_dir": "c", "cache_max_bytes": 10}}))
+    assert cache.directory == Path("c") and cache.max_bytes == 10
+
+
+def test_concurrent_writers_never_expose_partial_entries(tmp_path):
+    src = Path(cache_mod.__file__).parent.parent
+    script = textwrap.dedent(
+        f"""
+        import sys
+        sys.path.insert(0, {str(src.parent)!r})
+        from importlib import import_module
+        cache = import_module({src.name + ".core.cache"!r})
+        store = cache.DiskCache({str(tmp_path)!r})
+        key = store.make_key("shared")
+        for _ in range(50):
+            store.put(key, list(range(20000)))
+            value = store.get(key, "missing")
+            assert value == list(range(20000)), value
+        """
+    )
+    if "{" + "%" in src.joinpath("__init__.py").read_text():
+        pytest.skip("requires a rendered project")
+    workers = [subprocess.Popen([sys.executable, "-c", script]) for _ in range(3)]
+    assert [worker.wait(timeout=60) for worker in workers] == [0, 0, 0]
+    assert not list(tmp_path.glob("*/*.tmp"))
+
+
+def test_default_keys_hit_across_processes(tmp_path):
+    # Every process draws its own random global seed unless one is set, so
+    # keys must not depend on it by default.
+    script = textwrap.dedent(
+        f"""
+        import sys
+        sys.path.insert(0, {str(Path(__file__).resolve().parents[1])!r})
+        from tests.conftest import load_project_module
+
+        core = load_project_module("pkg.core", "core", "__init__.py")
+        load_project_module("pkg.utils.seed_manager", "utils", "seed_manager.py")
+
+        @core.memoize(cache_dir={str(tmp_path)!r})
+        def square(n):
+            print("computed")
+            return n * n
+
+        assert square(12) == 144
+        print(square.cache_key(12))
+        """
+    )
+    runs = [
+        subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout.split()
+        for _ in range(2)
+    ]
+    assert runs[0][0] == "computed"
+    assert runs[1] == runs[0][1:]
@@ -0,0 +1,159 @@
+"""Tests for the command-line interface."""
+
+import json
+import random
+import sys
+
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+core = load_project_module("pkg.core", "core", "__init__.py")
+seed_mod = load_project_module("pkg.utils.seed_manager", "utils", "seed_manager.py")
+if is_installed("sqlalchemy"):
+    config_mod = load_project_module("pkg.config", "config", "__init__.py")
+    session_mod = load_project_module("pkg.db.session", "db", "session.py")
+    bulk_mod = load_project_module("pkg.db.bulk", "db", "bulk.py")
+cli = load_project_module("pkg.cli", "cli", "__init__.py")
+
+
+def test_parser_defers_handlers_to_subcommands():
+    args = cli.build_parser().parse_args(["--profile", "db", "load", "items", "items.csv"])
+    assert args.profile == "cprofile"
+    assert args.func.__name__ == "db_load"
+    assert args.batch_size == 1000
+
+
+def test_no_command_prints_help(capsys):
+    assert cli.main([]) == 2
+    assert "COMMAND" in capsys.readouterr().out
+
+
+def test_seed_info_reports_seed_and_children(capsys):
+    argv = ["seed", "--seed", "7"] + (["--spawn", "2"] if is_installed("numpy") else [])
+    assert cli.main(argv) == 0
+    info = json.loads(capsys.readouterr().out)
+    assert info["seed"] == 7
+    assert info["source"] == "argument"
+    assert info["backends"]["python"] is True
+    if is_installed("numpy"):
+        manager = seed_mod.SeedManager(7)
+        assert info["children"] == [manager.spawn_seed(0), manager.spawn_seed(1)]
+
+
+def test_run_seeds_and_calls_entry_point(tmp_path, monkeypatch):
+    conf_dir = tmp_path / "conf"
+    conf_dir.mkdir()
+    (conf_dir / "config.yaml").write_text("seed: 3\nmodel:\n  lr: 0.1\n")
+    (tmp_path / "cli_pipeline.py").write_text(
+        "import random\n"
+        "calls = []\n"
+        "def main(config):\n"
+        "    calls.append((config.get('model.lr'), random.random()))\n"
+        "    return 5\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        code = cli.main([
+            "run", "cli_pipeline:main",
+            "--conf-dir", str(conf_dir),
+            "-o", "model.lr=0.5",
+            "--seed-libraries", "python",
+        ])
+    finally:
+        core.stop_logging()
+    assert code == 5
+    assert sys.modules["cli_pipeline"].calls == [(0.5, random.Random(3).random())]
+
+
+@pytest.mark.parametrize(
+    ("config", "expected"),
+    [("seed: 3\n", ["python", "numpy"]), ("seed: 3\nseed_libraries: [python]\n", ["python"])],
+)
+def test_run_seeds_cheap_libraries_unless_configured(tmp_path, monkeypatch, config, expected):
+    (tmp_path / "config.yaml").write_text(config)
+    seeded = []
+    manager_cls = sys.modules["pkg.utils.seed_manager"].SeedManager
+    monkeypatch.setattr(manager_cls, "seed_everything", lambda self, libraries=None: seeded.append(libraries))
+    try:
+        assert cli.main(["run", "builtins:repr", "--conf-dir", str(tmp_path)]) == 0
+    finally:
+        core.stop_logging()
+    assert seeded == [expected]
+
+
+def test_run_defaults_to_the_data_pipeline():
+    args = cli.build_parser().parse_args(["run"])
+    assert args.entry_point == "pkg.data:process"
+
+
+def test_run_rejects_malformed_entry_point(tmp_path):
+    (tmp_path / "config.yaml").write_text("seed: 1\n")
+    try:
+        with pytest.raises(SystemExit, match="module:function"):
+            cli.main(["run", "no_colon", "--conf-dir", str(tmp_path)])
+    finally:
+        core.stop_logging()
+
+
+@pytest.mark.skipif(not is_installed("sqlalchemy"), reason="sqlalchemy not installed")
+def test_db_load_converts_csv_values_and_upserts(tmp_path):
+    from sqlalchemy import Boolean, Column, Date, Float, Integer, MetaData, String, Table, create_engine, select
+
+    url = f"sqlite:///{tmp_path / 'cli.db'}"
+    metadata = MetaData()
+    table = Table(
+        "people",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+        Column("score", Float),
+        Column("active", Boolean),
+        Column("born", Date),
+    )
+    engine = create_engine(url)
+    metadata.create_all(engine)
+    csv_path = tmp_path / "people.csv"
+    csv_path.write_text("id,name,score,active,born\n1,ann,1.5,true,2020-01-02\n2,bob,,false,\n")
+
+    assert cli.main(["db", "load", "people", str(csv_path), "--url", url, "--batch-size", "1"]) == 0
+    csv_path.write_text("id,name,score,active,born\n2,bo,2.5,true,\n")
+    assert cli.main(["db", "load", "people", str(csv_path), "--url", url, "--upsert"]) == 0
+
+    with engine.connect() as connection:
+        rows = connection.execute(select(table).order_by(table.c.id)).all()
+    engine.dispose()
+    assert [(r.id, r.name, r.score, r.active) for r in rows] == [(1, "ann", 1.5, True), (2, "bo", 2.5, True)]
+    assert rows[0].born.isoformat() == "2020-01-02"
+
+
+@pytest.mark.skipif(not is_installed("sqlalchemy"), reason="sqlalchemy not installed")
+def test_db_load_rejects_unknown_columns(tmp_path):
+    from sqlalchemy import Column, Integer, MetaData, Table, create_engine
+
+    url = f"sqlite:///{tmp_path / 'cli.db'}"
+    metadata = MetaData()
+    Table("items", metadata, Column("id", Integer, primary_key=True))
+    engine = create_engine(url)
+    metadata.create_all(engine)
+    engine.dispose()
+    csv_path = tmp_path / "items.csv"
+    csv_path.write_text("id,missing\n1,2\n")
+    with pytest.raises(SystemExit, match="missing"):
+        cli.main(["db", "load", "items", str(csv_path), "--url", url])
+
+
+def test_profile_writes_cprofile_dump(tmp_path, capsys):
+    import pstats
+
+    output = tmp_path / "seed.prof"
+    assert cli.main(["--profile", "--profile-output", str(output), "seed", "--seed", "1"]) == 0
+    assert "Wrote cProfile stats" in capsys.readouterr().err
+    assert pstats.Stats(str(output)).total_calls > 0
+
+
+def test_bench_lists_benchmark_scripts(capsys):
+    assert cli.main(["bench", "--list"]) == 0
+    assert "settings" in capsys.readouterr().out.split()
+    with pytest.raises(SystemExit, match="Unknown benchmark"):
+        cli.main(["bench", "no-such-benchmark"])
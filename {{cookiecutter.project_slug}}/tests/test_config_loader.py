@@ -0,0 +1,109 @@
+"""Tests for composing and resolving the conf/ tree."""
+
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from .conftest import load_project_module
+
+core = load_project_module("pkg.core", "core", "__init__.py")
+loader = core.config_loader
+
+CONF_DIR = Path(__file__).resolve().parents[1] / "conf"
+
+
+@pytest.fixture
+def conf_dir(tmp_path: Path) -> Path:
+    """A copy of the project's conf/ tree."""
+    target = tmp_path / "conf"
+    shutil.copytree(CONF_DIR, target)
+    return target
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in ("NUM_WORKERS", "DATA_DIR", "RESULTS_DIR", "LOGS_DIR", "SEED", "LOG_LEVEL"):
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_composes_and_resolves_project_config(conf_dir: Path):
+    cfg = core.load_config(conf_dir=conf_dir)
+    assert cfg.get("core.num_workers") == 4
+    assert cfg.get("core.cache_dir") == "data//cache"
+    assert cfg.get("data.random_state") == 42
+    assert cfg.get("data.batch_size") == 32
+    assert cfg.get("model.params.learning_rate") == 1.0e-3
+    today = datetime.now().strftime("%Y-%m-%d")
+    assert cfg.get("logging.file") == f"logs//{today}.log"
+    assert cfg.get("defaults") is None
+
+
+def test_env_values_stay_strings(conf_dir: Path, monkeypatch):
+    monkeypatch.setenv("NUM_WORKERS", "8")
+    monkeypatch.setenv("PROJECT_VERSION", "1.10")
+    monkeypatch.setenv("DATA_DIR", "/mnt/data")
+    cfg = core.load_config(conf_dir=conf_dir)
+    assert cfg.get("core.num_workers") == "8"
+    assert cfg.get("project.version") == "1.10"
+    assert cfg.get("data.raw_dir") == "/mnt/data/raw"
+
+
+def test_local_overrides_are_merged(conf_dir: Path):
+    (conf_dir / "local" / "paths.yaml").write_text("project_root: ${hydra:runtime.cwd}\n")
+    cfg = core.load_config(conf_dir=conf_dir)
+    assert cfg.get("paths.project_root") == os.getcwd()
+    assert cfg.get("paths.results") == "results/"
+
+
+def test_warm_load_skips_yaml(conf_dir: Path, monkeypatch):
+    first = core.load_config(conf_dir=conf_dir)
+    assert list((conf_dir / ".cache").glob("config-*.pkl"))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML should not be parsed on a warm load")
+
+    monkeypatch.setattr(loader, "_read_yaml", fail)
+    assert core.load_config(conf_dir=conf_dir).to_dict() == first.to_dict()
+
+
+def test_cache_invalidated_by_env_and_files(conf_dir: Path, monkeypatch):
+    core.load_config(conf_dir=conf_dir)
+    monkeypatch.setenv("SEED", "7")
+    assert core.load_config(conf_dir=conf_dir).get("seed") == "7"
+
+    base = conf_dir / "base.yaml"
+    base.write_text(base.read_text().replace("batch_size: 32", "batch_size: 64"))
+    os.utime(base, ns=(0, 0))
+    assert core.load_config(conf_dir=conf_dir).get("data.batch_size") == 64
+
+
+def test_cache_keeps_env_values_out(conf_dir: Path, monkeypatch):
+    monkeypatch.setenv("SEED", "s3cret-seed")
+    assert core.load_config(conf_dir=conf_dir).get("seed") == "s3cret-seed"
+    (cache_file,) = (conf_dir / ".cache").glob("config-*.pkl")
+    assert b"s3cret-seed" not in cache_file.read_bytes()
+
+
+def test_cache_is_keyed_on_conf_dir(tmp_path: Path):
+    for name, size in (("a", 1), ("b", 2)):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "config.yaml").write_text(f"size: {size}\n")
+    shared = tmp_path / "cache"
+    for _ in range(2):
+        assert core.load_config(conf_dir=tmp_path / "a", cache_dir=shared).get("size") == 1
+        assert core.load_config(conf_dir=tmp_path / "b", cache_dir=shared).get("size") == 2
+
+
+def test_interpolation_errors(tmp_path: Path):
+    (tmp_path / "config.yaml").write_text("a: ${b}\nb: ${a}\n")
+    with pytest.raises(ValueError, match="Circular"):
+        core.load_config(conf_dir=tmp_path, use_cache=False)
+    (tmp_path / "config.yaml").write_text("a: ${missing.key}\n")
+    with pytest.raises(KeyError):
+        core.load_config(conf_dir=tmp_path, use_cache=False)
+    (tmp_path / "config.yaml").write_text("a: ${unknown:x}\n")
+    with pytest.raises(ValueError, match="Unsupported resolver"):
+        core.load_config(conf_dir=tmp_path, use_cache=False)
@@ -1,7 +1,10 @@
 """Tests for core module functionality."""
 
+import pickle
 from pathlib import Path
 
+import pytest
+
 from .conftest import load_project_module
 
 # Load the core module directly from the source tree
@@ -38,6 +41,45 @@ class TestConfig:
         assert cfg.get("key1") == "value1"
         assert cfg.get("key2") == 42
 
+    def test_dotted_keys(self):
+        cfg = core.Config({"model": {"params": {"learning_rate": 0.1}}, "a.b": "flat"})
+        assert cfg.get("model.params.learning_rate") == 0.1
+        assert cfg.get("model.params.missing", "default") == "default"
+        assert cfg.get("model.params.learning_rate.deeper") is None
+        assert cfg.get("a.b") == "flat"
+
+    def test_set_invalidates_cached_paths(self):
+        cfg = core.Config({"model": {"params": {"learning_rate": 0.1}}})
+        assert cfg.get("model.params.learning_rate") == 0.1
+        cfg.set("model.params.learning_rate", 0.01)
+        assert cfg.get("model.params.learning_rate") == 0.01
+        cfg.set("training.max_epochs", 5)
+        assert cfg.get("training") == {"max_epochs": 5}
+
+
+class TestFrozenConfig:
+    """Tests for immutable configuration snapshots."""
+
+    def test_snapshot_is_independent_and_immutable(self):
+        cfg = core.Config({"model": {"params": {"hidden_size": 128}}})
+        frozen = cfg.freeze()
+        cfg.set("model.params.hidden_size", 256)
+        assert frozen.get("model.params.hidden_size") == 128
+        assert frozen["model.params"]["hidden_size"] == 128
+        assert "model.params" in frozen
+        with pytest.raises(TypeError):
+            frozen.set("model", {})
+        with pytest.raises(TypeError):
+            frozen["model"]["params"] = {}
+        with pytest.raises(TypeError):
+            frozen.extra = 1
+
+    def test_snapshot_pickles(self):
+        frozen = core.FrozenConfig({"data": {"batch_size": 32}})
+        restored = pickle.loads(pickle.dumps(frozen))
+        assert restored.get("data.batch_size") == 32
+        assert restored.to_dict() == {"data": {"batch_size": 32}}
+
 
 def test_global_config():
     """Ensure the global config instance has the expected defaults."""
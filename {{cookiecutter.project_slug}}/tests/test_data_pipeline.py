@@ -0,0 +1,174 @@
+"""Tests for the streaming data pipeline."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+# The executor imports pkg.utils lazily, so the root package must be registered
+load_project_module("pkg", "__init__.py")
+core = load_project_module("pkg.core", "core", "__init__.py")
+data = load_project_module("pkg.data", "data", "__init__.py")
+
+requires_numpy = pytest.mark.skipif(not is_installed("numpy"), reason="numpy not installed")
+
+
+@pytest.fixture
+def raw_dir(tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "a.csv").write_text("id,value\n" + "".join(f"{i},{i * 10}\n" for i in range(5)))
+    (raw / "b.jsonl").write_text("".join(json.dumps({"id": i}) + "\n" for i in range(5, 8)))
+    (raw / "notes.md").write_text("not a data file\n")
+    return raw
+
+
+def read_shard(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_batches_are_bounded_and_do_not_span_files(raw_dir):
+    pipeline = data.Pipeline(raw_dir, batch_size=2)
+    assert [p.name for p in pipeline.files()] == ["a.csv", "b.jsonl"]
+    sizes = [len(batch) for batch in pipeline]
+    assert sizes == [2, 2, 1, 2, 1]
+
+
+def test_run_applies_transforms_and_writes_shards(raw_dir, tmp_path):
+    def to_int(batch):
+        return [{key: int(value) for key, value in record.items()} for record in batch]
+
+    def drop_small(batch):
+        return batch if len(batch) > 1 else None
+
+    out = tmp_path / "processed"
+    shards = data.Pipeline(raw_dir, out, batch_size=2).map(to_int).map(drop_small).run()
+    assert [p.name for p in shards] == ["part-00000.jsonl", "part-00001.jsonl", "part-00002.jsonl"]
+    assert read_shard(shards[0]) == [{"id": 0, "value": 0}, {"id": 1, "value": 10}]
+    assert read_shard(shards[2]) == [{"id": 5}, {"id": 6}]
+    assert not list(out.glob(".*.tmp"))
+
+
+def test_rerun_removes_stale_shards(raw_dir, tmp_path):
+    out = tmp_path / "processed"
+    data.Pipeline(raw_dir, out, batch_size=1).run()
+    assert len(list(out.glob("part-*"))) == 8
+    data.Pipeline(raw_dir, out, batch_size=4).run()
+    assert sorted(p.name for p in out.glob("part-*")) == [
+        "part-00000.jsonl", "part-00001.jsonl", "part-00002.jsonl",
+    ]
+
+
+def test_failed_shard_write_keeps_the_original_error(raw_dir, tmp_path, monkeypatch):
+    def fail(batch, handle):
+        raise RuntimeError("disk full")
+
+    def unlink(path):
+        raise PermissionError(path)
+
+    monkeypatch.setitem(data.pipeline._WRITERS, ".fail", fail)
+    monkeypatch.setattr(data.pipeline.os, "unlink", unlink)
+    with pytest.raises(RuntimeError, match="disk full"):
+        data.Pipeline(raw_dir, tmp_path / "processed", shard_format=".fail").run()
+
+
+def test_from_config_reads_data_section(raw_dir, tmp_path):
+    config = core.Config({"data": {"raw_dir": str(raw_dir), "processed_dir": str(tmp_path / "p"), "batch_size": 3}})
+    pipeline = data.Pipeline.from_config(config)
+    assert pipeline.batch_size == 3
+    assert data.process(config) == 0
+    assert len(list((tmp_path / "p").glob("part-*.jsonl"))) == 3
+    with pytest.raises(ValueError, match="raw_dir"):
+        data.Pipeline.from_config(core.Config({}))
+
+
+def test_run_with_executor_preserves_order(raw_dir, tmp_path):
+    def tag(batch):
+        return [dict(record, worker=threading.current_thread().name) for record in batch]
+
+    executor = core.ParallelExecutor(2, "thread", seed=1)
+    with executor:
+        shards = data.Pipeline(raw_dir, tmp_path / "out", batch_size=2).map(tag).run(executor)
+    ids = [record["id"] for shard in shards for record in read_shard(shard)]
+    assert ids == ["0", "1", "2", "3", "4", 5, 6, 7]
+
+
+def test_prefetch_reads_ahead_on_a_background_thread():
+    produced = []
+
+    def items():
+        for i in range(5):
+            produced.append(threading.current_thread().name)
+            yield i
+
+    iterator = data.prefetch(items(), depth=2)
+    assert next(iterator) == 0
+    time.sleep(0.05)
+    assert len(produced) >= 3  # one consumed, two queued
+    assert list(iterator) == [1, 2, 3, 4]
+    assert set(produced) == {"prefetch"}
+
+
+def test_prefetch_propagates_errors_and_stops_early():
+    def failing():
+        yield 1
+        raise OSError("disk gone")
+
+    iterator = data.prefetch(failing())
+    assert next(iterator) == 1
+    with pytest.raises(OSError, match="disk gone"):
+        next(iterator)
+
+    pulled = []
+
+    def endless():
+        i = 0
+        while True:
+            pulled.append(i)
+            yield i
+            i += 1
+
+    iterator = data.prefetch(endless(), depth=1)
+    assert next(iterator) == 0
+    iterator.close()
+    time.sleep(0.3)
+    count = len(pulled)
+    time.sleep(0.2)
+    assert len(pulled) == count
+
+
+def test_custom_readers_and_invalid_arguments(tmp_path):
+    @data.register_reader(".tsv")
+    def read_tsv(path, batch_size):
+        rows = [line.split("\t") for line in path.read_text().splitlines()]
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
+    (tmp_path / "x.tsv").write_text("a\tb\nc\td\n")
+    assert list(data.Pipeline(tmp_path, batch_size=5)) == [[["a", "b"], ["c", "d"]]]
+    with pytest.raises(ValueError, match="batch_size"):
+        data.Pipeline(tmp_path, batch_size=0)
+    with pytest.raises(ValueError, match="shard format"):
+        data.Pipeline(tmp_path, shard_format=".xyz")
+    with pytest.raises(ValueError, match="processed_dir"):
+        data.Pipeline(tmp_path).run()
+
+
+@requires_numpy
+def test_npy_files_stream_as_memory_mapped_slices(tmp_path):
+    import numpy as np
+
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    np.save(raw / "x.npy", np.arange(10, dtype=np.int64).reshape(5, 2))
+    pipeline = data.Pipeline(raw, tmp_path / "out", batch_size=2)
+    batches = list(pipeline)
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert isinstance(batches[0], np.memmap)
+
+    shards = pipeline.map(lambda batch: batch * 2).run()
+    assert [p.suffix for p in shards] == [".npy"] * 3
+    np.testing.assert_array_equal(np.load(shards[2]), [[16, 18]])
@@ -0,0 +1,98 @@
+"""Tests for the hash-based train/test split."""
+
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+core = load_project_module("pkg.core", "core", "__init__.py")
+load_project_module("pkg.utils.seed_manager", "utils", "seed_manager.py")
+data = load_project_module("pkg.data", "data", "__init__.py")
+
+requires_numpy = pytest.mark.skipif(not is_installed("numpy"), reason="numpy not installed")
+
+
+def test_hashes_are_pinned_across_machines_and_releases():
+    # Changing these values would silently move rows between splits
+    splitter = data.HashSplit(0.2, seed=42)
+    assert splitter.hash(0) == 0x57E1FABA65107204
+    assert splitter.hash("user-1") == 0xDFCA785D7316A08B
+    assert [key for key in range(20) if splitter.is_test(key)] == [7]
+
+
+def test_assignment_depends_on_seed_but_not_on_other_rows():
+    a, b = data.HashSplit(0.5, seed=1), data.HashSplit(0.5, seed=2)
+    keys = range(1000)
+    assert [a.is_test(k) for k in keys] != [b.is_test(k) for k in keys]
+    assert a.is_test(123) == data.HashSplit(0.5, seed=1).is_test(123)
+    assert a.is_test("x") == a.is_test(b"x")
+
+
+def test_proportion_and_edge_sizes():
+    splitter = data.HashSplit(0.2, seed=7)
+    fraction = sum(splitter.is_test(k) for k in range(20000)) / 20000
+    assert abs(fraction - 0.2) < 0.01
+    assert not any(data.HashSplit(0.0, seed=7).is_test(k) for k in range(100))
+    assert all(data.HashSplit(1.0, seed=7).is_test(k) for k in range(100))
+    with pytest.raises(ValueError, match="test_size"):
+        data.HashSplit(1.5, seed=7)
+
+
+def test_filter_streams_disjoint_complementary_splits():
+    splitter = data.HashSplit(0.3, seed=3)
+    rows = [{"id": f"r{i}"} for i in range(500)]
+    train = list(splitter.filter(iter(rows), key=lambda row: row["id"]))
+    test = list(splitter.filter(iter(rows), key=lambda row: row["id"], split="test"))
+    assert len(train) + len(test) == 500
+    assert not {r["id"] for r in train} & {r["id"] for r in test}
+    with pytest.raises(TypeError):
+        splitter.is_test(1.5)
+
+
+def test_from_config_uses_data_section():
+    config = core.Config({"data": {"test_size": 0.25, "random_state": 11}})
+    splitter = data.HashSplit.from_config(config)
+    assert (splitter.test_size, splitter.seed) == (0.25, 11)
+
+
+@requires_numpy
+def test_vectorised_mask_matches_scalar_path():
+    import numpy as np
+
+    splitter = data.HashSplit(0.2, seed=42)
+    ints = np.arange(-500, 3000, dtype=np.int64)
+    assert splitter.mask(ints).tolist() == [splitter.is_test(int(k)) for k in ints]
+    assert splitter.mask(ints.astype(np.int32)).tolist() == splitter.mask(ints).tolist()
+    strings = np.array([f"id{i}" for i in range(500)])
+    assert splitter.mask(strings).tolist() == [splitter.is_test(k) for k in strings.tolist()]
+    assert splitter.hash_array(ints[:3]).tolist() == [splitter.hash(int(k)) for k in ints[:3]]
+    with pytest.raises(TypeError):
+        splitter.mask(np.linspace(0, 1, 5))
+
+
+@requires_numpy
+def test_stratified_mask_is_exact_per_stratum():
+    import numpy as np
+
+    splitter = data.HashSplit(0.2, seed=5)
+    labels = np.array(["a"] * 903 + ["b"] * 97)
+    test = splitter.mask(np.arange(1000), labels)
+    assert test[labels == "a"].sum() == 181
+    assert test[labels == "b"].sum() == 19
+    # The chosen rows are the ones with the smallest hashes in their stratum
+    hashes = splitter.hash_array(np.arange(1000))
+    b_hashes = hashes[labels == "b"]
+    assert set(b_hashes[test[labels == "b"]]) == set(np.sort(b_hashes)[:19])
+
+
+@requires_numpy
+def test_split_arrays_like_scikit_learn():
+    import numpy as np
+
+    X = np.arange(100).reshape(50, 2)
+    y = np.arange(50) % 2
+    X_train, X_test, y_train, y_test = data.train_test_split(X, y, keys=np.arange(50) + 1000, seed=1, strata=y)
+    assert len(X_train) + len(X_test) == 50 and len(X_test) == 10
+    assert y_test.sum() == 5
+    np.testing.assert_array_equal(X_test[:, 0] // 2 % 2, y_test)
+    with pytest.raises(ValueError, match="same length"):
+        data.train_test_split(X, y[:-1])
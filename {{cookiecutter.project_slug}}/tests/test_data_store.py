@@ -0,0 +1,140 @@
+"""Tests for the memory-mapped column store."""
+
+import json
+import multiprocessing
+import pickle
+import sys
+import types
+
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+pytestmark = [
+    pytest.mark.skipif(not is_installed("numpy"), reason="numpy not installed"),
+    pytest.mark.filterwarnings("ignore:os.fork:RuntimeWarning"),
+]
+
+core = load_project_module("pkg.core", "core", "__init__.py")
+seed_mod = load_project_module("pkg.utils.seed_manager", "utils", "seed_manager.py")
+data = load_project_module("pkg.data", "data", "__init__.py")
+store_mod = data.store
+sys.modules.setdefault("pkg", types.ModuleType("pkg"))
+
+
+@pytest.fixture(autouse=True)
+def _own_modules(monkeypatch):
+    """Re-register this module's packages in case a later test module reloaded them."""
+    monkeypatch.setitem(sys.modules, "pkg.core", core)
+    monkeypatch.setitem(sys.modules, "pkg.core.parallel", core.parallel)
+    monkeypatch.setitem(sys.modules, "pkg.utils.seed_manager", seed_mod)
+    monkeypatch.setitem(sys.modules, "pkg.data.store", store_mod)
+
+
+def column_sum(args):
+    store, name = args
+    return float(store[name].sum())
+
+
+def test_round_trip_as_read_only_memmaps(tmp_path):
+    import numpy as np
+
+    embedding = np.random.default_rng(0).random((100, 8), dtype=np.float32)
+    written = data.write_store(
+        tmp_path / "features",
+        {"label": np.arange(100), "embedding": embedding, "name": [f"row{i}" for i in range(100)]},
+        metadata={"source": "unit-test"},
+    )
+    store = data.ColumnStore(tmp_path / "features")
+    assert store.columns == ["label", "embedding", "name"] == written.columns
+    assert len(store) == 100 and store.metadata == {"source": "unit-test"}
+    view = store["embedding"]
+    assert isinstance(view, np.memmap) and not view.flags.writeable
+    np.testing.assert_array_equal(view, embedding)
+    assert store["name"][42] == "row42"
+    # Data starts on a 64-byte boundary and the files are ordinary .npy files
+    assert view.ctypes.data % 64 == 0
+    np.testing.assert_array_equal(np.load(tmp_path / "features" / "label.0.npy"), np.arange(100))
+
+
+def test_writer_appends_batches_and_casts_safely(tmp_path):
+    import numpy as np
+
+    with data.StoreWriter(tmp_path, dtypes={"tag": "U4"}) as writer:
+        writer.append({"x": np.arange(3, dtype=np.int64), "tag": ["a", "b", "c"]})
+        writer.append({"x": np.arange(2, dtype=np.int32), "tag": ["long", "d"]})
+        with pytest.raises(ValueError, match="Cannot cast"):
+            writer.append({"x": np.ones(1), "tag": ["e"]})
+        with pytest.raises(ValueError, match="differ"):
+            writer.append({"x": [1]})
+        with pytest.raises(ValueError, match="equal length"):
+            writer.append({"x": [1, 2], "tag": ["e"]})
+    store = data.ColumnStore(tmp_path)
+    assert store["x"].tolist() == [0, 1, 2, 0, 1]
+    assert store["tag"].tolist() == ["a", "b", "c", "long", "d"]
+    assert store.schema["columns"]["x"]["dtype"] == "<i8"
+
+
+def test_failed_write_leaves_existing_store_untouched(tmp_path):
+    data.write_store(tmp_path, {"x": [1, 2, 3]})
+    with pytest.raises(RuntimeError):
+        with data.StoreWriter(tmp_path) as writer:
+            writer.append({"x": [9, 9]})
+            raise RuntimeError("pipeline failed")
+    assert data.ColumnStore(tmp_path)["x"].tolist() == [1, 2, 3]
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_rewrite_switches_generation_and_keeps_old_views_valid(tmp_path):
+    old = data.write_store(tmp_path, {"x": [1, 2, 3], "y": [4, 5, 6]})
+    old_view = old["x"]
+    new = data.write_store(tmp_path, {"x": [7, 8]})
+    assert sorted(p.name for p in tmp_path.glob("*.npy")) == ["x.1.npy"]
+    assert new["x"].tolist() == [7, 8] and new.columns == ["x"]
+    assert old_view.tolist() == [1, 2, 3]
+
+
+def test_batches_and_read_return_views(tmp_path):
+    import numpy as np
+
+    store = data.write_store(tmp_path, {"a": np.arange(10), "b": np.arange(10) * 2})
+    batches = list(store.batches(4, columns=["b"]))
+    assert [batch["b"].tolist() for batch in batches] == [[0, 2, 4, 6], [8, 10, 12, 14], [16, 18]]
+    part = store.read(start=2, stop=4)
+    assert np.shares_memory(part["a"], store["a"])
+    with pytest.raises(ValueError, match="batch_size"):
+        list(store.batches(0))
+
+
+def test_empty_and_invalid_stores(tmp_path):
+    import numpy as np
+
+    empty = data.write_store(tmp_path / "empty", {"x": np.zeros((0, 3))})
+    assert empty["x"].shape == (0, 3)
+    with pytest.raises(ValueError, match="object dtype"):
+        data.write_store(tmp_path / "obj", {"x": np.array([{}, []], dtype=object)})
+    with pytest.raises(ValueError, match="Invalid column name"):
+        data.write_store(tmp_path / "bad", {"../x": [1]})
+
+    store = data.write_store(tmp_path / "cut", {"x": np.arange(100)})
+    path = tmp_path / "cut" / "x.0.npy"
+    path.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(ValueError, match="truncated"):
+        data.ColumnStore(tmp_path / "cut")["x"]
+
+    schema = json.loads((tmp_path / "cut" / "schema.json").read_text())
+    schema["version"] = 99
+    (tmp_path / "cut" / "schema.json").write_text(json.dumps(schema))
+    with pytest.raises(ValueError, match="version"):
+        data.ColumnStore(tmp_path / "cut")
+    assert store.num_rows == 100
+
+
+def test_store_pickles_as_its_path_for_workers(tmp_path):
+    import numpy as np
+
+    store = data.write_store(tmp_path, {"x": np.arange(1_000_000, dtype=np.float64)})
+    assert len(pickle.dumps(store)) < 1000
+    with core.ParallelExecutor(2, "process", seed=1, mp_context=multiprocessing.get_context("fork")) as executor:
+        sums = list(executor.map(column_sum, [(store, "x")] * 2))
+    assert sums == [float(np.arange(1_000_000).sum())] * 2
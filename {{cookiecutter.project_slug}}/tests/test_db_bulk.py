@@ -0,0 +1,130 @@
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+pytestmark = pytest.mark.skipif(
+    not (is_installed("sqlalchemy") and is_installed("numpy")),
+    reason="sqlalchemy and numpy not installed",
+)
+
+if is_installed("sqlalchemy"):
+    config_mod = load_project_module("pkg.config", "config", "__init__.py")
+    session_mod = load_project_module("pkg.db.session", "db", "session.py")
+    bulk_mod = load_project_module("pkg.db.bulk", "db", "bulk.py")
+
+
+@pytest.fixture
+def items(tmp_path):
+    from sqlalchemy import Column, Float, Integer, MetaData, String, Table, create_engine
+
+    metadata = MetaData()
+    table = Table(
+        "items",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+        Column("score", Float),
+    )
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+    metadata.create_all(engine)
+    yield engine, table
+    engine.dispose()
+
+
+def rows(count, start=0, name="item"):
+    return ({"id": i, "name": f"{name}-{i}", "score": i / 2} for i in range(start, start + count))
+
+
+def test_bulk_insert_batches_lazily(items):
+    from sqlalchemy import event, func, select
+
+    engine, table = items
+    statements = []
+    event.listen(engine, "before_execute", lambda *args: statements.append(args))
+    with engine.begin() as connection:
+        assert bulk_mod.bulk_insert(connection, table, rows(25), batch_size=10) == 25
+        assert connection.execute(select(func.count()).select_from(table)).scalar() == 25
+    # 3 batches + the count query
+    assert len(statements) == 4
+
+
+def test_bulk_insert_accepts_session_and_mapped_class(items):
+    from sqlalchemy.orm import Session, declarative_base
+
+    engine, table = items
+    Item = type("Item", (declarative_base(),), {"__table__": table})
+    with Session(engine) as session:
+        bulk_mod.bulk_insert(session, Item, rows(5))
+        session.commit()
+        assert session.get(Item, 3).name == "item-3"
+
+
+def test_invalid_arguments(items):
+    engine, table = items
+    with engine.begin() as connection:
+        with pytest.raises(ValueError):
+            bulk_mod.bulk_insert(connection, table, rows(1), batch_size=0)
+        with pytest.raises(TypeError):
+            bulk_mod.bulk_insert(connection, object(), rows(1))
+    with pytest.raises(ValueError, match="not supported for dialect 'oracle'"):
+        bulk_mod._upsert_statement("oracle", table, ["id"], ["name"])
+
+
+def test_bulk_upsert_updates_existing_rows(items):
+    from sqlalchemy import select
+
+    engine, table = items
+    with engine.begin() as connection:
+        bulk_mod.bulk_insert(connection, table, rows(10))
+        sent = bulk_mod.bulk_upsert(connection, table, rows(10, start=5, name="new"), batch_size=4)
+        assert sent == 10
+        names = dict(connection.execute(select(table.c.id, table.c.name)).all())
+    assert len(names) == 15
+    assert names[4] == "item-4"
+    assert names[5] == "new-5"
+    assert names[14] == "new-14"
+
+
+def test_bulk_upsert_can_skip_conflicts(items):
+    from sqlalchemy import select
+
+    engine, table = items
+    with engine.begin() as connection:
+        bulk_mod.bulk_insert(connection, table, rows(3))
+        bulk_mod.bulk_upsert(connection, table, rows(5, name="new"), update_columns=())
+        names = connection.execute(select(table.c.name).order_by(table.c.id)).scalars().all()
+    assert names == ["item-0", "item-1", "item-2", "new-3", "new-4"]
+
+
+def test_stream_rows_yields_all_rows(items):
+    from sqlalchemy import select
+
+    engine, table = items
+    with engine.begin() as connection:
+        bulk_mod.bulk_insert(connection, table, rows(50))
+        stream = bulk_mod.stream_rows(
+            connection, select(table).where(table.c.id >= 10).order_by(table.c.id), batch_size=7
+        )
+        ids = [row.id for row in stream]
+    assert ids == list(range(10, 50))
+
+
+def test_stream_columns_yields_bounded_numpy_chunks(items):
+    import numpy as np
+    from sqlalchemy import select
+
+    engine, table = items
+    with engine.begin() as connection:
+        bulk_mod.bulk_insert(connection, table, rows(25))
+        chunks = list(
+            bulk_mod.stream_columns(
+                connection,
+                select(table.c.id, table.c.score).order_by(table.c.id),
+                batch_size=10,
+                dtypes={"id": np.int32},
+            )
+        )
+    assert [len(chunk["id"]) for chunk in chunks] == [10, 10, 5]
+    assert chunks[0]["id"].dtype == np.int32
+    assert chunks[0]["score"].dtype == np.float64
+    np.testing.assert_array_equal(np.concatenate([c["score"] for c in chunks]), np.arange(25) / 2)
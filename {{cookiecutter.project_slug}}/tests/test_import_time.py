@@ -0,0 +1,77 @@
+"""Import-time regression tests for the top-level package."""
+
+import importlib.util
+import json
+import subprocess
+import sys
+
+import pytest
+
+PACKAGE = "{{ cookiecutter.project_slug }}"
+
+# Generous budget for a cold ``import <package>``; ML frameworks alone take seconds.
+IMPORT_BUDGET_SECONDS = 0.5
+
+HEAVY_MODULES = ("numpy", "torch", "tensorflow", "jax")
+
+pytestmark = pytest.mark.skipif(
+    not PACKAGE.isidentifier() or importlib.util.find_spec(PACKAGE) is None,
+    reason="package is not installed (template not rendered)",
+)
+
+
+def _run_cold(code: str) -> dict:
+    """Run ``code`` in a fresh interpreter and return its JSON output."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def test_bare_import_is_fast_and_avoids_frameworks():
+    code = f"""
+import json, sys, time
+start = time.perf_counter()
+import {PACKAGE}
+elapsed = time.perf_counter() - start
+print(json.dumps(dict(elapsed=elapsed, modules=sorted(sys.modules))))
+"""
+    report = _run_cold(code)
+    loaded = set(report["modules"])
+    assert not loaded & set(HEAVY_MODULES)
+    assert report["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+def test_core_access_does_not_import_frameworks():
+    code = f"""
+import json, sys
+import {PACKAGE}
+{PACKAGE}.get_version()
+{PACKAGE}.Config(dict(seed=1))
+print(json.dumps(sorted(set(sys.modules) & set({HEAVY_MODULES!r}))))
+"""
+    assert _run_cold(code) == []
+
+
+def test_seed_manager_imports_only_requested_backend():
+    code = f"""
+import json, sys
+from {PACKAGE} import SeedManager
+SeedManager(7).seed_everything(["python"])
+print(json.dumps(sorted(set(sys.modules) & set({HEAVY_MODULES!r}))))
+"""
+    assert _run_cold(code) == []
+
+
+def test_cli_startup_defers_heavy_imports():
+    code = f"""
+import json, sys
+from {PACKAGE}.cli import build_parser
+build_parser().parse_args(["db", "load", "items", "items.csv"])
+print(json.dumps(sorted(m for m in sys.modules if m.split(".")[0] in {HEAVY_MODULES + ("sqlalchemy", "fastapi", "pydantic")!r})))
+"""
+    assert _run_cold(code) == []
@@ -0,0 +1,78 @@
+"""Tests for the JAX key pool."""
+
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+seed_mod = load_project_module("pkg.utils.seed_manager", "utils", "seed_manager.py")
+keys_mod = load_project_module("pkg.utils.jax_keys", "utils", "jax_keys.py")
+
+requires_jax = pytest.mark.skipif(not is_installed("jax"), reason="jax not installed")
+
+
+def test_seeding_jax_leaves_module_untouched():
+    import jax
+
+    prng_key = jax.random.PRNGKey
+    assert seed_mod.SeedManager(5).seed_everything(["jax"]) == {"jax": True}
+    assert jax.random.PRNGKey is prng_key
+    if is_installed("jax"):
+        assert not jax.config.jax_enable_x64
+
+
+@requires_jax
+def test_pool_hands_out_unique_keys():
+    import jax
+    import numpy as np
+
+    pool = keys_mod.JaxKeyPool(jax.random.PRNGKey(0), batch_size=4)
+    keys = [pool.next_key() for _ in range(6)] + list(pool.take(3)) + list(pool.take(10))
+    assert len({tuple(np.asarray(k).tolist()) for k in keys}) == len(keys)
+    assert pool.take(10).shape[0] == 10
+
+
+@requires_jax
+def test_consumers_get_independent_reproducible_streams():
+    import numpy as np
+
+    manager = seed_mod.SeedManager(42)
+    assert manager.jax_keys("model") is manager.jax_keys("model")
+    a = np.asarray(manager.jax_keys("model").take(4))
+    b = np.asarray(seed_mod.SeedManager(42).jax_keys("model").take(4))
+    c = np.asarray(manager.jax_keys("data").take(4))
+    np.testing.assert_array_equal(a, b)
+    assert not np.array_equal(a, c)
+
+
+@requires_jax
+def test_named_and_integer_consumers_never_share_a_stream():
+    import zlib
+
+    import numpy as np
+
+    manager = seed_mod.SeedManager(42)
+    named = np.asarray(manager.jax_keys("model").take(4))
+    indexed = np.asarray(manager.jax_keys(zlib.crc32(b"model")).take(4))
+    assert not np.array_equal(named, indexed)
+
+
+@requires_jax
+def test_invalid_batch_size():
+    import jax
+
+    with pytest.raises(ValueError):
+        keys_mod.JaxKeyPool(jax.random.PRNGKey(0), batch_size=0)
+
+
+@requires_jax
+def test_manager_state_resumes_key_pools():
+    import numpy as np
+
+    manager = seed_mod.SeedManager(9)
+    manager.jax_keys("model", batch_size=4).take(3)
+    checkpoint = manager.state_bytes()
+    expected = np.asarray(manager.jax_keys("model").take(2))
+
+    restored = seed_mod.SeedManager(0)
+    restored.set_state(checkpoint)
+    assert np.array_equal(np.asarray(restored.jax_keys("model").take(2)), expected)
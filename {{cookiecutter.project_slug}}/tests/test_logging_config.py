@@ -0,0 +1,56 @@
+"""Tests for the queue-based logging setup."""
+
+import logging
+
+import pytest
+
+from .conftest import load_project_module
+
+core = load_project_module("pkg.core", "core", "__init__.py")
+logging_config = core.logging_config
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    logging.disable(logging.NOTSET)
+    yield tmp_path / "logs" / "run.log"
+    core.stop_logging()
+
+
+def _config(path, **extra):
+    return core.Config({"logging": {"level": "INFO", "file": str(path), **extra}})
+
+
+def test_import_does_not_configure_root_logger():
+    handlers = list(logging.getLogger().handlers)
+    load_project_module("fresh_core", "core", "__init__.py")
+    assert logging.getLogger().handlers == handlers
+
+
+def test_records_are_written_by_listener(log_file):
+    core.configure_logging(_config(log_file, format="%(levelname)s %(message)s"), console=False)
+    logging.getLogger("example").info("hello %s", "world")
+    logging.getLogger("example").debug("hidden")
+    core.stop_logging()
+    assert log_file.read_text() == "INFO hello world\n"
+
+
+def test_reconfiguring_replaces_handler(log_file):
+    core.configure_logging(_config(log_file), console=False)
+    core.configure_logging(_config(log_file), console=False)
+    installed = [
+        h for h in logging.getLogger().handlers if isinstance(h, logging_config._QueueHandler)
+    ]
+    assert len(installed) == 1
+
+
+def test_log_file_rotates(log_file):
+    core.configure_logging(
+        _config(log_file, format="%(message)s", max_bytes=100, backup_count=2), console=False
+    )
+    for index in range(20):
+        logging.getLogger("example").info("line %02d %s", index, "x" * 20)
+    core.stop_logging()
+    assert log_file.exists()
+    assert (log_file.parent / "run.log.1").exists()
+    assert not (log_file.parent / "run.log.3").exists()
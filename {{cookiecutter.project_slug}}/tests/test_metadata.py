@@ -0,0 +1,146 @@
+"""Tests for the metadata registry."""
+
+import os
+import pickle
+import sys
+import types
+from datetime import date
+
+import pytest
+
+from .conftest import load_project_module
+
+core = load_project_module("pkg.core", "core", "__init__.py")
+metadata = load_project_module("pkg.metadata", "metadata", "__init__.py")
+registry_mod = metadata.registry
+sys.modules.setdefault("pkg", types.ModuleType("pkg"))
+
+PEOPLE = "id,name,email,affiliation,orcid,role,github,notes,team\n1,Ada,ada@x.org,Lab,,Lead,,,core\n2,Bob,bob@x.org,Lab,,Dev,,,\n"
+PROJECTS = (
+    "id,title,description,start_date,end_date,status,lead_id,github_url,notes\n"
+    "1,Alpha,,2024-01-01,,Active,1,,\n"
+    "2,Beta,,,,Planned,,,\n"
+)
+DELIVERABLES = (
+    "id,project_id,title,description,due_date,status,priority,owner_id,notes\n"
+    "1,1,Release,,2024-06-01,Planned,High,2,\n"
+    "2,1,Paper,,,Planned,Low,,\n"
+    "3,2,Spec,,,Done,Low,1,\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def _own_modules(monkeypatch):
+    """Re-register the registry module so records pickle by reference."""
+    monkeypatch.setitem(sys.modules, "pkg.metadata", metadata)
+    monkeypatch.setitem(sys.modules, "pkg.metadata.registry", registry_mod)
+    monkeypatch.setattr(registry_mod, "_loaded", {})
+
+
+@pytest.fixture
+def metadata_dir(tmp_path):
+    directory = tmp_path / "metadata"
+    directory.mkdir()
+    (directory / "people.csv").write_text(PEOPLE)
+    (directory / "projects.csv").write_text(PROJECTS)
+    (directory / "deliverables.csv").write_text(DELIVERABLES)
+    return directory
+
+
+def test_records_are_typed_slotted_and_keep_extra_columns(metadata_dir):
+    registry = metadata.load_metadata(metadata_dir)
+    ada = registry.person(1)
+    assert ada.name == "Ada" and ada.extra == {"team": "core"}
+    assert not hasattr(ada, "__dict__")
+    alpha = registry.project(1)
+    assert alpha.start_date == date(2024, 1, 1) and alpha.end_date is None and alpha.lead_id == 1
+    assert registry.deliverable(2).owner_id is None
+    assert registry.person(99) is None
+    assert pickle.loads(pickle.dumps(alpha)) == alpha
+
+
+def test_foreign_key_indexes_answer_joins(metadata_dir):
+    registry = metadata.load_metadata(metadata_dir)
+    assert [d.title for d in registry.deliverables_for_project(1)] == ["Release", "Paper"]
+    pairs = registry.deliverables_with_owners(1)
+    assert [(d.title, owner.name if owner else None) for d, owner in pairs] == [("Release", "Bob"), ("Paper", None)]
+    assert [p.title for p in registry.projects_led_by(1)] == ["Alpha"]
+    assert [d.title for d in registry.deliverables_owned_by(1)] == ["Spec"]
+    assert registry.deliverables_for_project(42) == []
+    assert len(registry) == 7
+
+
+def test_integrity_problems_are_collected_in_one_pass(metadata_dir):
+    (metadata_dir / "projects.csv").write_text(PROJECTS + "3,Gamma,,not-a-date,,Active,,,\n1,Dup,,,,Active,,,\n")
+    (metadata_dir / "deliverables.csv").write_text(DELIVERABLES + "4,9,Orphan,,,Planned,Low,7,\n5,,NoProject,,,,,,\n")
+    with pytest.raises(metadata.MetadataError) as excinfo:
+        metadata.load_metadata(metadata_dir)
+    errors = excinfo.value.errors
+    assert errors == [
+        "projects.csv:4: invalid start_date 'not-a-date'",
+        "projects.csv:5: duplicate id 1",
+        "deliverables.csv:5: project_id 9 does not match any projects id",
+        "deliverables.csv:5: owner_id 7 does not match any people id",
+        "deliverables.csv:6: missing project_id",
+    ]
+    registry = metadata.load_metadata(metadata_dir, strict=False)
+    assert registry.errors == errors
+    assert registry.project(1).title == "Alpha"
+
+
+def test_missing_files_load_as_empty_tables(tmp_path):
+    registry = metadata.load_metadata(tmp_path, use_cache=False)
+    assert len(registry) == 0 and registry.errors == []
+
+
+def test_parse_is_cached_until_a_file_changes(metadata_dir, monkeypatch):
+    calls = []
+    original = registry_mod.MetadataRegistry.from_directory.__func__
+
+    def counting(cls, directory):
+        calls.append(directory)
+        return original(cls, directory)
+
+    monkeypatch.setattr(registry_mod.MetadataRegistry, "from_directory", classmethod(counting))
+    first = metadata.load_metadata(metadata_dir)
+    assert metadata.load_metadata(metadata_dir) is first
+    assert len(calls) == 1
+
+    # A new process only has the on-disk cache
+    registry_mod._loaded.clear()
+    assert metadata.load_metadata(metadata_dir).person(1).name == "Ada"
+    assert len(calls) == 1
+    assert (metadata_dir / ".cache" / "registry.pkl").exists()
+
+    path = metadata_dir / "people.csv"
+    path.write_text(PEOPLE.replace("Ada", "Ann"))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert metadata.load_metadata(metadata_dir).person(1).name == "Ann"
+    assert len(calls) == 2
+
+
+def test_failed_cache_write_leaves_no_temp_file(metadata_dir, monkeypatch):
+    def unpicklable(*args, **kwargs):
+        raise pickle.PicklingError("cannot pickle")
+
+    monkeypatch.setattr(registry_mod.pickle, "dump", unpicklable)
+    with pytest.raises(pickle.PicklingError):
+        metadata.load_metadata(metadata_dir)
+    assert list((metadata_dir / ".cache").iterdir()) == []
+
+
+def test_cli_metadata_check(metadata_dir, capsys):
+    cli = load_project_module("pkg.cli", "cli", "__init__.py")
+    assert cli.main(["metadata", "check", "--dir", str(metadata_dir)]) == 0
+    assert "2 people, 2 projects, 3 deliverables, 0 problem(s)" in capsys.readouterr().out
+    (metadata_dir / "deliverables.csv").write_text(DELIVERABLES + "4,9,Orphan,,,,,,\n")
+    assert cli.main(["metadata", "check", "--dir", str(metadata_dir), "--no-cache"]) == 1
+    assert "project_id 9" in capsys.readouterr().err
+
+
+def test_template_metadata_is_consistent():
+    # The shipped CSVs still contain template placeholders, which are plain text here
+    directory = core.get_project_root() / "metadata"
+    registry = metadata.load_metadata(directory, use_cache=False)
+    assert registry.deliverables_with_owners(1)[0][1].id == 1
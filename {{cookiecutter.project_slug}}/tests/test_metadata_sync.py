@@ -0,0 +1,129 @@
+"""Tests for the incremental metadata sync."""
+
+import sys
+import types
+
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+pytestmark = pytest.mark.skipif(not is_installed("sqlalchemy"), reason="sqlalchemy not installed")
+
+if is_installed("sqlalchemy"):
+    core = load_project_module("pkg.core", "core", "__init__.py")
+    config_mod = load_project_module("pkg.config", "config", "__init__.py")
+    session_mod = load_project_module("pkg.db.session", "db", "session.py")
+    bulk_mod = load_project_module("pkg.db.bulk", "db", "bulk.py")
+    metadata = load_project_module("pkg.metadata", "metadata", "__init__.py")
+    sync_mod = load_project_module("pkg.metadata.sync", "metadata", "sync.py")
+    sys.modules.setdefault("pkg", types.ModuleType("pkg"))
+
+PEOPLE = "id,name,email,affiliation,orcid,role,github,notes\n1,Ada,,,,,,\n2,Bob,,,,,,\n"
+PROJECTS = "id,title,description,start_date,end_date,status,lead_id,github_url,notes\n1,Alpha,,2024-01-01,,,1,,\n"
+DELIVERABLES = "id,project_id,title,description,due_date,status,priority,owner_id,notes\n" + "".join(
+    f"{i},1,D{i},,,,,2,\n" for i in range(1, 6)
+)
+
+
+@pytest.fixture(autouse=True)
+def _own_modules(monkeypatch):
+    """Re-register the registry module so the on-disk cache can pickle it."""
+    monkeypatch.setitem(sys.modules, "pkg.metadata", metadata)
+    monkeypatch.setitem(sys.modules, "pkg.metadata.registry", metadata.registry)
+
+
+@pytest.fixture
+def metadata_dir(tmp_path):
+    directory = tmp_path / "metadata"
+    directory.mkdir()
+    (directory / "people.csv").write_text(PEOPLE)
+    (directory / "projects.csv").write_text(PROJECTS)
+    (directory / "deliverables.csv").write_text(DELIVERABLES)
+    return directory
+
+
+@pytest.fixture
+def engine(tmp_path):
+    from sqlalchemy import create_engine
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'metadata.db'}")
+    yield engine
+    engine.dispose()
+
+
+def sync(engine, directory, **kwargs):
+    from sqlalchemy.orm import Session
+
+    registry = metadata.load_metadata(directory, use_cache=False)
+    with Session(engine) as db, db.begin():
+        return sync_mod.sync_metadata(db, registry, **kwargs)
+
+
+def count(changes, action):
+    return {table: counts[action] for table, counts in changes.items()}
+
+
+def test_first_sync_inserts_and_second_is_a_no_op(metadata_dir, engine):
+    from sqlalchemy import select
+
+    changes = sync(engine, metadata_dir)
+    assert count(changes, "inserted") == {"people": 2, "projects": 1, "deliverables": 5}
+    assert count(sync(engine, metadata_dir), "unchanged") == {"people": 2, "projects": 1, "deliverables": 5}
+
+    table = sync_mod.TABLES["projects"]
+    with engine.connect() as connection:
+        row = connection.execute(select(table)).one()
+    assert (row.title, row.lead_id, row.start_date.isoformat(), row.end_date) == ("Alpha", 1, "2024-01-01", None)
+    assert row.row_hash == sync_mod.row_hash(metadata.load_metadata(metadata_dir, use_cache=False).project(1))
+
+
+def test_only_changed_rows_are_written_in_batches(metadata_dir, engine):
+    from sqlalchemy import event, select
+
+    sync(engine, metadata_dir)
+    (metadata_dir / "people.csv").write_text(PEOPLE.replace("Bob", "Rob") + "3,Cy,,,,,,\n")
+    lines = DELIVERABLES.splitlines(keepends=True)
+    (metadata_dir / "deliverables.csv").write_text("".join(lines[:2] + lines[4:]).replace("D4", "D4b"))
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        # Ignore the PRAGMAs SQLite uses to look up tables
+        if statement.split()[0] != "PRAGMA":
+            statements.append(statement.split()[0])
+
+    event.listen(engine, "before_cursor_execute", record)
+    preview = sync(engine, metadata_dir, dry_run=True)
+    assert statements == ["SELECT"] * 3
+    statements.clear()
+    changes = sync(engine, metadata_dir, batch_size=1)
+    assert changes == preview
+    assert changes["people"] == {"inserted": 1, "updated": 1, "deleted": 0, "unchanged": 1}
+    assert changes["deliverables"] == {"inserted": 0, "updated": 1, "deleted": 2, "unchanged": 2}
+    # One key scan per table, then one statement per row or id (batch_size=1)
+    assert statements == ["SELECT"] * 3 + ["INSERT", "UPDATE", "UPDATE", "DELETE", "DELETE"]
+
+    deliverables = sync_mod.TABLES["deliverables"]
+    with engine.connect() as connection:
+        titles = connection.execute(select(deliverables.c.title).order_by(deliverables.c.id)).scalars().all()
+    assert titles == ["D1", "D4b", "D5"]
+
+
+def test_invalid_metadata_is_never_synced(metadata_dir, engine):
+    (metadata_dir / "deliverables.csv").write_text(DELIVERABLES + "6,9,Orphan,,,,,,\n")
+    with pytest.raises(metadata.MetadataError):
+        sync(engine, metadata_dir)
+
+
+def test_cli_metadata_sync(metadata_dir, tmp_path, capsys):
+    cli = load_project_module("pkg.cli", "cli", "__init__.py")
+    url = f"sqlite:///{tmp_path / 'cli.db'}"
+    args = ["metadata", "sync", "--dir", str(metadata_dir), "--url", url]
+    assert cli.main(args + ["--dry-run"]) == 0
+    assert "deliverables: 5 inserted, 0 updated, 0 deleted, 0 unchanged (dry run)" in capsys.readouterr().out
+    assert cli.main(args) == 0
+    assert cli.main(args) == 0
+    assert "people: 0 inserted, 0 updated, 0 deleted, 2 unchanged" in capsys.readouterr().out
+    (metadata_dir / "projects.csv").write_text(PROJECTS + "2,Beta,,,,,7,,\n")
+    assert cli.main(args) == 1
+    assert "Not syncing" in capsys.readouterr().err
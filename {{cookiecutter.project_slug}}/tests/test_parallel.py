@@ -0,0 +1,198 @@
+"""Tests for the parallel executor."""
+
+import multiprocessing
+import random
+import subprocess
+import sys
+import textwrap
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+from .conftest import is_installed, load_project_module
+
+core = load_project_module("pkg.core", "core", "__init__.py")
+seed_mod = load_project_module("pkg.utils.seed_manager", "utils", "seed_manager.py")
+parallel = core.parallel
+# Process pools pickle the task function by reference, which imports its top-level package
+sys.modules.setdefault("pkg", types.ModuleType("pkg"))
+
+# JAX warns on every fork once another test has imported it; workers never touch JAX
+pytestmark = [
+    pytest.mark.filterwarnings("ignore:os.fork:RuntimeWarning"),
+    pytest.mark.filterwarnings("ignore::pytest.PytestUnraisableExceptionWarning"),
+]
+
+
+@pytest.fixture(autouse=True)
+def _own_modules(monkeypatch):
+    """Re-register this module's ``pkg.core`` in case a later test module reloaded it."""
+    monkeypatch.setitem(sys.modules, "pkg.core", core)
+    monkeypatch.setitem(sys.modules, "pkg.core.parallel", parallel)
+    monkeypatch.setitem(sys.modules, "pkg.utils.seed_manager", seed_mod)
+
+
+requires_numpy = pytest.mark.skipif(not is_installed("numpy"), reason="numpy not installed")
+
+FORK = multiprocessing.get_context("fork")
+
+
+def square(value):
+    return value * value
+
+
+def worker_seed(_):
+    time.sleep(0.01)
+    return seed_mod.get_seed_manager().seed
+
+
+def draw(_):
+    return seed_mod.get_seed_manager().python_rng.random()
+
+
+def global_draws(_):
+    import numpy as np
+
+    return seed_mod.get_seed_manager().seed, random.random(), float(np.random.random())
+
+
+def fail_on_three(value):
+    if value == 3:
+        raise RuntimeError("boom")
+    return value
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_map_preserves_order_across_chunks(backend):
+    with parallel.ParallelExecutor(3, backend, seed=1, mp_context=FORK) as executor:
+        assert list(executor.map(square, range(20), chunk_size=3)) == [i * i for i in range(20)]
+
+
+def test_unordered_map_yields_every_result():
+    with parallel.ParallelExecutor(4, "thread", seed=1) as executor:
+        results = list(executor.map(square, range(50), chunk_size=4, ordered=False))
+    assert sorted(results) == [i * i for i in range(50)]
+
+
+def test_inline_execution_without_workers():
+    executor = parallel.ParallelExecutor(0, seed=1)
+    assert list(executor.map(square, iter(range(5)), chunk_size=2)) == [0, 1, 4, 9, 16]
+    assert executor._pool is None
+
+
+def test_input_is_read_with_bounded_look_ahead():
+    pulled = []
+
+    def items():
+        for i in range(1000):
+            pulled.append(i)
+            yield i
+
+    def slow(value):
+        time.sleep(0.001)
+        return value
+
+    with parallel.ParallelExecutor(2, "thread", seed=1, max_pending=3) as executor:
+        results = executor.map(slow, items(), chunk_size=5)
+        assert next(results) == 0
+        assert len(pulled) <= (3 + 1) * 5
+        assert list(results) == list(range(1, 1000))
+
+
+def test_map_batches_uses_configured_batch_size():
+    config = core.Config({"core": {"num_workers": 2}, "data": {"batch_size": 4}})
+    with parallel.ParallelExecutor.from_config(config, backend="thread", seed=1) as executor:
+        assert executor.num_workers == 2
+        assert list(executor.map_batches(len, range(10))) == [4, 4, 2]
+
+
+def test_map_batches_requires_batch_size():
+    with pytest.raises(ValueError, match="batch_size"):
+        list(parallel.ParallelExecutor(1, seed=1).map_batches(len, range(3)))
+
+
+def test_worker_errors_propagate_and_cancel_pending():
+    with parallel.ParallelExecutor(2, "thread", seed=1) as executor:
+        with pytest.raises(RuntimeError, match="boom"):
+            list(executor.map(fail_on_three, range(100)))
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError, match="backend"):
+        parallel.ParallelExecutor(2, "gpu")
+
+
+@requires_numpy
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_each_worker_gets_a_child_stream(backend):
+    manager = seed_mod.SeedManager(99)
+    with parallel.ParallelExecutor(3, backend, seed=manager, libraries=["python"], mp_context=FORK) as executor:
+        seeds = set(executor.map(worker_seed, range(12)))
+    assert seeds and seeds <= {manager.spawn_seed(i) for i in range(3)}
+
+
+@requires_numpy
+def test_thread_workers_do_not_leak_scope_to_caller():
+    manager = seed_mod.SeedManager(5)
+    before = seed_mod.get_seed_manager()
+    with parallel.ParallelExecutor(2, "thread", seed=manager) as executor:
+        list(executor.map(worker_seed, range(4)))
+    assert seed_mod.get_seed_manager() is before
+
+
+@requires_numpy
+def test_seed_per_chunk_is_independent_of_scheduling():
+    runs = []
+    for workers, backend in [(0, "thread"), (4, "thread"), (2, "process")]:
+        with parallel.ParallelExecutor(workers, backend, seed=7, mp_context=FORK) as executor:
+            runs.append(list(executor.map(draw, range(24), chunk_size=3, ordered=False, seed_per_chunk=True)))
+    assert sorted(runs[0]) == sorted(runs[1]) == sorted(runs[2])
+    assert len(set(runs[0])) == 24
+
+
+@requires_numpy
+def test_inline_worker_is_seeded_like_a_process_worker():
+    from concurrent.futures import ProcessPoolExecutor
+
+    libraries = ["python", "numpy"]
+    manager = seed_mod.SeedManager(11)
+    with ProcessPoolExecutor(1, mp_context=FORK, **manager.executor_kwargs(libraries)) as pool:
+        expected = list(pool.map(global_draws, range(6)))
+    random.seed(0)
+    with parallel.ParallelExecutor(0, seed=11, libraries=libraries) as executor:
+        assert list(executor.map(global_draws, range(3))) == expected[:3]
+        # Later calls continue the worker's stream, as with a long-lived pool
+        assert list(executor.map(global_draws, range(3), chunk_size=2)) == expected[3:]
+    assert expected[0][0] == manager.spawn_seed(0)
+
+
+def test_default_seeding_never_imports_frameworks():
+    # Run in a fresh interpreter: other tests import the frameworks here
+    script = textwrap.dedent(
+        f"""
+        import multiprocessing
+        import sys
+        sys.path.insert(0, {str(Path(__file__).resolve().parents[1])!r})
+        from tests.conftest import load_project_module
+
+        load_project_module("pkg", "__init__.py")
+        core = load_project_module("pkg.core", "core", "__init__.py")
+        load_project_module("pkg.utils.seed_manager", "utils", "seed_manager.py")
+        FRAMEWORKS = ("torch", "tensorflow", "jax")
+        for name in FRAMEWORKS:  # drop the stand-ins load_project_module installs
+            sys.modules.pop(name, None)
+
+        def loaded(_):
+            return [name for name in FRAMEWORKS if name in sys.modules]
+
+        fork = multiprocessing.get_context("fork")
+        with core.ParallelExecutor(1, seed=3) as executor:
+            print(sum(executor.map(loaded, range(2)), []), loaded(None))
+        with core.ParallelExecutor(2, "process", seed=3, mp_context=fork) as executor:
+            print(sum(executor.map(loaded, range(4)), []), loaded(None))
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines() == ["[] []", "[] []"]
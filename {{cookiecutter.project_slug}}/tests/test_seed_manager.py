@@ -1,4 +1,12 @@
-from .conftest import load_project_module
+import asyncio
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from .conftest import is_installed, load_project_module
 
 seed_mod = load_project_module("seed_manager_module", "utils", "seed_manager.py")
 
@@ -19,3 +27,153 @@ def test_seed_manager_seed_everything():
     state = manager.get_state()
     assert set(state["libraries"].keys()) == expected_keys
     assert all(state["libraries"].values())
+
+
+@pytest.mark.skipif(not is_installed("numpy"), reason="numpy not installed")
+class TestChildStreams:
+    def test_spawn_seed_matches_seed_sequence(self):
+        import numpy as np
+
+        manager = seed_mod.SeedManager(2024)
+        children = np.random.SeedSequence(2024).spawn(4)
+        expected = [int(child.generate_state(1)[0]) for child in children]
+        assert [manager.spawn_seed(i) for i in range(4)] == expected
+
+    def test_spawn_is_reproducible_and_independent(self):
+        manager = seed_mod.SeedManager(99)
+        seeds = [manager.spawn(i).seed for i in range(8)]
+        assert len(set(seeds)) == 8
+        assert seeds == [seed_mod.SeedManager(99).spawn(i).seed for i in range(8)]
+
+    def test_negative_index_rejected(self):
+        with pytest.raises(ValueError):
+            seed_mod.SeedManager(1).spawn_seed(-1)
+
+    def test_worker_init_fn_seeds_worker_stream(self):
+        manager = seed_mod.SeedManager(5)
+        manager.seed_everything(["python"])
+        manager.worker_init_fn(3)
+        first = random.random()
+        random.seed(manager.spawn_seed(3))
+        assert random.random() == first
+
+    # Fork keeps the test-loaded modules importable in workers; JAX, if
+    # imported by another test, warns about forking a threaded process.
+    @pytest.mark.filterwarnings("ignore:os.fork:RuntimeWarning")
+    def test_executor_kwargs_give_each_worker_its_own_stream(self):
+        manager = seed_mod.SeedManager(77)
+        manager.seed_everything(["python"])
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(
+            max_workers=3, mp_context=context, **manager.executor_kwargs()
+        ) as pool:
+            states = set(pool.map(_worker_random_state, range(6)))
+        expected = set()
+        for index in range(3):
+            random.seed(manager.spawn_seed(index))
+            expected.add(random.getstate())
+        assert states and states <= expected
+
+
+def _worker_random_state(_: int) -> tuple:
+    time.sleep(0.05)
+    return random.getstate()
+
+
+@pytest.mark.skipif(not is_installed("numpy"), reason="numpy not installed")
+class TestCheckpointState:
+    def test_state_round_trip_resumes_streams(self):
+        import numpy as np
+
+        manager = seed_mod.SeedManager(31)
+        manager.seed_everything(["python", "numpy"])
+        random.random()
+        np.random.random(5)
+        checkpoint = manager.state_bytes()
+        expected = (random.random(), np.random.random(3).tolist())
+
+        random.seed(0)
+        np.random.seed(0)
+        restored = seed_mod.SeedManager(0)
+        restored.set_state(checkpoint)
+        assert restored.seed == 31
+        assert restored.libraries["numpy"] is True
+        assert (random.random(), np.random.random(3).tolist()) == expected
+
+    def test_state_dict_round_trip(self):
+        manager = seed_mod.SeedManager(8)
+        manager.seed_everything(["python"])
+        state = manager.get_state()
+        assert set(state["rng_states"]) == {"python"}
+        first = random.random()
+        manager.set_state(state)
+        assert random.random() == first
+
+    def test_state_restores_manager_generators(self):
+        manager = seed_mod.SeedManager(12)
+        manager.python_rng.random()
+        manager.numpy_rng.random(4)
+        checkpoint = manager.state_bytes()
+        expected = (manager.python_rng.random(), manager.numpy_rng.random(3).tolist())
+
+        restored = seed_mod.SeedManager(0)
+        restored.set_state(checkpoint)
+        assert (restored.python_rng.random(), restored.numpy_rng.random(3).tolist()) == expected
+
+    def test_state_bytes_are_compact(self):
+        manager = seed_mod.SeedManager(3)
+        manager.seed_everything(["python", "numpy"])
+        assert len(manager.state_bytes()) < 8 * 1024
+
+
+class TestScope:
+    def test_scope_binds_and_restores_manager(self):
+        seed_mod.set_global_seed(10)
+        with seed_mod.seed_manager.scope(20) as outer:
+            assert seed_mod.get_seed_manager() is outer
+            assert seed_mod.get_global_seed() == 20
+            with outer.scope(30):
+                assert seed_mod.get_global_seed() == 30
+            assert seed_mod.get_seed_manager() is outer
+        assert seed_mod.get_global_seed() == 10
+
+    def test_scope_does_not_touch_global_random(self):
+        random.seed(1)
+        expected = random.random()
+        random.seed(1)
+        with seed_mod.seed_manager.scope(99) as scoped:
+            scoped.python_rng.random()
+        assert random.random() == expected
+
+    def test_threads_get_independent_reproducible_scopes(self):
+        def draw(seed: int) -> list:
+            with seed_mod.seed_manager.scope(seed):
+                rng = seed_mod.get_seed_manager().python_rng
+                values = []
+                for _ in range(50):
+                    values.append(rng.random())
+                    time.sleep(0)
+                return values
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(draw, [1, 2, 1, 2]))
+        assert results[0] == results[2] == draw(1)
+        assert results[1] == results[3] != results[0]
+
+    def test_asyncio_tasks_keep_their_own_scope(self):
+        async def task(seed: int) -> int:
+            with seed_mod.seed_manager.scope(seed):
+                await asyncio.sleep(0)
+                return seed_mod.get_global_seed()
+
+        async def main() -> list:
+            return await asyncio.gather(*(task(seed) for seed in range(5)))
+
+        assert asyncio.run(main()) == list(range(5))
+
+    @pytest.mark.skipif(not is_installed("numpy"), reason="numpy not installed")
+    def test_numpy_rng_is_reproducible(self):
+        with seed_mod.seed_manager.scope(5) as scoped:
+            first = scoped.numpy_rng.random(3).tolist()
+        with seed_mod.seed_manager.scope(5) as scoped:
+            assert scoped.numpy_rng.random(3).tolist() == first
@@ -1,9 +1,198 @@
-from .conftest import load_project_module
+import os
+
+import pytest
+
+from .conftest import is_installed, load_project_module
 
 # Load required modules with package context so relative imports succeed
-load_project_module("pkg.config", "config", "__init__.py")
+config_mod = load_project_module("pkg.config", "config", "__init__.py")
 session_mod = load_project_module("pkg.db.session", "db", "session.py")
 
+requires_sqlalchemy = pytest.mark.skipif(
+    not is_installed("sqlalchemy"), reason="sqlalchemy not installed"
+)
+
+
 def test_sessionlocal_import():
     assert hasattr(session_mod, "SessionLocal")
 
+
+def test_import_does_not_create_engine():
+    assert session_mod._engine is None
+
+
+@pytest.fixture
+def sqlite_settings(tmp_path, monkeypatch):
+    settings = session_mod.get_settings()
+    monkeypatch.setattr(settings, "DATABASE_URI", f"sqlite:///{tmp_path / 'app.db'}")
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 3)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 1)
+    session_mod.dispose_engine()
+    yield settings
+    session_mod.dispose_engine()
+
+
+@requires_sqlalchemy
+def test_engine_is_lazy_and_uses_pool_settings(sqlite_settings):
+    assert session_mod.get_pool_metrics() == {}
+    engine = session_mod.get_engine()
+    assert session_mod.get_engine() is engine
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 1
+
+
+@requires_sqlalchemy
+def test_missing_database_uri_is_reported(sqlite_settings, monkeypatch):
+    monkeypatch.setattr(sqlite_settings, "DATABASE_URI", None)
+    with pytest.raises(RuntimeError, match="DATABASE_URI"):
+        session_mod.get_engine()
+
+
+@requires_sqlalchemy
+def test_pool_metrics_track_checkouts(sqlite_settings):
+    from sqlalchemy import text
+
+    sessions = [session_mod.SessionLocal() for _ in range(2)]
+    for session in sessions:
+        session.execute(text("select 1"))
+    metrics = session_mod.get_pool_metrics()
+    assert metrics["checked_out"] == 2
+    assert metrics["size"] == 3
+    assert metrics["overflow"] == 0
+    assert metrics["checkouts"] >= 2
+    assert metrics["wait_time_max"] >= 0.0
+    for session in sessions:
+        session.close()
+    assert session_mod.get_pool_metrics()["checked_out"] == 0
+
+
+@requires_sqlalchemy
+def test_get_db_yields_bound_session(sqlite_settings):
+    generator = session_mod.get_db()
+    session = next(generator)
+    assert session.get_bind() is session_mod.get_engine()
+    generator.close()
+
+
+@requires_sqlalchemy
+@pytest.mark.filterwarnings("ignore:os.fork:RuntimeWarning")
+def test_engine_recreated_after_fork(sqlite_settings):
+    parent_engine = session_mod.get_engine()
+    pid = os.fork()
+    if pid == 0:
+        inherited = session_mod._engine
+        child_engine = session_mod.get_engine()
+        os._exit(0 if child_engine is not inherited else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+    assert session_mod.get_engine() is parent_engine
+
+
+@pytest.fixture
+def replicated(tmp_path, monkeypatch, sqlite_settings):
+    """Primary plus two replica SQLite files, each tagged with its role."""
+    from sqlalchemy import create_engine, text
+
+    names = ["primary", "replica0", "replica1"]
+    uris = [f"sqlite:///{tmp_path / f'{name}.db'}" for name in names]
+    for name, uri in zip(names, uris):
+        engine = create_engine(uri)
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE role (name TEXT)"))
+            connection.execute(text("INSERT INTO role VALUES (:name)"), {"name": name})
+            connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        engine.dispose()
+    monkeypatch.setattr(sqlite_settings, "DATABASE_URI", uris[0])
+    monkeypatch.setattr(sqlite_settings, "DATABASE_REPLICA_URIS", uris[1:])
+    monkeypatch.setattr(sqlite_settings, "DB_REPLICA_STRATEGY", "round_robin")
+    return sqlite_settings
+
+
+def _role(session):
+    from sqlalchemy import text
+
+    return session.execute(text("SELECT name FROM role")).scalar()
+
+
+@requires_sqlalchemy
+def test_replica_settings_accept_comma_separated_string():
+    settings = config_mod.Settings(DATABASE_REPLICA_URIS="sqlite:///a.db, sqlite:///b.db")
+    assert settings.DATABASE_REPLICA_URIS == ["sqlite:///a.db", "sqlite:///b.db"]
+
+
+@requires_sqlalchemy
+def test_without_replicas_reads_use_primary(sqlite_settings):
+    with session_mod.session_scope(read_only=True) as db:
+        assert db.get_bind() is session_mod.get_engine()
+    assert "replicas" not in session_mod.get_pool_metrics()
+
+
+@requires_sqlalchemy
+def test_read_only_sessions_round_robin_over_replicas(replicated):
+    roles = []
+    for _ in range(4):
+        generator = session_mod.get_read_db()
+        db = next(generator)
+        roles.append(_role(db))
+        assert _role(db) == roles[-1]  # a session sticks to its replica
+        generator.close()
+    assert sorted(roles) == ["replica0", "replica0", "replica1", "replica1"]
+    assert roles[0] != roles[1]
+    assert len(session_mod.get_pool_metrics()["replicas"]) == 2
+
+
+@requires_sqlalchemy
+def test_writes_go_to_primary(replicated):
+    from sqlalchemy import column, insert, table, text
+
+    items = table("items", column("id"))
+    with session_mod.session_scope(read_only=True) as db:
+        assert _role(db).startswith("replica")
+        db.execute(insert(items).values(id=1))
+    with session_mod.session_scope() as db:
+        assert _role(db) == "primary"
+        assert db.execute(text("SELECT count(*) FROM items")).scalar() == 1
+
+
+@requires_sqlalchemy
+def test_least_connections_prefers_idle_replica(replicated, monkeypatch):
+    monkeypatch.setattr(replicated, "DB_REPLICA_STRATEGY", "least_connections")
+    busy = session_mod.SessionLocal(read_only=True)
+    busy_role = _role(busy)  # keeps a connection checked out
+    for _ in range(3):
+        with session_mod.session_scope(read_only=True) as db:
+            assert _role(db) != busy_role
+    busy.close()
+
+
+@requires_sqlalchemy
+def test_unknown_strategy_is_rejected(replicated, monkeypatch):
+    monkeypatch.setattr(replicated, "DB_REPLICA_STRATEGY", "random")
+    with pytest.raises(ValueError):
+        session_mod.get_read_engine()
+
+
+@requires_sqlalchemy
+def test_session_scope_reuses_enclosing_session(replicated):
+    with session_mod.session_scope() as outer:
+        with session_mod.session_scope(read_only=True) as inner:
+            assert inner is outer
+        with session_mod.session_scope(read_only=True) as reader:
+            with session_mod.session_scope() as writer:
+                assert writer is reader
+    with session_mod.session_scope(read_only=True) as reader:
+        with session_mod.session_scope() as writer:
+            assert writer is not reader
+            assert not writer.read_only
+
+
+@requires_sqlalchemy
+def test_session_scope_rolls_back_on_error(replicated):
+    from sqlalchemy import text
+
+    with pytest.raises(RuntimeError):
+        with session_mod.session_scope() as db:
+            db.execute(text("INSERT INTO items (id) VALUES (7)"))
+            raise RuntimeError("boom")
+    with session_mod.session_scope() as db:
+        assert db.execute(text("SELECT count(*) FROM items")).scalar() == 0